@@ -0,0 +1,191 @@
+"""사용자별 학습 분석 (/api/analytics/me)
+
+퀴즈 점수 기록과 일일 집중 시간 집계를 열 단위 NumPy 배열로 읽어 정답률 추이,
+이동 평균, 퀴즈 유형별 향상도, 집중 시간과 정답률의 상관관계를 벡터 연산으로 계산합니다.
+결과는 워커 메모리에 보관하고, 사용자의 퀴즈/집중 기록이 바뀌면(개수·최대 id·
+FocusStats.updated_at 확인) 다시 계산합니다.
+
+NumPy가 없으면 available()이 False를 반환하고 API는 503을 돌려줍니다.
+"""
+import threading
+from collections import OrderedDict
+from datetime import date
+
+import lazy_numpy
+import metrics
+from extensions import db
+
+ROLLING_WINDOWS = (5, 20)
+ROLLING_POINTS = 30       # 이동 평균은 최근 30회만 반환
+WEEKS_SHOWN = 26
+IMPROVE_WINDOW = 10       # 처음/최근 각 10회 평균 비교
+MIN_CORRELATION_WEEKS = 3
+CACHE_SIZE = 256
+
+_cache = OrderedDict()    # user_id -> (기록 스탬프, 결과)
+_lock = threading.Lock()
+np = None                 # available()에서 가져옴 (lazy_numpy)
+
+
+def available():
+    global np
+    np = lazy_numpy.load('학습 분석')
+    return np is not None
+
+
+def _stamp(user_id):
+    """사용자 기록이 바뀌었는지 확인하는 값 (인덱스/기본키 조회)"""
+    from models import FocusStats, QuizScore
+    count, last_id = db.session.query(db.func.count(QuizScore.id), db.func.max(QuizScore.id)).filter(
+        QuizScore.user_id == user_id).one()
+    focus_updated = db.session.query(FocusStats.updated_at).filter(FocusStats.user_id == user_id).scalar()
+    return count, last_id, focus_updated
+
+
+def _load(user_id):
+    """퀴즈/집중 기록을 열 배열로 읽기"""
+    from models import FocusDaily, QuizScore
+    rows = db.session.query(QuizScore.quiz_type, QuizScore.score, QuizScore.total_questions,
+                            QuizScore.quiz_date).filter(
+        QuizScore.user_id == user_id,
+        QuizScore.quiz_date.isnot(None),
+        QuizScore.total_questions > 0
+    ).order_by(QuizScore.quiz_date).all()
+    types, scores, totals, dates = zip(*rows) if rows else ((), (), (), ())
+    focus = db.session.query(FocusDaily.day, FocusDaily.minutes).filter(FocusDaily.user_id == user_id).all()
+    days, minutes = zip(*focus) if focus else ((), ())
+    return {
+        'types': np.array(types, dtype=str),
+        'scores': np.array(scores, dtype=np.float64),
+        'totals': np.array(totals, dtype=np.float64),
+        'days': np.array(dates, dtype='datetime64[D]'),
+        'focus_days': np.array(days, dtype='datetime64[D]'),
+        'focus_minutes': np.array(minutes, dtype=np.float64),
+    }
+
+
+def _week_numbers(days):
+    """월요일 기준 주 번호 (1970-01-01은 목요일)"""
+    return (days.astype(np.int64) + 3) // 7
+
+
+def _week_start(week):
+    return (np.datetime64(int(week) * 7 - 3, 'D')).astype(date).isoformat()
+
+
+def _rolling(values, window):
+    if len(values) < window:
+        return np.array([])
+    sums = np.cumsum(np.insert(values, 0, 0.0))
+    return (sums[window:] - sums[:-window]) / window
+
+
+def _slope(x, y):
+    """최소제곱 기울기 (점이 2개 미만이거나 x가 모두 같으면 None)"""
+    if len(x) < 2 or np.ptp(x) == 0:
+        return None
+    return float(np.polyfit(x, y, 1)[0])
+
+
+def _round(value, digits=4):
+    return None if value is None else round(float(value), digits)
+
+
+def compute(data):
+    scores, totals, days = data['scores'], data['totals'], data['days']
+    accuracy = np.clip(scores / totals, 0, 1)
+
+    # 주별 정답률 (맞힌 문제 수 합 / 문항 수 합)
+    weeks, week_index = np.unique(_week_numbers(days), return_inverse=True)
+    week_scores = np.bincount(week_index, weights=np.clip(scores, 0, totals), minlength=len(weeks))
+    week_totals = np.bincount(week_index, weights=totals, minlength=len(weeks))
+    week_counts = np.bincount(week_index, minlength=len(weeks))
+    week_accuracy = week_scores / np.maximum(week_totals, 1)
+
+    focus_weeks, focus_index = np.unique(_week_numbers(data['focus_days']), return_inverse=True)
+    focus_minutes = np.bincount(focus_index, weights=data['focus_minutes'], minlength=len(focus_weeks))
+
+    all_weeks = np.union1d(weeks, focus_weeks)[-WEEKS_SHOWN:]
+    quiz_pos, has_quiz = np.searchsorted(weeks, all_weeks), np.isin(all_weeks, weeks)
+    focus_pos, has_focus = np.searchsorted(focus_weeks, all_weeks), np.isin(all_weeks, focus_weeks)
+    weekly = [{
+        'week': _week_start(week),
+        'accuracy': _round(week_accuracy[quiz_pos[i]]) if has_quiz[i] else None,
+        'quizzes': int(week_counts[quiz_pos[i]]) if has_quiz[i] else 0,
+        'focus_minutes': int(focus_minutes[focus_pos[i]]) if has_focus[i] else 0
+    } for i, week in enumerate(all_weeks)]
+
+    # 이동 평균 (퀴즈 회차 기준)
+    recent_days = days[-ROLLING_POINTS:]
+    rolling = {'dates': [str(d) for d in recent_days]}
+    for window in ROLLING_WINDOWS:
+        values = _rolling(accuracy, window)[-ROLLING_POINTS:]
+        padded = [None] * (len(recent_days) - len(values)) + [_round(v) for v in values]
+        rolling[f'avg_{window}'] = padded
+
+    # 퀴즈 유형별 향상도
+    by_type = {}
+    types, type_index = np.unique(data['types'], return_inverse=True)
+    for code, quiz_type in enumerate(types):
+        mask = type_index == code
+        values = accuracy[mask]
+        window = min(IMPROVE_WINDOW, len(values) // 2)
+        first = values[:window].mean() if window else None
+        recent = values[-window:].mean() if window else None
+        by_type[str(quiz_type)] = {
+            'quizzes': int(mask.sum()),
+            'accuracy': _round(np.clip(scores[mask], 0, totals[mask]).sum() / totals[mask].sum()),
+            'best': _round(values.max()),
+            'first_average': _round(first),
+            'recent_average': _round(recent),
+            'improvement': _round(recent - first) if window else None,
+            'weekly_change': _round(_slope(_week_numbers(days[mask]).astype(np.float64), values))
+        }
+
+    # 집중 시간과 정답률 상관관계 (둘 다 기록이 있는 주)
+    shared, quiz_at, focus_at = np.intersect1d(weeks, focus_weeks, return_indices=True)
+    correlation = None
+    if len(shared) >= MIN_CORRELATION_WEEKS:
+        x, y = focus_minutes[focus_at], week_accuracy[quiz_at]
+        if np.ptp(x) > 0 and np.ptp(y) > 0:
+            correlation = float(np.corrcoef(x, y)[0, 1])
+
+    return {
+        'summary': {
+            'quizzes': int(len(scores)),
+            'questions': int(totals.sum()),
+            'accuracy': _round(week_scores.sum() / totals.sum()) if len(totals) else None,
+            'focus_minutes': int(data['focus_minutes'].sum()),
+            'focus_days': int(len(data['focus_days']))
+        },
+        'trend': {
+            'weeks': int(len(weeks)),
+            'weekly_change': _round(_slope(weeks.astype(np.float64), week_accuracy))
+        },
+        'weekly': weekly,
+        'rolling': rolling,
+        'by_type': by_type,
+        'focus_correlation': {
+            'weeks_compared': int(len(shared)),
+            'correlation': _round(correlation)
+        }
+    }
+
+
+def user_analytics(user_id):
+    """사용자 분석 결과 (기록이 바뀌지 않았으면 캐시 사용)"""
+    stamp = _stamp(user_id)
+    with _lock:
+        cached = _cache.get(user_id)
+        if cached and cached[0] == stamp:
+            _cache.move_to_end(user_id)
+            metrics.cache_result('analytics', True)
+            return cached[1]
+    metrics.cache_result('analytics', False)
+    result = compute(_load(user_id))
+    with _lock:
+        _cache[user_id] = (stamp, result)
+        _cache.move_to_end(user_id)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
@@ -0,0 +1,57 @@
+"""대상(회원/비회원)별 공지사항 캐시
+
+공개 여부와 만료 조건은 SQL에서 걸러내고, 결과는 대상별로 메모리에 보관합니다.
+캐시는 가장 이른 expires_at이 지나거나 관리자가 공지사항을 수정해
+'announcements' 데이터 버전이 바뀌면 다시 계산됩니다.
+"""
+import threading
+from collections import namedtuple
+from datetime import datetime
+
+import data_version
+import metrics
+
+VERSION_NAME = 'announcements'
+
+AnnouncementView = namedtuple(
+    'AnnouncementView', 'id title content visibility priority created_at updated_at expires_at')
+
+_cache = {}   # is_member -> (data version, valid_until, [AnnouncementView])
+_lock = threading.Lock()
+
+
+def _load(is_member, now):
+    from models import Announcement
+    rows = Announcement.visible_query(is_member, now).all()
+    views = [
+        AnnouncementView(a.id, a.title, a.content, a.visibility, a.priority,
+                         a.created_at, a.updated_at, a.expires_at)
+        for a in rows
+    ]
+    expiries = [a.expires_at for a in rows if a.expires_at]
+    return views, min(expiries) if expiries else None
+
+
+def visible_announcements(user):
+    """사용자에게 보이는 공지사항 목록 (캐시 사용)"""
+    is_member = bool(user and user.is_authenticated)
+    now = datetime.now()
+    version = data_version.get(VERSION_NAME)
+
+    cached = _cache.get(is_member)
+    if cached and cached[0] == version and (cached[1] is None or now < cached[1]):
+        metrics.cache_result('announcements', True)
+        return cached[2]
+
+    metrics.cache_result('announcements', False)
+    views, valid_until = _load(is_member, now)
+    with _lock:
+        _cache[is_member] = (version, valid_until, views)
+    return views
+
+
+def invalidate():
+    """공지사항이 바뀐 뒤 호출 (모든 워커의 캐시 무효화)"""
+    with _lock:
+        _cache.clear()
+    data_version.bump(VERSION_NAME)
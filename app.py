@@ -1,74 +1,116 @@
 import os
 import logging
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_from_directory
-from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime
-import secrets
-from forms import RegistrationForm, LoginForm, PDFRequestForm, AnnouncementForm
-from models import User, PDFRequest, PDFResource, KoreanVocabulary, VocabularyWord, QuizScore, Notification, Announcement
-from sqlalchemy import func
-from flask_migrate import Migrate
-from functools import wraps
+import click
+from flask import Flask, render_template, send_from_directory
 from werkzeug.middleware.proxy_fix import ProxyFix
-from extensions import db  # Import db from extensions.py
-from flask_wtf import CSRFProtect
-
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
-
-# Create the app
-app = Flask(__name__)
-app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key")
-app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
-
-# CSRF 보호 활성화
-csrf = CSRFProtect(app)
-
-# Configure the database
-db_path = os.path.join(os.path.dirname(__file__), 'studyhub.db')
-app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
-app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
-    "pool_recycle": 300,
-    "pool_pre_ping": True,
-}
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-
-# File upload configuration
-app.config['UPLOAD_FOLDER'] = 'uploads'
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-
-# Initialize extensions
-db.init_app(app)
-migrate = Migrate(app, db)
-
-login_manager = LoginManager(app)
-login_manager.login_view = 'login'
-login_manager.login_message_category = 'info'
-login_manager.login_message = '로그인이 필요합니다.'
+from flask_login import current_user
+from extensions import db, csrf, login_manager
+from db_profiles import configure_database, init_engine
+import pdf_search
+import data_version
+import page_cache
+import assets
+import sync
+import seed
+import query_guard
+import metrics
+import views
+from last_seen import tracker as last_seen_tracker
+from user_cache import user_cache
+
+# Configure logging (DEBUG는 LOG_LEVEL=DEBUG로 켬)
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+
+def create_app(config=None):
+    """앱 생성 (main.py, flask CLI, gunicorn이 호출)
+
+    import할 때는 아무것도 만들지 않습니다. 초기 데이터는 여기서 만들지 않고
+    seed.initialize_once()로 한 번만 실행합니다 (gunicorn.conf.py, flask init-data).
+    """
+    app = Flask(__name__)
+    app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key")
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
+
+    # Configure the database (DATABASE_URL이 없으면 로컬 SQLite 사용)
+    db_path = os.path.join(os.path.dirname(__file__), 'studyhub.db')
+    configure_database(app, default_url=f"sqlite:///{db_path}")
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    # File upload configuration
+    app.config['UPLOAD_FOLDER'] = 'uploads'
+    app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+
+    # PDF 요청 일일 할당량 (날짜 경계는 PDF_REQUEST_TIMEZONE 기준)
+    app.config['PDF_REQUEST_DAILY_LIMIT'] = int(os.environ.get('PDF_REQUEST_DAILY_LIMIT', 1))
+    app.config['PDF_REQUEST_TIMEZONE'] = os.environ.get('PDF_REQUEST_TIMEZONE', 'Asia/Seoul')
+
+    if config:
+        app.config.update(config)
+
+    # Ensure upload directory exists
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+
+    # Initialize extensions
+    db.init_app(app)
+    init_engine(app, db)
+    # CSRF 보호 활성화
+    csrf.init_app(app)
+    # 요청 시간은 다른 before_request보다 먼저 재기 시작
+    metrics.init_app(app)
+    # Flask-Migrate(alembic)는 flask CLI(flask db ...)에서만 쓰므로 웹 워커에서는 가져오지 않음
+    if click.get_current_context(silent=True) is not None:
+        from flask_migrate import Migrate
+        Migrate(app, db)
+    data_version.init_app(app)
+    page_cache.init_app(app)
+    assets.init_app(app)
+    sync.init_app(app)
+    seed.init_app(app)
+    pdf_search.init_app(app)
+    last_seen_tracker.init_app(app)
+    user_cache.init_app(app)
+    query_guard.init_app(app, db)
+
+    login_manager.init_app(app)
+    login_manager.login_view = 'auth.login'
+    login_manager.login_message_category = 'info'
+    login_manager.login_message = '로그인이 필요합니다.'
+
+    views.init_app(app)
+    app.add_url_rule('/favicon.ico', 'favicon', favicon)
+    app.register_error_handler(Exception, handle_exception)
+    app.before_request(touch_last_seen)
+    app.after_request(flush_last_seen)
+    return app
+
 
 @login_manager.user_loader
 def load_user(user_id):
-    from models import User
-    return User.query.get(int(user_id))
+    # DB 조회 없이 캐시된 사용자 레코드 사용 (변경 시 user_cache.invalidate 호출)
+    return user_cache.get(int(user_id))
+
 
-@app.errorhandler(Exception)
 def handle_exception(e):
     import traceback
     logging.error("Unhandled Exception: %s\n%s", e, traceback.format_exc())
     return render_template("error.html", message="서버 오류가 발생했습니다. 관리자에게 문의하세요."), 500
 
-@app.route('/favicon.ico')
+
 def favicon():
     try:
-        return send_from_directory(os.path.join(app.root_path, 'static'),
+        return send_from_directory(os.path.join(os.path.dirname(__file__), 'static'),
                                    'favicon.ico', mimetype='image/vnd.microsoft.icon')
     except:
         return "", 204  # No content
 
 
-with app.app_context():
-    # Make sure to import the models here or their tables won't be created
-    import models  # noqa: F401
-    logging.info("Database tables created")
-    logging.info("Database tables created")
+# Update user last seen (메모리에 기록 후 일정 간격으로 일괄 저장)
+def touch_last_seen():
+    if current_user.is_authenticated:
+        last_seen_tracker.touch(current_user.id)
+
+
+def flush_last_seen(response):
+    last_seen_tracker.maybe_flush()
+    return response
@@ -0,0 +1,149 @@
+"""ASGI 실행 모드 (선택): 사전 검색을 이벤트 루프에서 기다림
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5000 --workers 4
+
+WSGI(gunicorn)에서는 사전 검색 요청이 다음 사전 응답을 기다리는 동안 워커 스레드 하나를
+통째로 잡습니다. 이 모드에서는 /api/dictionary/<word>와 /auto-add-word의 외부 검색을
+httpx.AsyncClient로 먼저 기다린 뒤(스레드를 잡지 않음), 받은 뜻을 dictionary.use_prefetched()에
+넣은 채 Flask 뷰를 실행합니다 (브리지 스레드에는 일회용 토큰 헤더로 전달). 뷰는 미리 받은
+뜻을 쓰므로 로그인·CSRF·ETag·DB 처리는 WSGI와 똑같습니다. 나머지 라우트는 a2wsgi
+브리지(스레드 풀)로 그대로 실행됩니다.
+
+- 미리 검색하는 것은 로그인된 세션이고 기본 매핑에 없는 단어일 때만입니다 (ETag 재검증
+  요청, 자동 추가가 꺼진 세션은 제외). 조건이 맞지 않으면 뷰가 평소처럼 처리합니다.
+- 의존성: a2wsgi, httpx, uvicorn. 초기 데이터는 시작 전에 flask init-data로 만들고,
+  이전 실행의 캐시/지표 파일은 flask clear-runtime으로 비웁니다 (워커마다 비우지 않음).
+
+환경 변수: WSGI_THREADS(브리지 스레드 수, 기본 10), DICTIONARY_MAX_CONNECTIONS(기본 100)
+"""
+import json
+import os
+import secrets
+
+import httpx
+from a2wsgi import WSGIMiddleware
+from werkzeug.wrappers import Request
+
+import dictionary
+from app import create_app
+
+DICTIONARY_PREFIX = '/api/dictionary/'
+AUTO_ADD_PATH = '/auto-add-word'
+WSGI_THREADS = int(os.environ.get('WSGI_THREADS', 10))
+MAX_CONNECTIONS = int(os.environ.get('DICTIONARY_MAX_CONNECTIONS', 100))
+# 미리 받은 뜻을 브리지 스레드로 넘기는 일회용 토큰 헤더 (클라이언트가 보낸 값은 지움)
+PREFETCH_HEADER = b'x-dictionary-prefetch'
+PREFETCH_ENVIRON = 'HTTP_X_DICTIONARY_PREFETCH'
+
+flask_app = create_app()
+_client = None
+_pending = {}
+
+
+def _with_prefetched(wsgi_app):
+    """브리지 스레드 안에서 토큰에 해당하는 뜻을 use_prefetched()로 넣고 뷰 실행
+
+    a2wsgi가 실행기 스레드로 contextvars를 넘겨주는지에 기대지 않도록 environ으로 전달합니다.
+    """
+    def wrapped(environ, start_response):
+        results = _pending.pop(environ.pop(PREFETCH_ENVIRON, None), None)
+        if results is None:
+            return wsgi_app(environ, start_response)
+        with dictionary.use_prefetched(results):
+            return wsgi_app(environ, start_response)
+    return wrapped
+
+
+bridge = WSGIMiddleware(_with_prefetched(flask_app), workers=WSGI_THREADS)
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(limits=httpx.Limits(max_connections=MAX_CONNECTIONS))
+    return _client
+
+
+def _session(scope):
+    """쿠키의 Flask 세션 (서명 검증만, DB 접근 없음)"""
+    headers = {name.decode('latin1'): value.decode('latin1') for name, value in scope['headers']}
+    request = Request({'HTTP_COOKIE': headers.get('cookie', '')})
+    return flask_app.session_interface.open_session(flask_app, request) or {}, headers
+
+
+async def _read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+def _replay(body):
+    """이미 읽은 본문을 브리지에 다시 넘겨주는 receive"""
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {'type': 'http.disconnect'}
+        sent = True
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+    return receive
+
+
+async def _lookup_word(scope, receive):
+    """(미리 검색할 단어 또는 None, 브리지에 넘길 receive)"""
+    path, method = scope['path'], scope['method']
+    if method == 'GET' and path.startswith(DICTIONARY_PREFIX):
+        word = path[len(DICTIONARY_PREFIX):]
+        session, headers = _session(scope)
+        if '/' in word or 'if-none-match' in headers:
+            return None, receive
+    elif method == 'POST' and path == AUTO_ADD_PATH:
+        body = await _read_body(receive)
+        receive = _replay(body)
+        session, _ = _session(scope)
+        if not session.get('auto_add_enabled', False):
+            return None, receive
+        try:
+            word = json.loads(body).get('word', '').lower()
+        except (ValueError, AttributeError):
+            return None, receive
+    else:
+        return None, receive
+
+    if not word or '_user_id' not in session or dictionary.mapped_meaning(word):
+        return None, receive
+    return word, receive
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                _get_client()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if _client is not None:
+                    await _client.aclose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    if scope['type'] == 'http':
+        headers = [(name, value) for name, value in scope['headers'] if name != PREFETCH_HEADER]
+        scope = dict(scope, headers=headers)
+        word, receive = await _lookup_word(scope, receive)
+        if word:
+            meaning = await dictionary.search_daum_dictionary_async(_get_client(), word)
+            token = secrets.token_hex(16)
+            _pending[token] = {word: meaning}
+            scope['headers'] = headers + [(PREFETCH_HEADER, token.encode('latin1'))]
+            try:
+                return await bridge(scope, receive, send)
+            finally:
+                _pending.pop(token, None)
+
+    return await bridge(scope, receive, send)
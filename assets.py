@@ -0,0 +1,149 @@
+"""정적 파일 빌드 (최소화, 내용 해시, 미리 압축)
+
+`flask build-assets`는 ASSETS의 CSS/JS를 최소화하고 내용 해시를 붙여 static/dist/에
+씁니다. 같은 자리에 .gz/.br 파일과 manifest.json(원래 경로 -> 해시 경로, 버전)도 만듭니다.
+
+- 템플릿은 asset_url('css/style.css')로 주소를 얻습니다. 매니페스트가 없으면(빌드 전
+  개발 환경) 원래 static 주소를 돌려줍니다.
+- /assets/<경로>는 Accept-Encoding에 맞는 .br/.gz 파일을 그대로 보냅니다. 파일 이름에
+  해시가 있으므로 1년 immutable 캐시를 붙입니다.
+- 서비스 워커는 /sw.js로 제공합니다. 캐시 이름과 미리 받을 파일 목록은 매니페스트로
+  채우므로, 배포로 파일이 바뀔 때만 클라이언트 캐시가 교체됩니다.
+
+rjsmin/rcssmin/brotli는 선택 의존성입니다. 없으면 최소화 없이 해시만 붙이고 .br은 만들지 않습니다.
+빌드 후에는 서버를 다시 시작해야 새 매니페스트를 읽습니다.
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+
+import click
+from flask import current_app, request, send_from_directory, url_for
+from werkzeug.security import safe_join
+
+try:
+    import rcssmin
+except ImportError:  # pragma: no cover - 선택 의존성
+    rcssmin = None
+try:
+    import rjsmin
+except ImportError:  # pragma: no cover - 선택 의존성
+    rjsmin = None
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+ASSETS = ('css/style.css', 'css/mobile.css', 'js/main.js')
+DIST = 'dist'
+MANIFEST = 'manifest.json'
+SERVICE_WORKER = 'sw.js'
+HASH_LENGTH = 12
+ONE_YEAR = 365 * 24 * 3600
+IMMUTABLE = f'public, max-age={ONE_YEAR}, immutable'
+
+_manifest = {'version': 'dev', 'files': {}}
+_service_worker = None   # (sw.js 수정 시각, 생성한 소스)
+
+
+def init_app(app):
+    global _manifest
+    path = os.path.join(app.static_folder, DIST, MANIFEST)
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            _manifest = json.load(f)
+    app.jinja_env.globals['asset_url'] = asset_url
+
+    @app.cli.command('build-assets')
+    def build_assets_command():
+        """정적 파일 최소화·해시·미리 압축 (static/dist/)"""
+        manifest = build(app.static_folder)
+        for name, hashed in manifest['files'].items():
+            click.echo(f"{name} -> {DIST}/{hashed}")
+        click.echo(f"버전: {manifest['version']}")
+
+
+def minify(name, text):
+    if name.endswith('.css') and rcssmin:
+        return rcssmin.cssmin(text)
+    if name.endswith('.js') and rjsmin:
+        return rjsmin.jsmin(text)
+    return text
+
+
+def _write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    # mtime=0으로 빌드할 때마다 같은 .gz가 나오게 함
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+
+
+def build(static_folder):
+    """static/dist/를 새로 만들고 매니페스트 반환"""
+    dist = os.path.join(static_folder, DIST)
+    shutil.rmtree(dist, ignore_errors=True)
+    files = {}
+    for name in ASSETS:
+        with open(os.path.join(static_folder, name), encoding='utf-8') as f:
+            data = minify(name, f.read()).encode('utf-8')
+        root, ext = os.path.splitext(name)
+        hashed = f"{root}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+        os.makedirs(os.path.dirname(os.path.join(dist, hashed)), exist_ok=True)
+        _write(os.path.join(dist, hashed), data)
+        files[name] = hashed
+
+    version = hashlib.sha256(json.dumps(files, sort_keys=True).encode('utf-8')).hexdigest()[:HASH_LENGTH]
+    manifest = {'version': version, 'files': files}
+    with open(os.path.join(dist, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def asset_url(name):
+    """빌드된 파일 주소 (빌드 전이면 원래 static 주소)"""
+    hashed = _manifest['files'].get(name)
+    if hashed:
+        return url_for('main.assets_file', filename=hashed)
+    return url_for('static', filename=name)
+
+
+def send_asset(filename):
+    """해시가 붙은 빌드 파일 전송 (가능하면 미리 압축한 파일)"""
+    dist = os.path.join(current_app.static_folder, DIST)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    encoding = None
+    for candidate, suffix in (('br', '.br'), ('gzip', '.gz')):
+        path = safe_join(dist, filename + suffix)
+        if request.accept_encodings[candidate] and path and os.path.isfile(path):
+            encoding, filename = candidate, filename + suffix
+            break
+
+    response = send_from_directory(dist, filename, mimetype=mimetype, max_age=ONE_YEAR)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Cache-Control'] = IMMUTABLE
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def service_worker_source():
+    """매니페스트 버전과 파일 목록을 앞에 붙인 sw.js"""
+    global _service_worker
+    path = os.path.join(current_app.static_folder, SERVICE_WORKER)
+    mtime = os.stat(path).st_mtime_ns
+    if _service_worker and _service_worker[0] == mtime:
+        return _service_worker[1]
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    urls = [asset_url(name) for name in ASSETS]
+    header = (f"self.ASSET_VERSION = {json.dumps(_manifest['version'])};\n"
+              f"self.ASSET_URLS = {json.dumps(urls)};\n")
+    _service_worker = (mtime, header + source)
+    return _service_worker[1]
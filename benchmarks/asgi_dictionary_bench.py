@@ -0,0 +1,153 @@
+"""사전 검색 동시 처리량 벤치마크 (WSGI gunicorn vs ASGI uvicorn, 프로세스 1개)
+
+    python benchmarks/asgi_dictionary_bench.py [--requests 200] [--concurrency 100] [--delay 0.5] [--threads 4]
+
+응답을 --delay초 늦게 주는 로컬 다음 사전 스텁을 띄우고 (DICTIONARY_URL), 같은 앱을
+- wsgi: gunicorn 워커 1개 (--threads 스레드)
+- asgi: uvicorn 워커 1개 (asgi.py)
+로 실행해 로그인한 사용자로 /api/dictionary/<word>를 동시에 --concurrency개씩 요청합니다.
+"동시 처리"는 완료 수 * 지연 / 걸린 시간으로, 프로세스 하나가 동시에 붙잡고 기다린
+외부 검색 수입니다. WSGI는 스레드 수에서 막히고 ASGI는 동시 요청 수만큼 올라갑니다.
+
+gunicorn, uvicorn, httpx, a2wsgi가 필요합니다.
+"""
+import argparse
+import asyncio
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STUB_HTML = '<html><body><ul class="list_search"><li>[명사] 벤치마크 단어</li></ul></body></html>'.encode('utf-8')
+CSRF_RE = re.compile(r'name="csrf_token" type="hidden" value="([^"]+)"')
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_stub(delay):
+    """느린 다음 사전 스텁 (요청마다 delay초 뒤 응답)"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(STUB_HTML)))
+            self.end_headers()
+            self.wfile.write(STUB_HTML)
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer.request_queue_size = 1024
+    server = ThreadingHTTPServer(('127.0.0.1', free_port()), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def prepare_database(url):
+    os.environ['DATABASE_URL'] = url
+    from app import create_app
+    from extensions import db
+    import seed
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        seed.initialize_data()
+
+
+def start_server(mode, port, env, threads):
+    if mode == 'wsgi':
+        env = dict(env, WEB_CONCURRENCY='1', GUNICORN_THREADS=str(threads), BIND=f'127.0.0.1:{port}')
+        args = ['-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--access-logfile', '/dev/null', 'main:app']
+    else:
+        args = ['-m', 'uvicorn', 'asgi:app', '--port', str(port), '--workers', '1', '--log-level', 'warning']
+    proc = subprocess.Popen([sys.executable, *args], cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise SystemExit(f"{mode} 서버가 시작되지 않았습니다.")
+
+
+async def run_load(base, total, concurrency):
+    import httpx
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base, limits=limits, timeout=120) as client:
+        page = await client.get('/login')
+        token = CSRF_RE.search(page.text).group(1)
+        await client.post('/login', data={'username': 'admin', 'password': 'admin123', 'csrf_token': token})
+
+        gate = asyncio.Semaphore(concurrency)
+        latencies, errors = [], 0
+
+        async def one(i):
+            nonlocal errors
+            async with gate:
+                started = time.perf_counter()
+                response = await client.get(f'/api/dictionary/benchword{i}')
+                if response.status_code == 200:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        return time.perf_counter() - started, latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--delay', type=float, default=0.5, help='스텁 응답 지연 (초)')
+    parser.add_argument('--threads', type=int, default=4, help='WSGI 워커의 스레드 수')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='wackydocs-asgi-')
+    db_url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    prepare_database(db_url)
+    stub = start_stub(args.delay)
+    env = dict(os.environ, DATABASE_URL=db_url, PYTHONPATH=ROOT, LOG_LEVEL='WARNING',
+               DICTIONARY_MAX_CONNECTIONS=str(args.concurrency),
+               DICTIONARY_URL=f'http://127.0.0.1:{stub.server_port}/search?q={{word}}')
+
+    print(f"요청 {args.requests}개, 동시 {args.concurrency}, 외부 지연 {args.delay}s")
+    for mode in ('wsgi', 'asgi'):
+        port = free_port()
+        proc = start_server(mode, port, env, args.threads)
+        try:
+            elapsed, latencies, errors = asyncio.run(
+                run_load(f'http://127.0.0.1:{port}', args.requests, args.concurrency))
+        finally:
+            proc.terminate()
+            proc.wait()
+        held = len(latencies) * args.delay / elapsed
+        p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else 0
+        label = f"{mode} (스레드 {args.threads})" if mode == 'wsgi' else mode
+        print(f"{label:14} {elapsed:6.2f}s  {len(latencies) / elapsed:7.1f} req/s  "
+              f"p50 {statistics.median(latencies or [0]):5.2f}s  p95 {p95:5.2f}s  "
+              f"동시 처리 {held:6.1f}  오류 {errors}")
+    stub.shutdown()
+
+
+if __name__ == '__main__':
+    main()
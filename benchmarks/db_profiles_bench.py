@@ -0,0 +1,130 @@
+"""데이터베이스 프로필별 동시 읽기/쓰기 처리량 벤치마크
+
+    python benchmarks/db_profiles_bench.py [--threads 8] [--seconds 5] [--write-ratio 0.2]
+
+- sqlite-stock: 기존 설정 (rollback journal, 기본 PRAGMA)
+- sqlite-tuned: db_profiles.py의 SQLite 프로필 (WAL 등)
+- postgresql:   BENCH_DATABASE_URL 환경변수가 있을 때만 실행
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_profiles import engine_profile, install_sqlite_pragmas, normalize_url  # noqa: E402
+
+SEED_ROWS = 10000
+USERS = 500
+
+
+def make_engines(tmpdir):
+    engines = []
+
+    stock_url = f"sqlite:///{os.path.join(tmpdir, 'stock.db')}"
+    engines.append(('sqlite-stock', create_engine(stock_url, pool_recycle=300, pool_pre_ping=True)))
+
+    tuned_url = f"sqlite:///{os.path.join(tmpdir, 'tuned.db')}"
+    _, options = engine_profile(tuned_url)
+    tuned = create_engine(tuned_url, **options)
+    install_sqlite_pragmas(tuned)
+    engines.append(('sqlite-tuned', tuned))
+
+    pg_url = os.environ.get('BENCH_DATABASE_URL')
+    if pg_url:
+        pg_url = normalize_url(pg_url)
+        _, options = engine_profile(pg_url)
+        engines.append(('postgresql', create_engine(pg_url, **options)))
+
+    return engines
+
+
+def setup(engine):
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS bench_event"))
+        conn.execute(text(
+            "CREATE TABLE bench_event (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+            "value INTEGER NOT NULL, created_at VARCHAR(32) NOT NULL)"
+        ))
+        conn.execute(text("CREATE INDEX ix_bench_event_user ON bench_event (user_id)"))
+        conn.execute(
+            text("INSERT INTO bench_event (id, user_id, value, created_at) VALUES (:id, :u, :v, :t)"),
+            [{'id': i, 'u': i % USERS, 'v': i, 't': '2024-01-01'} for i in range(1, SEED_ROWS + 1)]
+        )
+
+
+def run(engine, threads, seconds, write_ratio):
+    stats = {'reads': 0, 'writes': 0, 'errors': 0, 'locked': 0}
+    lock = threading.Lock()
+    next_id = [SEED_ROWS + 1]
+    deadline = time.perf_counter() + seconds
+
+    def worker(seed):
+        rnd = random.Random(seed)
+        local = {'reads': 0, 'writes': 0, 'errors': 0, 'locked': 0}
+        while time.perf_counter() < deadline:
+            try:
+                if rnd.random() < write_ratio:
+                    with lock:
+                        row_id = next_id[0]
+                        next_id[0] += 1
+                    with engine.begin() as conn:
+                        conn.execute(
+                            text("INSERT INTO bench_event (id, user_id, value, created_at) "
+                                 "VALUES (:id, :u, :v, :t)"),
+                            {'id': row_id, 'u': rnd.randrange(USERS), 'v': row_id, 't': '2024-01-02'}
+                        )
+                    local['writes'] += 1
+                else:
+                    with engine.connect() as conn:
+                        conn.execute(
+                            text("SELECT count(*), sum(value) FROM bench_event WHERE user_id = :u"),
+                            {'u': rnd.randrange(USERS)}
+                        ).fetchone()
+                    local['reads'] += 1
+            except OperationalError as e:
+                local['errors'] += 1
+                if 'locked' in str(e).lower():
+                    local['locked'] += 1
+        with lock:
+            for key, value in local.items():
+                stats[key] += value
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    stats['elapsed'] = time.perf_counter() - started
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(f"threads={args.threads} seconds={args.seconds} write_ratio={args.write_ratio}")
+    print(f"{'profile':<14}{'reads/s':>10}{'writes/s':>10}{'errors':>8}{'locked':>8}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, engine in make_engines(tmpdir):
+            setup(engine)
+            stats = run(engine, args.threads, args.seconds, args.write_ratio)
+            elapsed = stats['elapsed']
+            print(f"{name:<14}{stats['reads'] / elapsed:>10.0f}{stats['writes'] / elapsed:>10.0f}"
+                  f"{stats['errors']:>8}{stats['locked']:>8}")
+            engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""워커 시작 시간 벤치마크 (python -X importtime)
+
+    python benchmarks/startup_bench.py [--runs 5] [--budget-ms 500] [--top 15]
+
+새 프로세스에서 `python -X importtime -c "import main"`을 여러 번 실행해 (워커가 앱을
+불러오는 것과 같음) main까지의 누적 import 시간 중앙값, 프로세스 전체 시간, 누적 시간이
+큰 모듈 상위 N개를 출력합니다. 첫 실행은 .pyc 생성을 위한 준비 실행으로 버립니다.
+
+다음 중 하나라도 해당하면 종료 코드 1 (회귀):
+- import 시간 중앙값이 --budget-ms(STARTUP_BUDGET_MS 환경변수)를 넘음
+- 처음 쓸 때 가져오기로 한 모듈(LAZY_MODULES)이 시작할 때 import됨
+- import 중에 데이터베이스 쿼리가 실행됨 (초기 데이터는 flask init-data로 생성)
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BUDGET_MS = 500   # 이전(지연 import·init-data 전) 약 640ms
+# 시작할 때 import되면 안 되는 무거운 모듈 (첫 사용 시 import)
+LAZY_MODULES = ('requests', 'bs4', 'numpy', 'alembic', 'flask_migrate')
+
+# 시작 중 실행된 SQL 수 (sqlalchemy를 먼저 import하므로 시간 측정과는 따로 실행)
+QUERY_PROBE = """
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+queries = []
+event.listen(Engine, 'before_cursor_execute', lambda *args: queries.append(args[2]))
+import main
+print(len(queries))
+"""
+
+
+def parse_importtime(stderr):
+    """(main 누적 us, {모듈: 누적 us})"""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cum, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        cumulative[name] = max(cumulative.get(name, 0), int(cum))
+    return cumulative.get('main', 0), cumulative
+
+
+def _run(args, env):
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True)
+    wall = (time.perf_counter() - started) * 1000
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"실행 실패 (종료 코드 {proc.returncode}): {' '.join(args)}")
+    return proc, wall
+
+
+def run_once(env):
+    """(main import ms, 프로세스 전체 ms, {모듈: 누적 us})"""
+    proc, wall = _run(['-X', 'importtime', '-c', 'import main'], env)
+    main_us, modules = parse_importtime(proc.stderr)
+    return main_us / 1000, wall, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float,
+                        default=float(os.environ.get('STARTUP_BUDGET_MS', DEFAULT_BUDGET_MS)))
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='wackydocs-startup-')
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'startup.db')}",
+               PYTHONPATH=ROOT)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    run_once(env)   # 준비 실행 (.pyc 생성)
+    results = [run_once(env) for _ in range(args.runs)]
+    import_ms = statistics.median(r[0] for r in results)
+    wall_ms = statistics.median(r[1] for r in results)
+    bare_ms = statistics.median(_run(['-c', 'pass'], env)[1] for _ in range(args.runs))
+    modules = results[-1][2]
+    queries = int(_run(['-c', QUERY_PROBE], env)[0].stdout.split()[-1])
+
+    print(f"import main: {import_ms:.0f}ms (중앙값, {args.runs}회), "
+          f"프로세스 전체: {wall_ms:.0f}ms (빈 인터프리터 {bare_ms:.0f}ms)")
+    print(f"상위 {args.top}개 모듈 (누적):")
+    top = sorted(((us, name) for name, us in modules.items() if name != 'main'), reverse=True)
+    for us, name in top[:args.top]:
+        print(f"  {us / 1000:8.1f}ms  {name}")
+
+    failures = []
+    if import_ms > args.budget_ms:
+        failures.append(f"import 시간 {import_ms:.0f}ms > 예산 {args.budget_ms:.0f}ms")
+    eager = [name for name in LAZY_MODULES if name in modules]
+    if eager:
+        failures.append(f"시작할 때 import됨: {', '.join(eager)}")
+    if queries:
+        failures.append(f"import 중 SQL {queries}개 실행")
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+    print(f"OK: 예산 {args.budget_ms:.0f}ms 이내, 무거운 모듈 지연 import, 시작 시 쿼리 없음")
+
+
+if __name__ == '__main__':
+    main()
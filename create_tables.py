@@ -1,5 +1,7 @@
+from app import create_app
+from extensions import db
 
-from app import app, db
+app = create_app()
 
 with app.app_context():
     db.create_all()
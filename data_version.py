@@ -0,0 +1,61 @@
+"""데이터 버전 카운터
+
+관리자가 데이터를 수정할 때 bump(name)으로 버전을 올리면, 그 데이터를 바탕으로 만든
+캐시(공지사항, 페이지 캐시 등)는 버전이 바뀐 것을 보고 다시 계산합니다.
+버전은 instance/data_versions/<name> 파일에 저장되어 같은 서버의 모든 워커가 공유하며,
+확인 비용은 stat 한 번입니다.
+"""
+import os
+import threading
+
+_directory = None
+_cache = {}   # name -> ((inode, mtime_ns), version)
+_lock = threading.Lock()
+
+
+def init_app(app):
+    global _directory
+    _directory = app.config.setdefault('DATA_VERSION_DIR', os.path.join(app.instance_path, 'data_versions'))
+    os.makedirs(_directory, exist_ok=True)
+
+
+def _path(name):
+    return os.path.join(_directory, name)
+
+
+def get(name):
+    """현재 버전 번호 (한 번도 올리지 않았으면 0)"""
+    if _directory is None:
+        return 0
+    try:
+        st = os.stat(_path(name))
+    except FileNotFoundError:
+        return 0
+    stamp = (st.st_ino, st.st_mtime_ns)
+    cached = _cache.get(name)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    try:
+        with open(_path(name), encoding='utf-8') as f:
+            version = int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        version = 0
+    _cache[name] = (stamp, version)
+    return version
+
+
+def bump(*names):
+    """버전 올리기 (데이터를 수정한 뒤 커밋 후에 호출)"""
+    if _directory is None:
+        return
+    with _lock:
+        for name in names:
+            tmp_path = f'{_path(name)}.{os.getpid()}.{threading.get_ident()}'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(str(get(name) + 1))
+            os.replace(tmp_path, _path(name))
+
+
+def stamp(*names):
+    """여러 데이터의 버전을 묶은 캐시 키용 문자열"""
+    return '-'.join(f'{name}.{get(name)}' for name in names)
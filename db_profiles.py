@@ -0,0 +1,118 @@
+"""데이터베이스 엔진 프로필
+
+DATABASE_URL 환경변수로 데이터베이스를 선택하고 (없으면 로컬 SQLite),
+데이터베이스 종류에 맞는 엔진 옵션을 적용합니다.
+
+- sqlite: WAL 모드, synchronous=NORMAL, busy_timeout, 큰 cache_size, mmap을 연결 시 설정
+  (동시 읽기/쓰기에서 "database is locked" 오류를 줄이기 위함)
+- postgresql: 커넥션 풀 크기/오버플로와 statement_timeout을 환경변수로 조정
+
+벤치마크: python benchmarks/db_profiles_bench.py
+"""
+import logging
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+
+def _env_int(env, name, default):
+    try:
+        return int(env.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def normalize_url(url):
+    # Heroku/Replit 스타일의 postgres:// 는 SQLAlchemy에서 지원하지 않음
+    if url.startswith('postgres://'):
+        url = 'postgresql://' + url[len('postgres://'):]
+    return url
+
+
+def sqlite_pragmas(env=os.environ):
+    """SQLite 연결마다 실행할 PRAGMA 목록"""
+    return [
+        ('journal_mode', 'WAL'),
+        ('synchronous', 'NORMAL'),
+        ('busy_timeout', _env_int(env, 'SQLITE_BUSY_TIMEOUT_MS', 5000)),
+        # 음수는 KiB 단위 (기본 64MB)
+        ('cache_size', -_env_int(env, 'SQLITE_CACHE_SIZE_KB', 64 * 1024)),
+        ('mmap_size', _env_int(env, 'SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        ('temp_store', 'MEMORY'),
+    ]
+
+
+def sqlite_profile(env=os.environ):
+    busy_timeout_ms = _env_int(env, 'SQLITE_BUSY_TIMEOUT_MS', 5000)
+    return {
+        'pool_pre_ping': True,
+        'connect_args': {
+            'timeout': busy_timeout_ms / 1000,
+            'check_same_thread': False,
+        },
+    }
+
+
+def postgresql_profile(env=os.environ):
+    statement_timeout_ms = _env_int(env, 'DB_STATEMENT_TIMEOUT_MS', 15000)
+    idle_timeout_ms = _env_int(env, 'DB_IDLE_IN_TRANSACTION_TIMEOUT_MS', 60000)
+    return {
+        'pool_size': _env_int(env, 'DB_POOL_SIZE', 10),
+        'max_overflow': _env_int(env, 'DB_MAX_OVERFLOW', 20),
+        'pool_timeout': _env_int(env, 'DB_POOL_TIMEOUT', 30),
+        'pool_recycle': _env_int(env, 'DB_POOL_RECYCLE', 300),
+        'pool_pre_ping': True,
+        'connect_args': {
+            'connect_timeout': _env_int(env, 'DB_CONNECT_TIMEOUT', 10),
+            'options': f'-c statement_timeout={statement_timeout_ms} '
+                       f'-c idle_in_transaction_session_timeout={idle_timeout_ms}',
+        },
+    }
+
+
+PROFILES = {
+    'sqlite': sqlite_profile,
+    'postgresql': postgresql_profile,
+}
+
+
+def engine_profile(url, env=os.environ):
+    """URL에 맞는 (프로필 이름, 엔진 옵션) 반환"""
+    backend = make_url(url).get_backend_name()
+    profile = PROFILES.get(backend)
+    if profile is None:
+        return backend, {'pool_recycle': 300, 'pool_pre_ping': True}
+    return backend, profile(env)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas():
+            cursor.execute(f'PRAGMA {name}={value}')
+    finally:
+        cursor.close()
+
+
+def install_sqlite_pragmas(engine):
+    """엔진의 새 연결마다 SQLite PRAGMA를 적용"""
+    if engine.dialect.name == 'sqlite' and not event.contains(engine, 'connect', _set_sqlite_pragmas):
+        event.listen(engine, 'connect', _set_sqlite_pragmas)
+
+
+def configure_database(app, default_url):
+    """앱 설정에 데이터베이스 URL과 엔진 옵션을 채움 (db.init_app 전에 호출)"""
+    url = normalize_url(os.environ.get('DATABASE_URL') or default_url)
+    name, options = engine_profile(url)
+    app.config['SQLALCHEMY_DATABASE_URI'] = url
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+    app.config['DATABASE_PROFILE'] = name
+    logging.info("Database profile: %s", name)
+    return name
+
+
+def init_engine(app, db):
+    """db.init_app 이후 엔진별 연결 설정 적용"""
+    with app.app_context():
+        install_sqlite_pragmas(db.engine)
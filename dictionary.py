@@ -0,0 +1,252 @@
+"""영어 단어 뜻 검색 (기본 매핑, 다음 사전)
+
+WSGI에서는 search_daum_dictionary()가 requests로 기다리고, ASGI 모드(asgi.py)에서는
+search_daum_dictionary_async()로 미리 검색한 뒤 use_prefetched() 안에서 뷰를 실행합니다.
+뷰는 어느 쪽이든 search_daum_dictionary()만 부르면 됩니다 (미리 받은 뜻이 있으면 그대로 반환).
+"""
+import asyncio
+import contextvars
+import os
+from contextlib import contextmanager
+
+import metrics
+
+# 사전 응답 형식이나 단어 매핑을 바꾸면 올려서 브라우저에 저장된 응답을 무효화
+DICTIONARY_REVISION = 1
+
+# 다음 사전 URL (벤치마크에서는 로컬 스텁 주소로 바꿈)
+DICTIONARY_URL = os.environ.get('DICTIONARY_URL', 'http://dic.daum.net/search.do?q={word}')
+TIMEOUT = 10
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# 기본 단어 매핑 (빠른 검색을 위해)
+WORD_MAPPINGS = {
+    'apple': '[명사] 사과', 'book': '[명사] 책', 'computer': '[명사] 컴퓨터', 
+    'water': '[명사] 물', 'love': '[동사] 사랑하다 | [명사] 사랑', 
+    'house': '[명사] 집, 가옥', 'school': '[명사] 학교', 'student': '[명사] 학생', 
+    'teacher': '[명사] 선생님, 교사', 'friend': '[명사] 친구', 'family': '[명사] 가족',
+    'food': '[명사] 음식, 식품', 'time': '[명사] 시간, 때', 'money': '[명사] 돈, 화폐',
+    'work': '[동사] 일하다 | [명사] 일, 작업', 'study': '[동사] 공부하다 | [명사] 연구',
+    'hello': '[감탄사] 안녕하세요', 'good': '[형용사] 좋은, 훌륭한', 
+    'bad': '[형용사] 나쁜, 안 좋은', 'big': '[형용사] 큰', 'small': '[형용사] 작은',
+    'beautiful': '[형용사] 아름다운, 예쁜', 'happy': '[형용사] 행복한, 기쁜',
+    'help': '[동사] 돕다 | [명사] 도움', 'get': '[동사] 얻다, 받다', 'go': '[동사] 가다',
+    'come': '[동사] 오다', 'see': '[동사] 보다', 'know': '[동사] 알다', 'think': '[동사] 생각하다',
+    'world': '[명사] 세계, 세상', 'hope': '[동사] 희망하다 | [명사] 희망',
+    'like': '[동사] 좋아하다 | [전치사] ~같은', 'make': '[동사] 만들다',
+    'huge': '[형용사] 거대한, 매우 큰', 'tiny': '[형용사] 아주 작은',
+    'amazing': '[형용사] 놀라운, 경이로운', 'wonderful': '[형용사] 훌륭한, 멋진',
+    'important': '[형용사] 중요한', 'different': '[형용사] 다른, 차이나는',
+    'difficult': '[형용사] 어려운, 힘든', 'easy': '[형용사] 쉬운, 간단한',
+    'possible': '[형용사] 가능한', 'impossible': '[형용사] 불가능한',
+    'remember': '[동사] 기억하다', 'forget': '[동사] 잊다', 'understand': '[동사] 이해하다',
+    'explain': '[동사] 설명하다', 'describe': '[동사] 묘사하다', 'create': '[동사] 창조하다',
+    'destroy': '[동사] 파괴하다', 'build': '[동사] 건설하다', 'break': '[동사] 부수다',
+    'repair': '[동사] 수리하다', 'change': '[동사] 바꾸다 | [명사] 변화',
+    'improve': '[동사] 개선하다', 'develop': '[동사] 개발하다', 'grow': '[동사] 자라다',
+    'increase': '[동사] 증가하다', 'decrease': '[동사] 감소하다', 'start': '[동사] 시작하다',
+    'finish': '[동사] 끝내다', 'continue': '[동사] 계속하다', 'stop': '[동사] 멈추다',
+    'move': '[동사] 움직이다', 'travel': '[동사] 여행하다', 'visit': '[동사] 방문하다',
+    'meet': '[동사] 만나다', 'leave': '[동사] 떠나다', 'arrive': '[동사] 도착하다',
+    'return': '[동사] 돌아오다', 'stay': '[동사] 머물다', 'live': '[동사] 살다',
+    'die': '[동사] 죽다', 'born': '[동사] 태어나다', 'grow': '[동사] 자라다',
+    'learn': '[동사] 배우다', 'teach': '[동사] 가르치다', 'practice': '[동사] 연습하다',
+    'try': '[동사] 시도하다', 'succeed': '[동사] 성공하다', 'fail': '[동사] 실패하다',
+    'win': '[동사] 이기다', 'lose': '[동사] 지다', 'play': '[동사] 놀다, 연주하다',
+    'watch': '[동사] 보다', 'listen': '[동사] 듣다', 'speak': '[동사] 말하다',
+    'talk': '[동사] 이야기하다', 'tell': '[동사] 말하다', 'ask': '[동사] 묻다',
+    'answer': '[동사] 대답하다 | [명사] 답', 'question': '[명사] 질문',
+    'problem': '[명사] 문제', 'solution': '[명사] 해결책', 'idea': '[명사] 아이디어',
+    'plan': '[명사] 계획 | [동사] 계획하다', 'decision': '[명사] 결정',
+    'choice': '[명사] 선택', 'option': '[명사] 선택권', 'opportunity': '[명사] 기회',
+    'chance': '[명사] 기회, 가능성', 'luck': '[명사] 운', 'success': '[명사] 성공',
+    'failure': '[명사] 실패', 'mistake': '[명사] 실수', 'error': '[명사] 오류',
+    'truth': '[명사] 진실', 'lie': '[명사] 거짓말 | [동사] 거짓말하다',
+    'fact': '[명사] 사실', 'information': '[명사] 정보', 'knowledge': '[명사] 지식',
+    'education': '[명사] 교육', 'experience': '[명사] 경험', 'skill': '[명사] 기술',
+    'ability': '[명사] 능력', 'talent': '[명사] 재능', 'gift': '[명사] 선물, 재능',
+    'strength': '[명사] 힘, 강점', 'weakness': '[명사] 약점', 'advantage': '[명사] 이점',
+    'disadvantage': '[명사] 단점', 'benefit': '[명사] 이익', 'profit': '[명사] 이익',
+    'loss': '[명사] 손실', 'cost': '[명사] 비용 | [동사] 비용이 들다',
+    'price': '[명사] 가격', 'value': '[명사] 가치', 'worth': '[명사] 가치',
+    'quality': '[명사] 품질', 'quantity': '[명사] 양', 'size': '[명사] 크기',
+    'weight': '[명사] 무게', 'height': '[명사] 높이', 'length': '[명사] 길이',
+    'width': '[명사] 너비', 'depth': '[명사] 깊이', 'distance': '[명사] 거리',
+    'speed': '[명사] 속도', 'direction': '[명사] 방향', 'location': '[명사] 위치',
+    'place': '[명사] 장소', 'position': '[명사] 위치', 'situation': '[명사] 상황',
+    'condition': '[명사] 상태, 조건', 'environment': '[명사] 환경', 'atmosphere': '[명사] 분위기',
+    'culture': '[명사] 문화', 'society': '[명사] 사회', 'community': '[명사] 공동체',
+    'group': '[명사] 그룹', 'team': '[명사] 팀', 'organization': '[명사] 조직',
+    'company': '[명사] 회사', 'business': '[명사] 사업', 'industry': '[명사] 산업',
+    'economy': '[명사] 경제', 'market': '[명사] 시장', 'customer': '[명사] 고객',
+    'service': '[명사] 서비스', 'product': '[명사] 제품', 'technology': '[명사] 기술',
+    'science': '[명사] 과학', 'research': '[명사] 연구', 'experiment': '[명사] 실험',
+    'method': '[명사] 방법', 'system': '[명사] 시스템', 'process': '[명사] 과정',
+    'result': '[명사] 결과', 'effect': '[명사] 효과', 'influence': '[명사] 영향',
+    'impact': '[명사] 영향, 충격', 'consequence': '[명사] 결과', 'outcome': '[명사] 결과'
+}
+
+# ASGI 모드에서 이벤트 루프가 미리 받아 둔 결과 (단어 -> 뜻 또는 None)
+_prefetched = contextvars.ContextVar('dictionary_prefetched', default=None)
+
+
+def _count_call(mode, status_code):
+    metrics.inc(metrics.DICTIONARY_CALLS, mode=mode, outcome='ok' if status_code == 200 else 'http_error')
+
+
+def mapped_meaning(word):
+    """기본 매핑에 있는 뜻 (없으면 None, 네트워크 없음)"""
+    return WORD_MAPPINGS.get(word.lower())
+
+
+@contextmanager
+def use_prefetched(results):
+    """이 블록에서 실행되는 search_daum_dictionary는 results의 뜻을 그대로 씀"""
+    token = _prefetched.set(results)
+    try:
+        yield
+    finally:
+        _prefetched.reset(token)
+
+
+def parse_meanings(html):
+    """다음 사전 검색 결과 HTML에서 한국어 뜻 추출 (없으면 None)"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # 다음 사전 결과에서 한국어 뜻 추출
+    korean_meanings = []
+
+    # 다음 사전의 클래스명들 시도
+    meaning_selectors = [
+        '.list_search',           # 기본 검색 결과
+        '.search_cleanword',      # 클린 검색 결과  
+        '.txt_search',            # 검색 텍스트
+        '.cleanword_type',        # 클린워드 타입
+        '.list_mean',             # 의미 리스트
+        '.txt_emph1',             #         강조 텍스트
+        '.search_result',         # 검색 결과
+        '.mean_list',             # 의미 목록
+        '.word_class',            # 단어 클래스
+        '.mean_item'              # 의미 항목
+    ]
+
+    for selector in meaning_selectors:
+        elements = soup.select(selector)
+        for elem in elements:
+            text = elem.get_text().strip()
+            # 한국어가 포함되고 적당한 길이인 텍스트 찾기
+            if text and any('\uac00' <= char <= '\ud7af' for char in text):
+                if 2 < len(text) < 150:
+                    # 불필요한 텍스트 제거
+                    skip_words = ['다음', '사전', '검색', '결과', '목록', '페이지', '로그인', '회원가입']
+                    if not any(skip in text for skip in skip_words):
+                        # 줄바꿈을 쉼표로 변경하고 정리
+                        cleaned_text = text.replace('\n', ', ').replace('\t', ' ')
+                        cleaned_text = ' '.join(cleaned_text.split())
+                        if cleaned_text and cleaned_text not in korean_meanings:
+                            korean_meanings.append(cleaned_text)
+
+    # 특정 태그에서 한국어 텍스트 검색 (fallback)
+    if not korean_meanings:
+        all_elements = soup.find_all(['span', 'div', 'li', 'p', 'dd', 'dt'])
+        for elem in all_elements:
+            text = elem.get_text().strip()
+            # 한국어가 포함되고 적당한 길이인 텍스트
+            if text and any('\uac00' <= char <= '\ud7af' for char in text):
+                if 3 < len(text) < 100:
+                    # 광고나 네비게이션 텍스트 제외
+                    skip_words = ['다음', '사전', '로그인', '회원가입', '메뉴', '검색', '광고', '배너']
+                    if not any(skip in text for skip in skip_words):
+                        cleaned_text = text.replace('\n', ' ').replace('\t', ' ')
+                        cleaned_text = ' '.join(cleaned_text.split())
+                        if cleaned_text and cleaned_text not in korean_meanings and len(cleaned_text) > 2:
+                            korean_meanings.append(cleaned_text)
+
+    if korean_meanings:
+        # 중복 제거 및 정리
+        unique_meanings = []
+        for meaning in korean_meanings[:8]:  # 상위 8개만 확인
+            if meaning not in unique_meanings and len(meaning) > 2:
+                # 너무 짧거나 의미없는 텍스트 제외
+                if not meaning.isdigit() and len(meaning.split()) > 1:
+                    unique_meanings.append(meaning)
+
+        if unique_meanings:
+            # 최대 3개 의미만 반환하되, 품사 정보가 있으면 우선
+            prioritized = []
+            others = []
+
+            for meaning in unique_meanings:
+                if '[' in meaning and ']' in meaning:
+                    prioritized.append(meaning)
+                else:
+                    others.append(meaning)
+
+            final_meanings = (prioritized + others)[:3]
+            return ' | '.join(final_meanings) if len(final_meanings) > 1 else final_meanings[0]
+
+    return None
+
+
+def search_daum_dictionary(word):
+    """다음 사전에서 영어 단어의 한국어 뜻을 검색합니다"""
+    try:
+        # 기본 매핑에서 먼저 확인
+        meaning = mapped_meaning(word)
+        if meaning:
+            return meaning
+
+        prefetched = _prefetched.get()
+        if prefetched is not None and word in prefetched:
+            return prefetched[word]
+
+        # requests/bs4는 사전 검색에서만 쓰므로 처음 호출할 때 가져옴 (워커 시작 시간 단축)
+        import requests
+
+        response = requests.get(DICTIONARY_URL.format(word=word), headers=HEADERS, timeout=TIMEOUT)
+        response.encoding = 'utf-8'
+        _count_call('sync', response.status_code)
+
+        if response.status_code == 200:
+            return parse_meanings(response.text)
+
+        return None
+
+    except Exception as e:
+        metrics.inc(metrics.DICTIONARY_CALLS, mode='sync', outcome='error')
+        print(f"Daum dictionary error: {str(e)}")
+        return None
+
+
+async def search_daum_dictionary_async(client, word):
+    """search_daum_dictionary의 async 버전 (client: httpx.AsyncClient)
+
+    기다리는 동안 스레드를 잡지 않고, HTML 파싱만 스레드에서 실행합니다.
+    """
+    try:
+        meaning = mapped_meaning(word)
+        if meaning:
+            return meaning
+
+        response = await client.get(DICTIONARY_URL.format(word=word), headers=HEADERS, timeout=TIMEOUT)
+        _count_call('async', response.status_code)
+        if response.status_code == 200:
+            response.encoding = 'utf-8'
+            return await asyncio.to_thread(parse_meanings, response.text)
+
+        return None
+
+    except Exception as e:
+        metrics.inc(metrics.DICTIONARY_CALLS, mode='async', outcome='error')
+        print(f"Daum dictionary error: {str(e)}")
+        return None
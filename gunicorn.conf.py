@@ -0,0 +1,40 @@
+"""gunicorn 설정 (머신의 모든 코어 사용)
+
+    gunicorn -c gunicorn.conf.py main:app
+
+- preload_app: 마스터가 앱을 한 번 불러온 뒤 워커를 포크합니다 (코드/메모리 공유, 빠른 시작).
+- when_ready: 포크 전에 마스터에서 초기 데이터를 한 번만 만들고 (seed.initialize_once),
+  이전 실행의 페이지 캐시와 지표 파일을 비웁니다 (seed.clear_runtime_files).
+  initialize_once는 DB 연결 풀을 닫고 끝나므로 워커가 마스터의 연결을 물려받지 않습니다.
+- post_fork: 혹시 마스터에 남은 연결이 있어도 워커에서는 새로 연결하도록 풀을 버립니다.
+
+환경 변수: BIND(기본 0.0.0.0:5000), WEB_CONCURRENCY(워커 수, 기본 코어 수 * 2 + 1),
+GUNICORN_THREADS(워커당 스레드, 기본 2), GUNICORN_TIMEOUT(초, 기본 60)
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 2))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+preload_app = True
+# 메모리 누수에 대비해 일정 요청 수마다 워커 교체 (동시에 교체되지 않도록 jitter)
+max_requests = 2000
+max_requests_jitter = 200
+accesslog = '-'
+
+
+def when_ready(server):
+    import seed
+    seed.initialize_once(server.app.wsgi())
+    seed.clear_runtime_files()
+
+
+def post_fork(server, worker):
+    from extensions import db
+    with server.app.wsgi().app_context():
+        # close=False: 마스터 소유의 연결은 닫지 않고 버리기만 함
+        db.engine.dispose(close=False)
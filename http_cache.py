@@ -0,0 +1,64 @@
+"""조건부 GET (ETag / Last-Modified) 지원
+
+@conditional_get(version=...)을 붙인 JSON API는 뷰를 실행하기 전에 version()으로
+싼 버전 값(데이터 버전, 기본키로 읽은 updated_at 등)을 구해 ETag를 만들고,
+클라이언트가 보낸 If-None-Match/If-Modified-Since와 같으면 조회·직렬화 없이 304를
+돌려줍니다. 200 응답에는 ETag, Last-Modified, Cache-Control을 붙입니다.
+
+브라우저(와 서비스 워커의 fetch)는 HTTP 캐시에 저장한 응답을 If-None-Match로 자동
+재검증하므로, 대시보드 폴링은 바뀐 것이 없으면 헤더만 주고받습니다.
+"""
+import hashlib
+from datetime import timezone
+from functools import wraps
+
+from flask import request, make_response
+from werkzeug.http import is_resource_modified
+
+import metrics
+import page_cache
+
+NO_CACHE = 'private, no-cache'   # 저장은 하되 쓸 때마다 재검증
+
+
+def _etag(version):
+    raw = repr((request.endpoint, sorted((request.view_args or {}).items()), page_cache.audience(), version))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _http_time(value):
+    """DB의 naive UTC datetime을 HTTP 날짜용 aware datetime으로 (초 단위)"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def conditional_get(version, last_modified=None, cache_control=NO_CACHE):
+    """version(): ETag를 만들 값 (뷰 인자를 그대로 받음)
+    last_modified(): 마지막 수정 시각 (UTC datetime 또는 None). 응답이 이 시각만으로
+    정해질 때만 지정 (If-None-Match 없이 If-Modified-Since만 보내는 클라이언트용)
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = _etag(version(*args, **kwargs))
+            modified = _http_time(last_modified(*args, **kwargs)) if last_modified else None
+
+            if not is_resource_modified(request.environ, etag=etag, last_modified=modified):
+                metrics.cache_result('http_etag', True)
+                response = make_response('', 304)
+            else:
+                metrics.cache_result('http_etag', False)
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if modified:
+                response.last_modified = modified
+            response.headers['Cache-Control'] = cache_control
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,157 @@
+"""오프라인 큐 일괄 전송 (퀴즈 답안, 집중 세션)
+
+휴대폰이 오프라인일 때 서비스 워커가 쌓아 둔 이벤트를 한 번의 요청으로 받아
+하나의 트랜잭션으로 저장합니다. 퀴즈 답안은 서버가 채점하며(quiz.grade), 같은 퀴즈에서
+이미 답한 문제는 키가 달라도 중복으로 처리합니다. 이벤트마다 클라이언트가 만든 멱등 키(key)와
+발생 시각(client_time)이 있고, 이미 받은 키는 건너뛰므로 같은 큐를 다시 보내도
+점수가 두 번 쌓이지 않습니다.
+
+- 응답의 accepted/duplicates/rejected에 든 키는 모두 처리가 끝난 것이므로 큐에서
+  지웁니다. 요청 자체가 실패(네트워크, 5xx)했을 때만 다시 보냅니다.
+- 멱등 키는 KEY_TTL 동안 보관하며, 그보다 오래된 이벤트는 중복 여부를 알 수 없으므로 거부합니다.
+- 미래 시각은 서버 시각으로 맞춥니다 (휴대폰 시계 오차).
+"""
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy.exc import IntegrityError
+
+import leaderboard
+from extensions import db
+
+QUIZ_ANSWER = 'quiz_answer'
+FOCUS_SESSION = 'focus_session'
+
+MAX_EVENTS = 200
+KEY_LENGTH = 64
+KEY_TTL = timedelta(days=30)
+MAX_FOCUS_MINUTES = 24 * 60
+FOCUS_DATE_SLACK = timedelta(days=1)   # 학생 기기의 현지 날짜가 서버(UTC)보다 하루 앞설 수 있음
+RETRIES = 2   # 같은 큐를 동시에 보내 키가 충돌하면 다시 시도 (두 번째는 중복으로 처리됨)
+
+
+def client_time(value, now):
+    """ISO 8601 클라이언트 시각 -> naive UTC (없으면 now, 미래면 now로 제한)"""
+    if not value:
+        return now
+    moment = datetime.fromisoformat(str(value))
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    if moment < now - KEY_TTL:
+        raise ValueError('너무 오래된 기록입니다.')
+    return min(moment, now)
+
+
+def _parse_answer(event, now):
+    quiz_id, index = event['quiz_id'], event['index']
+    choice = event.get('choice')
+    if not all(isinstance(value, int) for value in (quiz_id, index)) or not (choice is None or isinstance(choice, int)):
+        raise ValueError('답안이 올바르지 않습니다.')
+    return {'quiz_id': quiz_id, 'index': index, 'choice': choice}
+
+
+def _apply_answer(user_id, event):
+    """서버 채점 (quiz.grade). 그 퀴즈에서 이미 답한 문제면 False (중복)"""
+    import quiz
+    from models import QuizAttempt
+    attempt = QuizAttempt.query.filter_by(id=event['quiz_id'], user_id=user_id).first()
+    if attempt is None:
+        raise ValueError('퀴즈를 찾을 수 없습니다.')
+    # 온라인 요청이 이미 채점됐는데 응답만 못 받아 큐에 들어간 경우
+    if 0 <= event['index'] < len(attempt.responses) and attempt.responses[event['index']] is not None:
+        return False
+    quiz.grade(attempt, event['index'], event['choice'])
+    return True
+
+
+def check_focus(session_date, minutes, now):
+    """집중 세션 검증 (0 < 분 <= MAX_FOCUS_MINUTES, 날짜는 최근 KEY_TTL 안). 실패하면 ValueError"""
+    if not 0 < minutes <= MAX_FOCUS_MINUTES:
+        raise ValueError('집중 시간이 올바르지 않습니다.')
+    if not (now - KEY_TTL).date() <= session_date <= (now + FOCUS_DATE_SLACK).date():
+        raise ValueError('세션 날짜가 올바르지 않습니다.')
+
+
+def _parse_focus(event, now):
+    when = client_time(event.get('client_time'), now)
+    # 세션 날짜는 학생 기기의 현지 날짜 (없으면 발생 시각의 날짜)
+    session_date = date.fromisoformat(event['session_date']) if event.get('session_date') else when.date()
+    minutes = int(event.get('focus_minutes', 25))
+    check_focus(session_date, minutes, now)
+    return {'session_date': session_date, 'focus_minutes': minutes,
+            'completed': bool(event.get('completed', True)), 'when': when}
+
+
+def _apply_focus(user_id, event):
+    from models import FocusSession, FocusStats
+    focus_session = FocusSession(user_id=user_id, session_date=event['session_date'],
+                                 focus_minutes=event['focus_minutes'], completed=event['completed'])
+    focus_session.created_at = event['when']
+    db.session.add(focus_session)
+    if event['completed']:
+        FocusStats.record_session(user_id, event['session_date'], event['focus_minutes'])
+        leaderboard.record_focus(user_id, event['session_date'], event['focus_minutes'])
+
+
+HANDLERS = {
+    QUIZ_ANSWER: (_parse_answer, _apply_answer),
+    FOCUS_SESSION: (_parse_focus, _apply_focus),
+}
+
+
+def _ingest(user_id, kind, events):
+    from models import IngestKey
+    parse, apply = HANDLERS[kind]
+    now = datetime.utcnow()
+    result = {'accepted': [], 'duplicates': [], 'rejected': []}
+
+    valid = []
+    for event in events:
+        key = event.get('key') if isinstance(event, dict) else None
+        if not isinstance(key, str) or not key or len(key) > KEY_LENGTH:
+            result['rejected'].append({'key': key if isinstance(key, str) else None,
+                                       'message': '멱등 키가 올바르지 않습니다.'})
+            continue
+        try:
+            valid.append((key, parse(event, now)))
+        except KeyError as e:
+            result['rejected'].append({'key': key, 'message': f'{e.args[0]} 값이 필요합니다.'})
+        except (TypeError, ValueError) as e:
+            result['rejected'].append({'key': key, 'message': str(e)})
+
+    seen = set()
+    if valid:
+        seen.update(key for (key,) in db.session.query(IngestKey.key).filter(
+            IngestKey.user_id == user_id, IngestKey.key.in_([key for key, _ in valid])))
+
+    for key, event in valid:
+        if key in seen:
+            result['duplicates'].append(key)
+            continue
+        seen.add(key)
+        # apply는 검증을 마친 뒤에만 세션을 바꾸므로 ValueError면 그 이벤트만 거부
+        try:
+            applied = apply(user_id, event)
+        except ValueError as e:
+            result['rejected'].append({'key': key, 'message': str(e)})
+            continue
+        db.session.add(IngestKey(user_id=user_id, key=key, kind=kind))
+        # 같은 날짜/주의 집계 행을 다음 이벤트가 UPDATE로 찾도록 바로 flush
+        db.session.flush()
+        result['duplicates' if applied is False else 'accepted'].append(key)
+
+    IngestKey.query.filter(IngestKey.user_id == user_id,
+                           IngestKey.created_at < now - KEY_TTL).delete()
+    return result
+
+
+def ingest(user_id, kind, events):
+    """이벤트 목록을 한 트랜잭션으로 저장 (커밋까지 함)"""
+    for attempt in range(RETRIES):
+        try:
+            result = _ingest(user_id, kind, events)
+            db.session.commit()
+            return result
+        except IntegrityError:
+            db.session.rollback()
+            if attempt == RETRIES - 1:
+                raise
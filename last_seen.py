@@ -0,0 +1,99 @@
+"""사용자 마지막 접속 시각 기록
+
+매 요청마다 UPDATE + COMMIT을 하면 읽기 전용 페이지까지 SQLite 쓰기 잠금을 잡게 되므로,
+접속 시각은 메모리에만 모아 두었다가 일정 간격마다 한 번의 일괄 UPDATE로 기록합니다.
+같은 사용자는 LAST_SEEN_INTERVAL(초) 안에 두 번 이상 기록되지 않습니다.
+"""
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import bindparam, update
+
+from extensions import db
+
+
+class LastSeenTracker:
+    def __init__(self, interval=300, flush_interval=60):
+        self.interval = interval              # 사용자별 최소 기록 간격 (초)
+        self.flush_interval = flush_interval  # 일괄 기록 시도 간격 (초)
+        self._pending = {}                    # user_id -> 마지막 접속 시각 (아직 기록 전)
+        self._written = {}                    # user_id -> 마지막으로 기록한 monotonic 시각
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._app = None
+
+    def init_app(self, app):
+        self._app = app
+        self.interval = app.config.setdefault('LAST_SEEN_INTERVAL', self.interval)
+        self.flush_interval = app.config.setdefault('LAST_SEEN_FLUSH_INTERVAL', self.flush_interval)
+        atexit.register(self._flush_at_exit)
+
+    def touch(self, user_id, when=None):
+        """접속 시각을 메모리에 기록 (DB 접근 없음)"""
+        with self._lock:
+            self._pending[user_id] = when or datetime.utcnow()
+
+    def get(self, user_id):
+        """아직 기록되지 않은 최신 접속 시각 (없으면 None)"""
+        return self._pending.get(user_id)
+
+    def maybe_flush(self):
+        """flush_interval이 지났을 때만 flush 실행"""
+        if time.monotonic() - self._last_flush < self.flush_interval:
+            return 0
+        return self.flush()
+
+    def _take_due(self, force=False):
+        now = time.monotonic()
+        with self._lock:
+            self._last_flush = now
+            due = []
+            for user_id, seen in list(self._pending.items()):
+                if force or now - self._written.get(user_id, float('-inf')) >= self.interval:
+                    due.append({'uid': user_id, 'seen': seen})
+                    del self._pending[user_id]
+                    self._written[user_id] = now
+            # 간격이 지난 기록은 더 이상 필요 없으므로 정리
+            for user_id, written in list(self._written.items()):
+                if now - written >= self.interval and user_id not in self._pending:
+                    del self._written[user_id]
+            return due
+
+    def flush(self, force=False):
+        """기록 시점이 된 사용자들의 접속 시각을 한 번의 UPDATE로 저장"""
+        due = self._take_due(force)
+        if not due:
+            return 0
+
+        stmt = (
+            update(db.metadata.tables['user'])
+            .where(db.metadata.tables['user'].c.id == bindparam('uid'))
+            .values(last_seen=bindparam('seen'))
+        )
+        try:
+            # 요청 세션과 분리된 별도 트랜잭션에서 executemany로 기록
+            with db.engine.begin() as conn:
+                conn.execute(stmt, due)
+        except Exception as e:
+            logging.warning("last_seen 기록 실패: %s", e)
+            with self._lock:
+                for row in due:
+                    self._pending.setdefault(row['uid'], row['seen'])
+                    self._written.pop(row['uid'], None)
+            return 0
+        return len(due)
+
+    def _flush_at_exit(self):
+        if self._app is None or not self._pending:
+            return
+        try:
+            with self._app.app_context():
+                self.flush(force=True)
+        except Exception:
+            pass
+
+
+tracker = LastSeenTracker()
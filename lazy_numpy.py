@@ -0,0 +1,21 @@
+"""NumPy를 처음 필요할 때 가져옴 (선택 의존성, 워커 시작 시간 단축)"""
+import logging
+
+_numpy = None
+_missing = False
+_warned = set()
+
+
+def load(feature):
+    """numpy 모듈 (설치되어 있지 않으면 None, feature별로 한 번만 경고)"""
+    global _numpy, _missing
+    if _numpy is None and not _missing:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:  # pragma: no cover - 선택 의존성
+            _missing = True
+    if _numpy is None and feature not in _warned:
+        logging.warning("numpy가 설치되어 있지 않아 %s 기능을 사용하지 않습니다.", feature)
+        _warned.add(feature)
+    return _numpy
@@ -0,0 +1,153 @@
+"""주간 순위표 (퀴즈 유형별 맞힌 문제 수, 집중 시간)
+
+점수를 기록할 때(서버 퀴즈 채점 완료(quiz.grade), 집중 세션 저장) 그 주의
+LeaderboardEntry와 점수별 사용자 수(LeaderboardScore)를 함께 갱신하므로, 조회할 때
+QuizScore/FocusSession 전체를 GROUP BY 하지 않습니다. 클라이언트가 보고한 퀴즈 점수
+(submit_quiz_score, 오프라인 큐)는 검증할 수 없으므로 퀴즈 순위표에 넣지 않습니다.
+
+- 내 순위: 기본키로 내 점수를 읽고, 더 높은 점수의 사용자 수를 점수별 집계에서 더함
+  (비용은 전체 사용자 수가 아니라 내 위에 있는 서로 다른 점수의 개수에 비례)
+- 상위 100명: (board, week, score) 인덱스를 위에서부터 100행만 읽고, 워커 메모리에
+  TOP_TTL초 동안 보관 (이 워커에서 상위권 점수가 바뀌면 바로 버림)
+"""
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+from extensions import db
+
+FOCUS_BOARD = 'focus'
+QUIZ_BOARD_PREFIX = 'quiz:'
+TOP_SIZE = 100
+TOP_TTL = 30
+
+_top = {}   # (board, week) -> (만료 시각, 커트라인 점수 또는 None, [행])
+_lock = threading.Lock()
+
+
+def quiz_board(quiz_type):
+    return QUIZ_BOARD_PREFIX + quiz_type
+
+
+def week_of(day=None):
+    """day가 속한 주의 월요일 (기본: 오늘)"""
+    day = day or date.today()
+    if isinstance(day, datetime):
+        day = day.date()
+    return day - timedelta(days=day.weekday())
+
+
+def _count_score(board, week, score, delta):
+    """점수별 사용자 수 증감 (0명이 되면 행 삭제)"""
+    from models import LeaderboardScore
+    table = LeaderboardScore.__table__
+    key = (table.c.board == board, table.c.week == week, table.c.score == score)
+    updated = db.session.execute(
+        table.update().where(*key).values(users=table.c.users + delta)
+    ).rowcount
+    if not updated and delta > 0:
+        db.session.add(LeaderboardScore(board=board, week=week, score=score, users=delta))
+    elif delta < 0:
+        db.session.execute(table.delete().where(*key, table.c.users <= 0))
+
+
+def _drop_top(board, week, score):
+    """score가 캐시된 상위권에 들면 캐시 삭제"""
+    with _lock:
+        cached = _top.get((board, week))
+        if cached and (cached[1] is None or score >= cached[1]):
+            del _top[(board, week)]
+
+
+def record(board, user_id, points, when=None):
+    """그 주 순위표에 점수를 더함 (커밋은 호출한 쪽에서)"""
+    from models import LeaderboardEntry
+    week = week_of(when)
+    entry = db.session.get(LeaderboardEntry, (board, week, user_id))
+    if entry is None:
+        entry = LeaderboardEntry(board=board, week=week, user_id=user_id, score=points)
+        db.session.add(entry)
+    elif points:
+        _count_score(board, week, entry.score, -1)
+        entry.score += points
+    else:
+        return entry
+    _count_score(board, week, entry.score, 1)
+    _drop_top(board, week, entry.score)
+    return entry
+
+
+def record_quiz(user_id, quiz_type, score, total_questions, when=None):
+    """퀴즈 결과 기록 (서버 퀴즈 유형만, 점수는 0~문항 수로 제한)"""
+    from quiz import QUIZ_TYPES
+    if quiz_type not in QUIZ_TYPES:
+        return None
+    points = max(0, min(int(score or 0), int(total_questions or 0)))
+    return record(quiz_board(quiz_type), user_id, points, when)
+
+
+def record_focus(user_id, day, minutes):
+    """완료된 집중 세션 기록 (세션 날짜가 속한 주에 분 단위로 더함)"""
+    return record(FOCUS_BOARD, user_id, max(0, int(minutes)), day)
+
+
+def remove_user(user_id):
+    """사용자의 모든 순위표 항목 삭제 (커밋은 호출한 쪽에서)"""
+    from models import LeaderboardEntry
+    entries = LeaderboardEntry.query.filter_by(user_id=user_id).all()
+    for entry in entries:
+        _count_score(entry.board, entry.week, entry.score, -1)
+        db.session.delete(entry)
+    if entries:
+        with _lock:
+            _top.clear()
+
+
+def valid_board(board):
+    from quiz import QUIZ_TYPES
+    return board == FOCUS_BOARD or board in [quiz_board(t) for t in QUIZ_TYPES]
+
+
+def rank_of(board, week, user_id):
+    """(순위, 점수) 반환 (그 주 기록이 없으면 (None, 0)). 동점자는 같은 순위"""
+    from models import LeaderboardEntry, LeaderboardScore
+    entry = db.session.get(LeaderboardEntry, (board, week, user_id))
+    if entry is None:
+        return None, 0
+    above = db.session.query(db.func.coalesce(db.func.sum(LeaderboardScore.users), 0)).filter(
+        LeaderboardScore.board == board,
+        LeaderboardScore.week == week,
+        LeaderboardScore.score > entry.score
+    ).scalar()
+    return above + 1, entry.score
+
+
+def top(board, week):
+    """상위 TOP_SIZE명 [{'rank', 'user_id', 'username', 'score'}] (캐시 사용)"""
+    from models import LeaderboardEntry, User
+    key = (board, week)
+    now = time.monotonic()
+    cached = _top.get(key)
+    if cached and now < cached[0]:
+        return cached[2]
+
+    rows = db.session.query(LeaderboardEntry.user_id, LeaderboardEntry.score, User.username).join(
+        User, User.id == LeaderboardEntry.user_id
+    ).filter(
+        LeaderboardEntry.board == board,
+        LeaderboardEntry.week == week
+    ).order_by(LeaderboardEntry.score.desc(), LeaderboardEntry.user_id).limit(TOP_SIZE).all()
+
+    ranked = []
+    for position, row in enumerate(rows, 1):
+        tied = ranked and ranked[-1]['score'] == row.score
+        ranked.append({
+            'rank': ranked[-1]['rank'] if tied else position,
+            'user_id': row.user_id,
+            'username': row.username,
+            'score': row.score
+        })
+    cutoff = ranked[-1]['score'] if len(ranked) == TOP_SIZE else None
+    with _lock:
+        _top[key] = (now + TOP_TTL, cutoff, ranked)
+    return ranked
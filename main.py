@@ -1,5 +1,10 @@
-from app import app
-import routes  # noqa: F401
+import os
+
+from app import create_app
+
+app = create_app()
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    import seed
+    seed.initialize_once(app)
+    app.run(host="0.0.0.0", port=5000, debug=os.environ.get("FLASK_DEBUG") == "1")
@@ -0,0 +1,271 @@
+"""요청·캐시·외부 호출 지표와 Prometheus 형식 /metrics
+
+요청마다 엔드포인트/메서드/상태 코드별 요청 수와 응답 시간 히스토그램을 기록하고,
+각 모듈은 inc()로 캐시 적중/실패, 다음 사전 호출, 파일 저장소 파싱 횟수를 올립니다.
+
+- 값은 스레드별 샤드에 잠금 없이 더하고, /metrics를 읽을 때만 모든 샤드를 합칩니다.
+  운영 중에 켜 두어도 요청당 비용은 dict 갱신 몇 번입니다.
+- 워커가 여럿이면 각 워커가 METRICS_FLUSH_INTERVAL(초)마다 자기 합계를
+  instance/metrics/<pid>.json에 쓰고, /metrics는 이 파일들을 더해 돌려줍니다.
+- /metrics는 관리자 세션 또는 Authorization: Bearer <METRICS_TOKEN>으로만 볼 수 있습니다.
+"""
+import hmac
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+
+from flask import Response, current_app, g, request
+from flask_login import current_user
+
+REQUESTS = 'wackydocs_http_requests_total'
+REQUEST_DURATION = 'wackydocs_http_request_duration_seconds'
+CACHE_REQUESTS = 'wackydocs_cache_requests_total'
+DICTIONARY_CALLS = 'wackydocs_dictionary_upstream_calls_total'
+FILE_PARSES = 'wackydocs_file_parses_total'
+DB_REQUESTS = 'wackydocs_db_profiled_requests_total'
+DB_QUERIES = 'wackydocs_db_queries_total'
+DB_SECONDS = 'wackydocs_db_seconds_total'
+DB_SLOW_QUERIES = 'wackydocs_db_slow_queries_total'
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 이름 -> (종류, 설명)
+METRICS = {
+    REQUESTS: ('counter', '엔드포인트/메서드/상태 코드별 요청 수'),
+    REQUEST_DURATION: ('histogram', '엔드포인트별 응답 시간'),
+    CACHE_REQUESTS: ('counter', '캐시별 적중(hit)/실패(miss) 수'),
+    DICTIONARY_CALLS: ('counter', '다음 사전 호출 수 (mode: sync/async)'),
+    FILE_PARSES: ('counter', '파일 저장소(모의고사, 문의) 파싱 수'),
+    # 아래는 쿼리 프로파일(query_guard)이 켜져 있을 때만 기록
+    DB_REQUESTS: ('counter', '쿼리 프로파일 중 엔드포인트별 요청 수'),
+    DB_QUERIES: ('counter', '엔드포인트별 SQL 쿼리 수'),
+    DB_SECONDS: ('counter', '엔드포인트별 DB 시간 (초)'),
+    DB_SLOW_QUERIES: ('counter', '엔드포인트별 느린 쿼리 수'),
+}
+
+_enabled = True
+_directory = None
+_flush_interval = 10
+_last_flush = time.monotonic()
+_local = threading.local()
+_shards = []          # 스레드별 (counters, histograms)
+_shards_lock = threading.Lock()
+
+
+def _reset():
+    """fork된 자식은 부모의 값을 물려받지 않음 (preload 마스터의 값이 워커마다 중복되지 않도록)"""
+    global _local, _shards, _shards_lock, _last_flush
+    _local = threading.local()
+    _shards = []
+    _shards_lock = threading.Lock()
+    _last_flush = time.monotonic()
+
+
+os.register_at_fork(after_in_child=_reset)
+
+
+def _shard():
+    try:
+        return _local.shard
+    except AttributeError:
+        shard = ({}, {})
+        with _shards_lock:
+            _shards.append(shard)
+        _local.shard = shard
+        return shard
+
+
+def inc(name, amount=1, **labels):
+    """카운터 증가 (labels는 값이 몇 가지뿐인 것만)"""
+    if not _enabled:
+        return
+    counters = _shard()[0]
+    key = (name, tuple(sorted(labels.items())))
+    counters[key] = counters.get(key, 0) + amount
+
+
+def observe(name, value, **labels):
+    """히스토그램에 값 기록"""
+    if not _enabled:
+        return
+    histograms = _shard()[1]
+    key = (name, tuple(sorted(labels.items())))
+    entry = histograms.get(key)
+    if entry is None:
+        # 버킷별 개수 (마지막 칸은 +Inf), 합계, 개수
+        entry = histograms[key] = [[0] * (len(BUCKETS) + 1), 0.0, 0]
+    entry[0][bisect_left(BUCKETS, value)] += 1
+    entry[1] += value
+    entry[2] += 1
+
+
+def cache_result(cache, hit):
+    inc(CACHE_REQUESTS, cache=cache, result='hit' if hit else 'miss')
+
+
+def snapshot():
+    """이 프로세스의 모든 샤드 합계 {'counters': [...], 'histograms': [...]}"""
+    counters, histograms = {}, {}
+    with _shards_lock:
+        shards = list(_shards)
+    for shard_counters, shard_histograms in shards:
+        # dict.copy()는 GIL 아래에서 한 번에 실행되므로 기록 중인 스레드와 겹쳐도 안전
+        for key, value in shard_counters.copy().items():
+            counters[key] = counters.get(key, 0) + value
+        for key, (buckets, total, count) in shard_histograms.copy().items():
+            _add_histogram(histograms, key, list(buckets), total, count)
+    return {
+        'counters': [[name, list(labels), value] for (name, labels), value in counters.items()],
+        'histograms': [[name, list(labels), *entry] for (name, labels), entry in histograms.items()],
+    }
+
+
+def _add_histogram(histograms, key, buckets, total, count):
+    entry = histograms.get(key)
+    if entry is None:
+        histograms[key] = [buckets, total, count]
+        return
+    entry[0] = [a + b for a, b in zip(entry[0], buckets)]
+    entry[1] += total
+    entry[2] += count
+
+
+def flush():
+    """이 워커의 합계를 공유 디렉터리에 기록"""
+    global _last_flush
+    _last_flush = time.monotonic()
+    if _directory is None:
+        return
+    fd, tmp = tempfile.mkstemp(dir=_directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(snapshot(), f)
+    os.replace(tmp, os.path.join(_directory, f'{os.getpid()}.json'))
+
+
+def maybe_flush():
+    if time.monotonic() - _last_flush >= _flush_interval:
+        try:
+            flush()
+        except OSError as e:
+            print(f"Metrics flush error: {str(e)}")
+
+
+def clear():
+    """이전 실행(죽은 워커)의 파일 삭제. 워커가 뜨기 전에만 호출 (gunicorn when_ready, flask clear-runtime)"""
+    if _directory is None:
+        return
+    shutil.rmtree(_directory, ignore_errors=True)
+    os.makedirs(_directory, exist_ok=True)
+
+
+def collect():
+    """모든 워커의 합계 (이 워커는 메모리의 최신 값, 다른 워커는 마지막으로 기록한 파일)"""
+    snapshots = [snapshot()]
+    own = f'{os.getpid()}.json'
+    if _directory is not None:
+        for filename in os.listdir(_directory):
+            if not filename.endswith('.json') or filename == own:
+                continue
+            try:
+                with open(os.path.join(_directory, filename), encoding='utf-8') as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+
+    counters, histograms = {}, {}
+    for data in snapshots:
+        for name, labels, value in data['counters']:
+            key = (name, tuple(tuple(pair) for pair in labels))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, buckets, total, count in data['histograms']:
+            _add_histogram(histograms, (name, tuple(tuple(pair) for pair in labels)), buckets, total, count)
+    return counters, histograms
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render():
+    """Prometheus 텍스트 형식 (0.0.4)"""
+    counters, histograms = collect()
+    lines = []
+    for name, (kind, description) in METRICS.items():
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {kind}')
+        if kind == 'counter':
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f'{name}{_labels(labels)} {_number(value)}')
+            continue
+        for (metric, labels), (buckets, total, count) in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, bucket_count in zip(BUCKETS + ('+Inf',), buckets):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{_labels(labels + (("le", bound),))} {cumulative}')
+            lines.append(f'{name}_sum{_labels(labels)} {_number(total)}')
+            lines.append(f'{name}_count{_labels(labels)} {count}')
+    return '\n'.join(lines) + '\n'
+
+
+def _start_timer():
+    g.metrics_started = time.perf_counter()
+
+
+def _record_request(response):
+    started = g.pop('metrics_started', None)
+    if started is not None:
+        endpoint = request.endpoint or 'unmatched'
+        inc(REQUESTS, endpoint=endpoint, method=request.method,
+            status=str(response.status_code))
+        observe(REQUEST_DURATION, time.perf_counter() - started, endpoint=endpoint)
+    maybe_flush()
+    return response
+
+
+def _authorized():
+    token = current_app.config.get('METRICS_TOKEN')
+    if token:
+        supplied = request.headers.get('Authorization', '')
+        if hmac.compare_digest(supplied.encode('utf-8'), f'Bearer {token}'.encode('utf-8')):
+            return True
+    return current_user.is_authenticated and current_user.is_admin
+
+
+def metrics_view():
+    if not _authorized():
+        # abort()는 앱의 Exception 처리기를 거쳐 500이 되므로 직접 응답
+        return Response('forbidden', 403, mimetype='text/plain')
+    return Response(render(), mimetype='text/plain; version=0.0.4; charset=utf-8',
+                    headers={'Cache-Control': 'no-store'})
+
+
+def init_app(app):
+    global _enabled, _directory, _flush_interval
+    _enabled = app.config.setdefault('METRICS', os.environ.get('METRICS', '1') != '0')
+    app.config.setdefault('METRICS_TOKEN', os.environ.get('METRICS_TOKEN'))
+    _flush_interval = app.config.setdefault('METRICS_FLUSH_INTERVAL', _flush_interval)
+    _directory = app.config.setdefault('METRICS_DIR', os.path.join(app.instance_path, 'metrics'))
+    # 여기서 비우면 CLI나 uvicorn 워커의 create_app이 실행 중인 워커의 값을 지워 카운터가 줄어듦
+    os.makedirs(_directory, exist_ok=True)
+    if not _enabled:
+        return
+    app.before_request(_start_timer)
+    app.after_request(_record_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
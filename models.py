@@ -1,4 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
@@ -11,6 +13,7 @@ class User(UserMixin, db.Model):
     password_hash = db.Column(db.String(256), nullable=False)
     is_admin = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_seen = db.Column(db.DateTime, nullable=True)  # last_seen.py 트래커가 일정 간격으로 기록
 
     # Relationships
     pdf_requests = db.relationship('PDFRequest', backref='user', lazy=True)
@@ -38,7 +41,8 @@ class User(UserMixin, db.Model):
             'username': self.username,
             'email': self.email,
             'is_admin': self.is_admin,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'last_seen': self.last_seen.isoformat() if self.last_seen else None
         }
 
 class PDFRequest(db.Model):
@@ -51,6 +55,11 @@ class PDFRequest(db.Model):
     requested_at = db.Column(db.DateTime, default=datetime.utcnow)
     processed_at = db.Column(db.DateTime)
 
+    __table_args__ = (
+        db.Index('ix_pdf_request_user_requested', 'user_id', 'requested_at'),
+        db.Index('ix_pdf_request_status_requested', 'status', 'requested_at'),
+    )
+
     def __init__(self, user_id=None, subject=None, topic=None, description=None, status='pending'):
         if user_id:
             self.user_id = user_id
@@ -62,26 +71,64 @@ class PDFRequest(db.Model):
             self.description = description
         self.status = status
 
+    @staticmethod
+    def daily_limit():
+        """하루 PDF 요청 가능 횟수 (PDF_REQUEST_DAILY_LIMIT)"""
+        return current_app.config.get('PDF_REQUEST_DAILY_LIMIT', 1)
+
     @staticmethod
     def can_user_request_today(user_id):
         """사용자가 오늘 요청할 수 있는지 확인"""
-        from datetime import date
-        today = date.today()
-        today_requests = PDFRequest.query.filter(
-            PDFRequest.user_id == user_id,
-            db.func.date(PDFRequest.requested_at) == today
-        ).count()
-        return today_requests == 0
+        return PDFRequest.get_user_today_request_count(user_id) < PDFRequest.daily_limit()
 
     @staticmethod
     def get_user_today_request_count(user_id):
-        """사용자의 오늘 요청 수 반환"""
-        from datetime import date
-        today = date.today()
-        return PDFRequest.query.filter(
-            PDFRequest.user_id == user_id,
-            db.func.date(PDFRequest.requested_at) == today
-        ).count()
+        """사용자의 오늘 요청 수 반환 (할당량 원장 기본키 조회)"""
+        quota = db.session.get(PDFRequestQuota, (user_id, PDFRequestQuota.today()))
+        return quota.used if quota else 0
+
+class PDFRequestQuota(db.Model):
+    """사용자별 일일 PDF 요청 원장 (user_id, day) -> 사용 횟수
+
+    관리자 초기화는 요청 기록을 지우지 않고 used 값만 조정합니다.
+    day는 PDF_REQUEST_TIMEZONE 기준 날짜입니다.
+    """
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    used = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @staticmethod
+    def today():
+        tz = ZoneInfo(current_app.config.get('PDF_REQUEST_TIMEZONE', 'Asia/Seoul'))
+        return datetime.now(tz).date()
+
+    @staticmethod
+    def consume(user_id, limit=None):
+        """할당량이 남아 있으면 1회 차감하고 True 반환 (커밋은 호출한 쪽에서)"""
+        limit = PDFRequest.daily_limit() if limit is None else limit
+        today = PDFRequestQuota.today()
+        table = PDFRequestQuota.__table__
+        updated = db.session.execute(
+            table.update()
+            .where(table.c.user_id == user_id, table.c.day == today, table.c.used < limit)
+            .values(used=table.c.used + 1, updated_at=datetime.utcnow())
+        ).rowcount
+        if updated:
+            return True
+        if db.session.get(PDFRequestQuota, (user_id, today)) is not None or limit < 1:
+            return False
+        db.session.add(PDFRequestQuota(user_id=user_id, day=today, used=1))
+        return True
+
+    @staticmethod
+    def reset(user_id=None):
+        """오늘 사용 횟수를 0으로 되돌리고 조정된 원장 행 수 반환"""
+        table = PDFRequestQuota.__table__
+        stmt = table.update().where(table.c.day == PDFRequestQuota.today(), table.c.used > 0)
+        if user_id is not None:
+            stmt = stmt.where(table.c.user_id == user_id)
+        return db.session.execute(stmt.values(used=0, updated_at=datetime.utcnow())).rowcount
 
 class PDFResource(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -95,6 +142,11 @@ class PDFResource(db.Model):
     uploaded_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     download_count = db.Column(db.Integer, default=0)
 
+    __table_args__ = (
+        db.Index('ix_pdf_resource_upload_date', 'upload_date'),
+        db.Index('ix_pdf_resource_category_upload_date', 'category', 'upload_date'),
+    )
+
     def __init__(self, title=None, subject=None, category=None, filename=None, original_filename=None, uploaded_by=None, file_size=None):
         if title:
             self.title = title
@@ -118,6 +170,12 @@ class KoreanVocabulary(db.Model):
     category = db.Column(db.String(50), nullable=False)  # 호칭, 기타 등
     difficulty = db.Column(db.String(20), default='medium')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    version = db.Column(db.BigInteger, nullable=False, default=0, server_default='0')  # 동기화 버전 (sync.py)
+
+    __table_args__ = (
+        db.Index('ix_korean_vocabulary_category', 'category'),
+        db.Index('ix_korean_vocabulary_version', 'version'),
+    )
 
     def __init__(self, word=None, meaning=None, category=None, difficulty='medium'):
         if word:
@@ -147,6 +205,22 @@ class VocabularyWord(db.Model):
     language = db.Column(db.String(10), nullable=False)  # 'en' or 'ko'
     added_at = db.Column(db.DateTime, default=datetime.utcnow)
     mastery_level = db.Column(db.Integer, default=0)  # 0-5 scale
+    # 간격 반복(SM-2) 일정: 다음 복습 시각, 난이도 계수, 복습 간격, 연속 정답 횟수
+    due_at = db.Column(db.DateTime, default=datetime.utcnow)
+    ease_factor = db.Column(db.Float, nullable=False, default=2.5, server_default='2.5')
+    interval_days = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    repetitions = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    version = db.Column(db.BigInteger, nullable=False, default=0, server_default='0')  # 동기화 버전 (sync.py)
+
+    MIN_EASE = 1.3
+    # 복습 일정(record_review가 바꾸는 열)만 바뀐 flush는 동기화 버전을 올리지 않음 (sync.py)
+    SYNC_IGNORED = ('mastery_level', 'due_at', 'ease_factor', 'interval_days', 'repetitions')
+
+    __table_args__ = (
+        db.Index('ix_vocabulary_word_user_language_word', 'user_id', 'language', 'word'),
+        db.Index('ix_vocabulary_word_user_due', 'user_id', 'due_at'),
+        db.Index('ix_vocabulary_word_user_version', 'user_id', 'version'),
+    )
 
     def __init__(self, user_id=None, word=None, meaning=None, korean_meaning=None, language=None, mastery_level=0):
         if user_id:
@@ -169,9 +243,47 @@ class VocabularyWord(db.Model):
             'korean_meaning': self.korean_meaning,
             'language': self.language,
             'added_at': self.added_at.isoformat() if self.added_at else None,
-            'mastery_level': self.mastery_level
+            'mastery_level': self.mastery_level,
+            'due_at': self.due_at.isoformat() if self.due_at else None,
+            'ease_factor': self.ease_factor,
+            'interval_days': self.interval_days,
+            'repetitions': self.repetitions
         }
 
+    def record_review(self, quality, now=None):
+        """SM-2 방식으로 다음 복습 일정 갱신 (quality: 0~5, 3 미만은 틀림)"""
+        now = now or datetime.utcnow()
+        quality = max(0, min(5, quality))
+        ease = self.ease_factor if self.ease_factor is not None else 2.5
+        repetitions = self.repetitions or 0
+
+        if quality < 3:
+            repetitions = 0
+            interval = 1
+        else:
+            if repetitions == 0:
+                interval = 1
+            elif repetitions == 1:
+                interval = 6
+            else:
+                interval = max(1, round((self.interval_days or 1) * ease))
+            repetitions += 1
+
+        self.ease_factor = max(self.MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        self.repetitions = repetitions
+        self.interval_days = interval
+        self.due_at = now + timedelta(days=interval)
+        self.mastery_level = min(5, repetitions)
+
+    @staticmethod
+    def due_query(user_id, now=None, language=None):
+        """복습할 때가 된 단어 (due_at 순, (user_id, due_at) 인덱스 범위 스캔)"""
+        query = VocabularyWord.query.filter(VocabularyWord.user_id == user_id,
+                                            VocabularyWord.due_at <= (now or datetime.utcnow()))
+        if language:
+            query = query.filter(VocabularyWord.language == language)
+        return query.order_by(VocabularyWord.due_at)
+
 class QuizScore(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -180,6 +292,10 @@ class QuizScore(db.Model):
     total_questions = db.Column(db.Integer, nullable=False)
     quiz_date = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_quiz_score_user_quiz_date', 'user_id', 'quiz_date'),
+    )
+
     def __init__(self, user_id=None, quiz_type=None, score=None, total_questions=None):
         if user_id:
             self.user_id = user_id
@@ -190,6 +306,25 @@ class QuizScore(db.Model):
         if total_questions:
             self.total_questions = total_questions
 
+class QuizAttempt(db.Model):
+    """서버에서 출제한 퀴즈 한 회분
+
+    answers(정답 보기 번호)는 브라우저로 보내지 않고 채점할 때만 사용합니다.
+    responses는 문제별로 고른 보기 번호 (None: 아직 안 풂, -1: 건너뜀).
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    quiz_type = db.Column(db.String(50), nullable=False)
+    word_ids = db.Column(db.JSON, nullable=False)
+    answers = db.Column(db.JSON, nullable=False)
+    responses = db.Column(db.JSON, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_quiz_attempt_user_created', 'user_id', 'created_at'),
+    )
+
 class Notification(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -209,6 +344,10 @@ class Announcement(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     expires_at = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        db.Index('ix_announcement_active_created', 'is_active', 'created_at'),
+    )
+
     creator = db.relationship('User', backref=db.backref('announcements', lazy=True))
 
     def __init__(self, title=None, content=None, visibility='all', priority='normal', created_by=None, expires_at=None, is_active=True):
@@ -224,6 +363,24 @@ class Announcement(db.Model):
             self.expires_at = expires_at
         self.is_active = is_active
 
+    # 우선순위 문자열 정렬은 'urgent' < 'normal' < 'low' < 'high' 순이 되므로 실제 순위 사용
+    PRIORITY_RANK = {'low': 0, 'normal': 1, 'high': 2, 'urgent': 3}
+
+    @staticmethod
+    def priority_rank():
+        return db.case(Announcement.PRIORITY_RANK, value=Announcement.priority, else_=1)
+
+    @staticmethod
+    def visible_query(is_member, now=None):
+        """회원/비회원에게 보이는 활성 공지사항 쿼리 (만료 제외, 우선순위 순)"""
+        now = now or datetime.now()
+        audiences = ['all', 'members'] if is_member else ['all', 'non_members']
+        return Announcement.query.filter(
+            Announcement.is_active == True,
+            db.or_(Announcement.expires_at.is_(None), Announcement.expires_at > now),
+            Announcement.visibility.in_(audiences)
+        ).order_by(Announcement.priority_rank().desc(), Announcement.created_at.desc())
+
     def is_visible_to_user(self, user):
         """Check if announcement is visible to a specific user"""
         if not self.is_active:
@@ -251,6 +408,10 @@ class FocusSession(db.Model):
 
     user = db.relationship('User', backref=db.backref('focus_sessions', lazy=True))
 
+    __table_args__ = (
+        db.Index('ix_focus_session_user_completed_date', 'user_id', 'completed', 'session_date'),
+    )
+
     def __init__(self, user_id=None, session_date=None, focus_minutes=None, completed=True):
         if user_id:
             self.user_id = user_id
@@ -270,6 +431,165 @@ class FocusSession(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
+class FocusDaily(db.Model):
+    """사용자별 일일 집중 시간 집계 (완료된 세션만, save_focus_session에서 갱신)"""
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    minutes = db.Column(db.Integer, nullable=False, default=0)
+    sessions = db.Column(db.Integer, nullable=False, default=0)
+
+    def __init__(self, user_id=None, day=None, minutes=0, sessions=0):
+        self.user_id = user_id
+        self.day = day
+        self.minutes = minutes
+        self.sessions = sessions
+
+class FocusStats(db.Model):
+    """사용자별 집중 통계 누계와 연속 일수 (기록 시점에 갱신)"""
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    total_sessions = db.Column(db.Integer, nullable=False, default=0)
+    total_minutes = db.Column(db.Integer, nullable=False, default=0)
+    active_days = db.Column(db.Integer, nullable=False, default=0)
+    current_streak = db.Column(db.Integer, nullable=False, default=0)  # last_active_day에서 끝나는 연속 일수
+    longest_streak = db.Column(db.Integer, nullable=False, default=0)
+    last_active_day = db.Column(db.Date, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __init__(self, user_id=None):
+        self.user_id = user_id
+        self.total_sessions = 0
+        self.total_minutes = 0
+        self.active_days = 0
+        self.current_streak = 0
+        self.longest_streak = 0
+
+    @staticmethod
+    def record_session(user_id, day, minutes):
+        """완료된 집중 세션을 일일 집계와 누계에 반영 (커밋은 호출한 쪽에서)"""
+        daily = FocusDaily.__table__
+        updated = db.session.execute(
+            daily.update()
+            .where(daily.c.user_id == user_id, daily.c.day == day)
+            .values(minutes=daily.c.minutes + minutes, sessions=daily.c.sessions + 1)
+        ).rowcount
+        new_day = not updated
+        if new_day:
+            db.session.add(FocusDaily(user_id=user_id, day=day, minutes=minutes, sessions=1))
+
+        stats = db.session.get(FocusStats, user_id)
+        if stats is None:
+            stats = FocusStats(user_id=user_id)
+            db.session.add(stats)
+        stats.total_sessions += 1
+        stats.total_minutes += minutes
+
+        if new_day:
+            stats.active_days += 1
+            last = stats.last_active_day
+            if last is None or day > last + timedelta(days=1):
+                stats.current_streak = 1
+                stats.last_active_day = day
+            elif day == last + timedelta(days=1):
+                stats.current_streak += 1
+                stats.last_active_day = day
+            else:
+                # 지난 날짜가 뒤늦게 기록된 경우에만 일일 집계로 다시 계산
+                db.session.flush()
+                stats.recompute_streaks()
+            stats.longest_streak = max(stats.longest_streak, stats.current_streak)
+        return stats
+
+    def recompute_streaks(self):
+        """일일 집계로부터 연속 일수를 다시 계산"""
+        days = [row.day for row in FocusDaily.query.filter_by(user_id=self.user_id)
+                .with_entities(FocusDaily.day).order_by(FocusDaily.day)]
+        longest = current = 0
+        previous = None
+        for day in days:
+            current = current + 1 if previous and day - previous == timedelta(days=1) else 1
+            longest = max(longest, current)
+            previous = day
+        self.current_streak = current
+        self.longest_streak = longest
+        self.last_active_day = previous
+
+    def streak_as_of(self, today):
+        """오늘 기준 현재 연속 일수 (어제 이후 기록이 없으면 0)"""
+        if not self.last_active_day or self.last_active_day < today - timedelta(days=1):
+            return 0
+        return self.current_streak
+
+class LeaderboardEntry(db.Model):
+    """주간 순위표 항목 (board: 'quiz:<퀴즈 유형>' 또는 'focus', week: 그 주 월요일)"""
+    board = db.Column(db.String(60), primary_key=True)
+    week = db.Column(db.Date, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    score = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_leaderboard_entry_board_week_score', 'board', 'week', 'score', 'user_id'),
+    )
+
+    def __init__(self, board=None, week=None, user_id=None, score=0):
+        self.board = board
+        self.week = week
+        self.user_id = user_id
+        self.score = score
+
+class LeaderboardScore(db.Model):
+    """주간 순위표의 점수별 사용자 수 (순위 계산용)"""
+    board = db.Column(db.String(60), primary_key=True)
+    week = db.Column(db.Date, primary_key=True)
+    score = db.Column(db.Integer, primary_key=True)
+    users = db.Column(db.Integer, nullable=False, default=0)
+
+    def __init__(self, board=None, week=None, score=0, users=0):
+        self.board = board
+        self.week = week
+        self.score = score
+        self.users = users
+
+class SyncCounter(db.Model):
+    """동기화 버전 카운터 (한 행). 올릴 때 행 잠금이 커밋까지 유지되어 버전이 커밋 순서대로 보임"""
+    id = db.Column(db.Integer, primary_key=True)
+    value = db.Column(db.BigInteger, nullable=False, default=0)
+
+class SyncChange(db.Model):
+    """행이 없는 변경 기록: 삭제된 단어의 삭제 표시, 파일로 저장되는 모의고사의 추가/삭제"""
+    kind = db.Column(db.String(30), primary_key=True)   # korean_vocabulary, vocabulary, tests
+    key = db.Column(db.String(200), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)  # 개인 단어장이면 소유자
+    version = db.Column(db.BigInteger, nullable=False)
+    deleted = db.Column(db.Boolean, nullable=False, default=False)
+
+    __table_args__ = (
+        db.Index('ix_sync_change_version', 'version'),
+    )
+
+    def __init__(self, kind=None, key=None, user_id=None, version=0, deleted=False):
+        self.kind = kind
+        self.key = key
+        self.user_id = user_id
+        self.version = version
+        self.deleted = deleted
+
+class IngestKey(db.Model):
+    """오프라인 큐에서 일괄 전송된 이벤트의 멱등 키 (재전송 중복 제거, ingest.py)"""
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    key = db.Column(db.String(64), primary_key=True)
+    kind = db.Column(db.String(20), nullable=False)   # quiz_score, focus_session
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_ingest_key_user_created', 'user_id', 'created_at'),
+    )
+
+    def __init__(self, user_id=None, key=None, kind=None):
+        self.user_id = user_id
+        self.key = key
+        self.kind = kind
+
 class CustomerSupport(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -0,0 +1,297 @@
+"""비문학 모의고사 파일 (모의고사/ 문제, 이미지, 응시 결과) 불러오기/저장"""
+import os
+from datetime import datetime, timezone
+
+import metrics
+
+def nonfiction_tests_modified():
+    """모의고사 폴더의 수정 시각 (문제 파일을 추가/삭제하면 바뀜)"""
+    try:
+        return datetime.fromtimestamp(os.stat('모의고사').st_mtime, timezone.utc)
+    except FileNotFoundError:
+        return None
+
+def load_nonfiction_tests():
+    """모의고사 폴더에서 문제 목록을 로드"""
+    try:
+        tests_dir = '모의고사'
+        if not os.path.exists(tests_dir):
+            os.makedirs(tests_dir, exist_ok=True)
+            return []
+        
+        tests = []
+        for filename in os.listdir(tests_dir):
+            if filename.endswith('.txt'):
+                test_id = filename.replace('.txt', '')
+                test_data = load_nonfiction_test(test_id)
+                if test_data:
+                    tests.append(nonfiction_test_summary(test_data))
+        
+        return sorted(tests, key=lambda x: x['title'])
+        
+    except Exception as e:
+        print(f"Load nonfiction tests error: {str(e)}")
+        return []
+
+def nonfiction_test_summary(test_data):
+    """목록용 모의고사 정보 (지문과 문제 제외)"""
+    return {
+        'id': test_data['id'],
+        'title': test_data['title'],
+        'description': test_data.get('description', ''),
+        'question_count': len(test_data['questions'])
+    }
+
+def load_nonfiction_test(test_id):
+    """특정 모의고사 문제를 로드"""
+    try:
+        tests_dir = '모의고사'
+        filepath = os.path.join(tests_dir, f"{test_id}.txt")
+        
+        if not os.path.exists(filepath):
+            return None
+        
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+        metrics.inc(metrics.FILE_PARSES, store='nonfiction_test')
+        
+        # Parse test data
+        lines = content.split('\n')
+        test_data = {
+            'id': test_id,
+            'title': '',
+            'description': '',
+            'passage': '',
+            'questions': []
+        }
+        
+        current_section = ''
+        current_question = None
+        
+        for line in lines:
+            line = line.strip()
+            # Remove any control characters
+            line = ''.join(char for char in line if ord(char) >= 32 or char in '\t\n\r')
+            if line.startswith('제목: '):
+                test_data['title'] = line.replace('제목: ', '')
+            elif line.startswith('설명: '):
+                test_data['description'] = line.replace('설명: ', '')
+            elif line == '=== 지문 ===':
+                current_section = 'passage'
+            elif line.startswith('=== 문제') and line.endswith('==='):
+                current_section = 'question'
+                try:
+                    # 문제 번호 파싱 개선
+                    parts = line.replace('===', '').strip().split()
+                    if len(parts) >= 2:
+                        question_num_str = parts[1].replace('번', '')
+                        question_num = int(question_num_str)
+                    else:
+                        question_num = len(test_data['questions']) + 1
+                except (ValueError, IndexError):
+                    question_num = len(test_data['questions']) + 1
+                
+                current_question = {
+                    'number': question_num,
+                    'content': '',
+                    'options': [],
+                    'correct_answer': 1,
+                    'explanation': ''
+                }
+            elif line.startswith('정답: '):
+                if current_question:
+                    try:
+                        current_question['correct_answer'] = int(line.replace('정답: ', ''))
+                    except ValueError:
+                        current_question['correct_answer'] = 1
+            elif line.startswith('해설: '):
+                if current_question:
+                    current_question['explanation'] = line.replace('해설: ', '')
+                    test_data['questions'].append(current_question)
+                    current_question = None
+            elif current_section == 'passage':
+                if line:
+                    test_data['passage'] += line + '\n'
+            elif current_section == 'question' and current_question:
+                if line.startswith('①') or line.startswith('②') or line.startswith('③') or line.startswith('④') or line.startswith('⑤'):
+                    current_question['options'].append(line[1:].strip())
+                elif line and not line.startswith('='):
+                    current_question['content'] += line + '\n'
+        
+        # 마지막 문제가 해설 없이 끝나는 경우 처리
+        if current_question:
+            test_data['questions'].append(current_question)
+        
+        test_data['question_count'] = len(test_data['questions'])
+        return test_data
+        
+    except Exception as e:
+        print(f"Load nonfiction test error: {str(e)}")
+        return None
+
+def save_nonfiction_result(user_id, test_id, answers, score, duration, test_title):
+    """비문학 모의고사 결과를 파일로 저장"""
+    try:
+        results_dir = os.path.join('모의고사', 'results')
+        os.makedirs(results_dir, exist_ok=True)
+        
+        # Generate result ID
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        result_id = f"result_{timestamp}_{user_id}_{test_id}"
+        
+        result_data = {
+            'result_id': result_id,
+            'user_id': user_id,
+            'test_id': test_id,
+            'test_title': test_title,
+            'answers': answers,
+            'score': score,
+            'duration': duration,
+            'completed_at': datetime.now().isoformat()
+        }
+        
+        filepath = os.path.join(results_dir, f"{result_id}.txt")
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(f"=== 비문학 모의고사 결과 ===\n")
+            f.write(f"결과 ID: {result_id}\n")
+            f.write(f"사용자 ID: {user_id}\n")
+            f.write(f"문제 ID: {test_id}\n")
+            f.write(f"문제 제목: {test_title}\n")
+            f.write(f"점수: {score}점\n")
+            f.write(f"소요시간: {duration}분\n")
+            f.write(f"완료시간: {result_data['completed_at']}\n")
+            f.write(f"\n=== 답안 ===\n")
+            for question_num, answer in answers.items():
+                f.write(f"문제 {question_num}: {answer}번\n")
+        
+        return result_id
+        
+    except Exception as e:
+        print(f"Save nonfiction result error: {str(e)}")
+        return None
+
+def load_nonfiction_result(result_id):
+    """비문학 모의고사 결과를 로드"""
+    try:
+        results_dir = os.path.join('모의고사', 'results')
+        filepath = os.path.join(results_dir, f"{result_id}.txt")
+        
+        if not os.path.exists(filepath):
+            return None
+        
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+        metrics.inc(metrics.FILE_PARSES, store='nonfiction_result')
+        
+        # Parse result data
+        lines = content.split('\n')
+        result_data = {
+            'result_id': result_id,
+            'answers': {}
+        }
+        
+        for line in lines:
+            if line.startswith('사용자 ID: '):
+                result_data['user_id'] = int(line.replace('사용자 ID: ', ''))
+            elif line.startswith('문제 ID: '):
+                result_data['test_id'] = line.replace('문제 ID: ', '')
+            elif line.startswith('문제 제목: '):
+                result_data['test_title'] = line.replace('문제 제목: ', '')
+            elif line.startswith('점수: '):
+                result_data['score'] = int(line.replace('점수: ', '').replace('점', ''))
+            elif line.startswith('소요시간: '):
+                result_data['duration'] = int(line.replace('소요시간: ', '').replace('분', ''))
+            elif line.startswith('완료시간: '):
+                result_data['completed_at'] = line.replace('완료시간: ', '')
+            elif line.startswith('문제 ') and ': ' in line:
+                parts = line.split(': ')
+                question_num = parts[0].replace('문제 ', '')
+                answer = int(parts[1].replace('번', ''))
+                result_data['answers'][question_num] = answer
+        
+        return result_data
+        
+    except Exception as e:
+        print(f"Load nonfiction result error: {str(e)}")
+        return None
+
+def load_user_nonfiction_results(user_id):
+    """사용자의 모든 비문학 모의고사 결과를 로드"""
+    try:
+        results_dir = os.path.join('모의고사', 'results')
+        if not os.path.exists(results_dir):
+            return []
+        
+        user_results = []
+        for filename in os.listdir(results_dir):
+            if filename.endswith(f'_{user_id}_') or filename.endswith(f'_{user_id}.txt'):
+                result_data = load_nonfiction_result(filename.replace('.txt', ''))
+                if result_data:
+                    user_results.append(result_data)
+        
+        # Sort by completion time (newest first)
+        user_results.sort(key=lambda x: x.get('completed_at', ''), reverse=True)
+        return user_results
+        
+    except Exception as e:
+        print(f"Load user nonfiction results error: {str(e)}")
+        return []
+
+def save_nonfiction_test_with_images(test_data):
+    """이미지가 포함된 비문학 모의고사를 파일로 저장"""
+    try:
+        tests_dir = '모의고사'
+        os.makedirs(tests_dir, exist_ok=True)
+        
+        test_id = test_data['id']
+        filepath = os.path.join(tests_dir, f"{test_id}.txt")
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(f"제목: {test_data['title']}\n")
+            f.write(f"설명: {test_data['description']}\n")
+            f.write(f"지문이미지: {test_data['passage_image']}\n")
+            f.write(f"\n=== 지문 ===\n")
+            f.write(f"이미지 파일로 제공\n")
+            
+            for question in test_data['questions']:
+                f.write(f"\n=== 문제 {question['number']}번 ===\n")
+                f.write(f"문제이미지: {question['image_path']}\n")
+                f.write(f"정답: {question['correct_answer']}\n")
+                if question.get('explanation'):
+                    f.write(f"해설: {question['explanation']}\n")
+        
+        return True
+        
+    except Exception as e:
+        print(f"Save nonfiction test with images error: {str(e)}")
+        return False
+
+def save_nonfiction_test(test_data):
+    """비문학 모의고사를 파일로 저장"""
+    try:
+        tests_dir = '모의고사'
+        os.makedirs(tests_dir, exist_ok=True)
+        
+        test_id = test_data['id']
+        filepath = os.path.join(tests_dir, f"{test_id}.txt")
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(f"제목: {test_data['title']}\n")
+            f.write(f"설명: {test_data['description']}\n")
+            f.write(f"\n=== 지문 ===\n")
+            f.write(f"{test_data['passage']}\n")
+            
+            for i, question in enumerate(test_data['questions'], 1):
+                f.write(f"\n=== 문제 {i}번 ===\n")
+                f.write(f"{question['content']}\n")
+                for j, option in enumerate(question['options'], 1):
+                    f.write(f"{'①②③④⑤'[j-1]} {option}\n")
+                f.write(f"정답: {question['correct_answer']}\n")
+                if question.get('explanation'):
+                    f.write(f"해설: {question['explanation']}\n")
+        
+        return True
+        
+    except Exception as e:
+        print(f"Save nonfiction test error: {str(e)}")
+        return False
@@ -0,0 +1,155 @@
+"""반정적 페이지/조각 캐시
+
+학생마다 똑같이 다시 조회·렌더링하던 화면(첫 화면, 공지사항, 고전어휘, 비문학 목록,
+내신 자료 등)의 렌더링 결과를 (라우트, 조각 이름, 대상)별로 보관합니다.
+대상은 관리자/회원/비회원이며, 캐시 값에는 렌더링할 때의 데이터 버전 스탬프가 함께
+저장되어 관리자가 데이터를 고치면(data_version.bump) 다음 요청에서 다시 렌더링됩니다.
+
+- 워커 메모리에 먼저 보관하고, instance/page_cache/ 파일에도 써서 다른 워커가 공유합니다.
+- 템플릿에서는 {% cache '이름', 스탬프... %} ... {% endcache %}로 조각을 감쌉니다.
+  내비게이션, 플래시 메시지, CSRF 토큰처럼 사용자마다 다른 부분은 캐시 밖에 둡니다.
+- 무거운 조회는 loader()로 감싸 템플릿 안(캐시 조각 안)에서 호출하면, 캐시가
+  맞았을 때는 조회하지 않습니다.
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+from flask import current_app, request
+from flask_login import current_user
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+import data_version
+import metrics
+
+KOREAN_VOCABULARY = 'korean_vocabulary'   # similarity.korean_added/removed에서 올림
+ANNOUNCEMENTS = 'announcements'           # announcement_cache.invalidate에서 올림
+PDF_RESOURCES = 'pdf_resources'
+NONFICTION_TESTS = 'nonfiction_tests'
+
+MEMORY_ENTRIES = 256
+
+_directory = None
+_memory = OrderedDict()   # key -> (스탬프 해시, html)
+_lock = threading.Lock()
+
+
+def init_app(app):
+    global _directory
+    app.config.setdefault('PAGE_CACHE', True)
+    _directory = app.config.setdefault('PAGE_CACHE_DIR', os.path.join(app.instance_path, 'page_cache'))
+    # 파일 캐시는 여기서 비우지 않음 (CLI나 uvicorn 워커의 create_app이 실행 중인 워커의 캐시를 지움)
+    os.makedirs(_directory, exist_ok=True)
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    app.jinja_env.globals['data_version'] = data_version.get
+
+
+def clear():
+    """파일/메모리 캐시 비우기. 배포/재시작 사이에 데이터가 직접 바뀌었을 수 있으므로 서버를
+    시작하기 전에 한 번 호출 (gunicorn when_ready, flask clear-runtime)
+    """
+    if _directory is None:
+        return
+    shutil.rmtree(_directory, ignore_errors=True)
+    os.makedirs(_directory, exist_ok=True)
+    with _lock:
+        _memory.clear()
+
+
+def audience():
+    if not current_user or not current_user.is_authenticated:
+        return 'guest'
+    return 'admin' if current_user.is_admin else 'member'
+
+
+def invalidate(*names):
+    """관리자가 데이터를 수정한 뒤 호출 (모든 워커의 해당 캐시 무효화)"""
+    for name in names:
+        data_version.bump(name)
+
+
+def loader(func):
+    """한 요청 안에서 한 번만 실행되는 지연 조회 (캐시가 맞으면 실행되지 않음)"""
+    result = []
+
+    def load():
+        if not result:
+            result.append(func())
+        return result[0]
+    return load
+
+
+def _key(name):
+    view_args = sorted((request.view_args or {}).items())
+    raw = repr((request.endpoint, view_args, name, audience()))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _read_file(key, stamp):
+    try:
+        with open(os.path.join(_directory, key + '.html'), encoding='utf-8') as f:
+            if f.readline().rstrip('\n') != stamp:
+                return None
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _write_file(key, stamp, html):
+    fd, tmp = tempfile.mkstemp(dir=_directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(stamp + '\n' + html)
+    os.replace(tmp, os.path.join(_directory, key + '.html'))
+
+
+def fragment(name, stamp, render):
+    """(라우트, name, 대상)별 렌더링 결과. stamp가 바뀌었으면 render()로 다시 만듦"""
+    if not current_app.config.get('PAGE_CACHE', True) or _directory is None:
+        return render()
+    key = _key(name)
+    stamp = hashlib.sha1(repr(stamp).encode('utf-8')).hexdigest()
+
+    with _lock:
+        cached = _memory.get(key)
+        if cached and cached[0] == stamp:
+            _memory.move_to_end(key)
+            metrics.cache_result('page', True)
+            return Markup(cached[1])
+
+    html = _read_file(key, stamp)
+    metrics.cache_result('page', html is not None)
+    if html is None:
+        html = str(render())
+        try:
+            _write_file(key, stamp, html)
+        except OSError as e:
+            print(f"Page cache write error: {str(e)}")
+
+    with _lock:
+        _memory[key] = (stamp, html)
+        _memory.move_to_end(key)
+        while len(_memory) > MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+    return Markup(html)
+
+
+class FragmentCacheExtension(Extension):
+    """{% cache '이름', 스탬프... %} ... {% endcache %}"""
+    tags = {'cache'}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        while parser.stream.skip_if('comma'):
+            args.append(parser.parse_expression())
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        call = self.call_method('_render', [args[0], nodes.List(args[1:])])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render(self, name, stamp, caller):
+        return fragment(name, stamp, caller)
@@ -0,0 +1,266 @@
+"""PDF 본문 전문 검색 (SQLite FTS5)
+
+업로드된 PDF에서 텍스트를 추출해 FTS5 색인에 저장합니다.
+한국어는 띄어쓰기/조사 때문에 단어 단위 토크나이저로는 검색이 잘 안 되므로
+한글/한자 구간은 글자 2-gram으로 펼쳐서 색인하고, 영문/숫자는 단어 단위로 색인합니다.
+"""
+import html
+import logging
+import os
+import queue
+import re
+import threading
+import time
+
+import click
+from sqlalchemy import text
+
+from extensions import db
+
+INDEX_TABLE = 'pdf_search_index'
+SNIPPET_RADIUS = 60
+
+_CJK_RUN = re.compile(r'[ᄀ-ᇿ㄰-㆏가-힯一-鿿]+')
+_WORD = re.compile(r'[0-9a-z]+')
+
+_app = None
+_jobs = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+_index_ready = False   # 이 프로세스에서 색인 테이블을 확인했는지
+
+
+def bigram_tokens(value):
+    """문자열을 색인용 토큰 목록으로 변환 (한글/한자는 2-gram, 영문/숫자는 단어)"""
+    tokens = []
+    if not value:
+        return tokens
+    value = value.lower()
+    pos = 0
+    for match in _CJK_RUN.finditer(value):
+        tokens.extend(_WORD.findall(value[pos:match.start()]))
+        run = match.group()
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        pos = match.end()
+    tokens.extend(_WORD.findall(value[pos:]))
+    return tokens
+
+
+def _to_index_text(value):
+    return ' '.join(bigram_tokens(value))
+
+
+def _to_match_query(query):
+    """사용자 검색어를 FTS5 MATCH 식으로 변환 (모든 토큰 AND)"""
+    terms = []
+    for token in bigram_tokens(query):
+        quoted = '"%s"' % token.replace('"', '""')
+        # 한 글자 검색어는 해당 글자로 시작하는 2-gram 전체와 매칭
+        if len(token) == 1 and _CJK_RUN.match(token):
+            quoted += '*'
+        if quoted not in terms:
+            terms.append(quoted)
+    return ' '.join(terms)
+
+
+def is_supported():
+    """현재 데이터베이스에서 FTS5 검색을 사용할 수 있는지 여부"""
+    return db.engine.dialect.name == 'sqlite'
+
+
+def ensure_index():
+    """FTS5 가상 테이블 생성 (이미 있으면 무시)"""
+    if not is_supported():
+        return False
+    with db.engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {INDEX_TABLE} USING fts5("
+            "resource_id UNINDEXED, raw UNINDEXED, title, body, "
+            "tokenize = 'unicode61 remove_diacritics 0')"
+        ))
+    return True
+
+
+def _ensure_index_once():
+    """처음 검색/색인할 때 한 번만 테이블 확인 (워커 시작 시 쿼리하지 않음)"""
+    global _index_ready
+    if not _index_ready:
+        _index_ready = ensure_index()
+
+
+def extract_text(file_path):
+    """PDF 파일에서 텍스트 추출 (순수 파이썬 pypdf 사용)"""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        logging.warning("pypdf가 설치되어 있지 않아 PDF 본문을 색인하지 않습니다.")
+        return ''
+
+    try:
+        reader = PdfReader(file_path)
+        pages = []
+        for page in reader.pages:
+            pages.append(page.extract_text() or '')
+        return ' '.join(' '.join(pages).split())
+    except Exception as e:
+        logging.warning("PDF 텍스트 추출 실패 (%s): %s", file_path, e)
+        return ''
+
+
+def index_resource(resource):
+    """PDFResource 하나를 색인 (기존 항목은 교체)"""
+    file_path = os.path.join(_app.config['UPLOAD_FOLDER'], resource.filename)
+    body = extract_text(file_path) if os.path.exists(file_path) else ''
+    with db.engine.begin() as conn:
+        conn.execute(text(f"DELETE FROM {INDEX_TABLE} WHERE resource_id = :id"), {'id': resource.id})
+        conn.execute(
+            text(f"INSERT INTO {INDEX_TABLE} (resource_id, raw, title, body) "
+                 "VALUES (:id, :raw, :title, :body)"),
+            {
+                'id': resource.id,
+                'raw': body,
+                'title': _to_index_text(f"{resource.title} {resource.subject}"),
+                'body': _to_index_text(body),
+            }
+        )
+
+
+def remove_resource(resource_id):
+    """색인에서 PDFResource 제거"""
+    with db.engine.begin() as conn:
+        conn.execute(text(f"DELETE FROM {INDEX_TABLE} WHERE resource_id = :id"), {'id': resource_id})
+
+
+def reindex_all():
+    """모든 PDFResource를 처음부터 다시 색인하고 색인된 개수를 반환"""
+    from models import PDFResource
+
+    if not ensure_index():
+        return 0
+    with db.engine.begin() as conn:
+        conn.execute(text(f"DELETE FROM {INDEX_TABLE}"))
+    count = 0
+    for resource in PDFResource.query.order_by(PDFResource.id).yield_per(100):
+        index_resource(resource)
+        count += 1
+    with db.engine.begin() as conn:
+        conn.execute(text(f"INSERT INTO {INDEX_TABLE}({INDEX_TABLE}) VALUES ('optimize')"))
+    return count
+
+
+def _make_snippet(raw, query):
+    """원문에서 검색어 주변을 잘라 하이라이트된 HTML 조각을 만듦"""
+    if not raw:
+        return ''
+    lowered = raw.lower()
+    words = [w for w in query.lower().split() if w]
+    hit = -1
+    for word in words:
+        hit = lowered.find(word)
+        if hit != -1:
+            break
+    if hit == -1:
+        # 띄어쓰기가 다른 경우 첫 2-gram 위치로 대체
+        for token in bigram_tokens(query):
+            hit = lowered.find(token)
+            if hit != -1:
+                break
+    if hit == -1:
+        hit = 0
+
+    start = max(0, hit - SNIPPET_RADIUS)
+    end = min(len(raw), hit + SNIPPET_RADIUS)
+    text_part = raw[start:end]
+    parts, last = [], 0
+    if words:
+        # 원문에서 일치 구간을 찾은 뒤 구간별로 escape (escape한 HTML에 다시 치환하면 태그/엔티티가 깨짐)
+        pattern = re.compile('|'.join(re.escape(w) for w in sorted(set(words), key=len, reverse=True)),
+                             re.IGNORECASE)
+        for m in pattern.finditer(text_part):
+            parts.append(html.escape(text_part[last:m.start()]))
+            parts.append(f"<mark>{html.escape(m.group())}</mark>")
+            last = m.end()
+    parts.append(html.escape(text_part[last:]))
+    return ('…' if start > 0 else '') + ''.join(parts) + ('…' if end < len(raw) else '')
+
+
+def search(query, limit=20):
+    """검색어로 PDF를 찾아 관련도 순으로 반환"""
+    match = _to_match_query(query)
+    if not match or not is_supported():
+        return []
+    _ensure_index_once()
+
+    # bm25 가중치: resource_id, raw(미색인), title, body 순서
+    rows = db.session.execute(
+        text(f"SELECT resource_id, raw, bm25({INDEX_TABLE}, 0.0, 0.0, 5.0, 1.0) AS score "
+             f"FROM {INDEX_TABLE} WHERE {INDEX_TABLE} MATCH :match "
+             "ORDER BY score LIMIT :limit"),
+        {'match': match, 'limit': limit}
+    ).fetchall()
+    return [
+        {'resource_id': int(row.resource_id), 'score': round(-row.score, 4),
+         'snippet': _make_snippet(row.raw, query)}
+        for row in rows
+    ]
+
+
+def _run_worker():
+    while True:
+        action, payload = _jobs.get()
+        try:
+            with _app.app_context():
+                _ensure_index_once()
+                if action == 'index':
+                    from models import PDFResource
+                    resource = db.session.get(PDFResource, payload)
+                    if resource:
+                        index_resource(resource)
+                elif action == 'remove':
+                    remove_resource(payload)
+                db.session.remove()
+        except Exception as e:
+            logging.error("PDF 색인 작업 실패 (%s %s): %s", action, payload, e)
+        finally:
+            _jobs.task_done()
+
+
+def _ensure_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run_worker, name='pdf-search-indexer', daemon=True)
+            _worker.start()
+
+
+def enqueue_index(resource_id):
+    """업로드된 자료의 색인을 백그라운드로 예약"""
+    if _app is None:
+        return
+    _ensure_worker()
+    _jobs.put(('index', resource_id))
+
+
+def enqueue_remove(resource_id):
+    """삭제된 자료의 색인 제거를 백그라운드로 예약"""
+    if _app is None:
+        return
+    _ensure_worker()
+    _jobs.put(('remove', resource_id))
+
+
+@click.command('reindex-pdfs')
+def reindex_pdfs_command():
+    """PDF 전문 검색 색인 전체 재생성"""
+    started = time.perf_counter()
+    count = reindex_all()
+    click.echo(f"{count}개 PDF를 색인했습니다. ({time.perf_counter() - started:.1f}초)")
+
+
+def init_app(app):
+    global _app
+    _app = app
+    app.cli.add_command(reindex_pdfs_command)
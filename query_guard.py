@@ -0,0 +1,225 @@
+"""요청별 SQL 쿼리 수·DB 시간 집계 (N+1 검사, 쿼리 프로파일)
+
+엔진에 리스너를 달아 요청마다 실행된 쿼리 수와 DB 시간을 g에 모읍니다.
+둘 다 꺼져 있으면 리스너는 플래그만 확인하고 바로 돌아갑니다.
+
+- QUERY_COUNT_GUARD(환경변수 QUERY_COUNT_GUARD=1): 쿼리 수를 X-Query-Count 응답
+  헤더로 돌려줍니다. scripts/check_n_plus_one.py가 데이터 양을 바꿔가며 이 값을 비교합니다.
+- 쿼리 프로파일: 관리자 화면(DB 쿼리 탭)이나 flask query-profile로 실행 중에 켜고 끕니다.
+  켜져 있으면 엔드포인트별 요청/쿼리 수와 DB 시간을 metrics에 더하고, slow_query_ms
+  이상 걸린 문장은 정규화된 SQL과 뷰 이름을 로그에 남기며, server_timing이 켜져 있으면
+  Server-Timing 헤더(db;dur=..;desc="N queries")를 붙입니다. 설정은
+  instance/query_profile.json에 저장하고 'query_profile' 데이터 버전을 올리므로, 모든 워커가
+  다음 요청에서 읽습니다 (요청당 stat 한 번).
+"""
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+import click
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+import data_version
+import metrics
+
+HEADER = 'X-Query-Count'
+STARTED = 'query_guard_started'   # connection.info 키 (실행 중인 문장의 시작 시각 스택)
+MAX_LOGGED_SQL = 2000
+VERSION_NAME = 'query_profile'
+
+logger = logging.getLogger(__name__)
+
+_guard = False
+_defaults = {'enabled': False, 'server_timing': True, 'slow_query_ms': 200}
+_settings = dict(_defaults)
+_settings_file = None
+_seen_version = None
+_lock = threading.Lock()
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\bIN \((?:\?|%s|%\(\w+\)s|:\w+)(?:, ?(?:\?|%s|%\(\w+\)s|:\w+))*\)", re.IGNORECASE)
+
+
+def normalize(statement):
+    """로그용 SQL (리터럴은 ?로, IN 목록은 하나로, 공백은 한 칸으로)"""
+    sql = _STRING.sub('?', statement)
+    sql = _NUMBER.sub('?', sql)
+    sql = _SPACE.sub(' ', sql).strip()
+    return _IN_LIST.sub('IN (?...)', sql)
+
+
+def settings():
+    return dict(_settings)
+
+
+def _sync_settings():
+    """다른 워커(또는 flask query-profile)가 바꾼 설정 읽기 ('query_profile' 데이터 버전이 바뀌었을 때만)"""
+    global _settings, _seen_version
+    version = data_version.get(VERSION_NAME)
+    if version == _seen_version:
+        return
+    loaded = dict(_defaults)
+    try:
+        with open(_settings_file, encoding='utf-8') as f:
+            loaded.update({key: value for key, value in json.load(f).items() if key in _defaults})
+    except FileNotFoundError:
+        pass
+    except (TypeError, OSError, ValueError) as e:
+        logger.warning("Query profile settings error: %s", e)
+    with _lock:
+        _settings = loaded
+        _seen_version = version
+
+
+def update_settings(**changes):
+    """설정을 바꾸고 모든 워커에 알림 (enabled, server_timing, slow_query_ms)"""
+    global _settings, _seen_version
+    _sync_settings()
+    with _lock:
+        updated = dict(_settings)
+        updated.update({key: value for key, value in changes.items() if key in _defaults and value is not None})
+        updated['enabled'] = bool(updated['enabled'])
+        updated['server_timing'] = bool(updated['server_timing'])
+        updated['slow_query_ms'] = max(0, int(updated['slow_query_ms']))
+        if _settings_file:
+            tmp_path = f'{_settings_file}.{os.getpid()}.{threading.get_ident()}'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(updated, f)
+            os.replace(tmp_path, _settings_file)
+        _settings = updated
+    data_version.bump(VERSION_NAME)
+    with _lock:
+        _seen_version = data_version.get(VERSION_NAME)
+    return dict(updated)
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    if _guard or _settings['enabled']:
+        conn.info.setdefault(STARTED, []).append(time.perf_counter())
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get(STARTED)
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    in_request = has_request_context()
+    if in_request:
+        g.query_count = g.get('query_count', 0) + 1
+        g.query_time = g.get('query_time', 0.0) + elapsed
+    if _settings['enabled'] and elapsed * 1000 >= _settings['slow_query_ms']:
+        view = (request.endpoint or 'unmatched') if in_request else '-'
+        if in_request:
+            g.slow_queries = g.get('slow_queries', 0) + 1
+        logger.warning("Slow query %.1fms in %s: %s", elapsed * 1000, view,
+                       normalize(statement)[:MAX_LOGGED_SQL])
+
+
+def _on_error(context):
+    # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각을 버림
+    connection = context.connection
+    started = connection.info.get(STARTED) if connection is not None else None
+    if started:
+        started.pop()
+
+
+def _before_request():
+    _sync_settings()
+
+
+def _after_request(response):
+    if _guard:
+        response.headers[HEADER] = str(g.get('query_count', 0))
+    if _settings['enabled']:
+        endpoint = request.endpoint or 'unmatched'
+        count, seconds = g.get('query_count', 0), g.get('query_time', 0.0)
+        metrics.inc(metrics.DB_REQUESTS, endpoint=endpoint)
+        metrics.inc(metrics.DB_QUERIES, count, endpoint=endpoint)
+        metrics.inc(metrics.DB_SECONDS, seconds, endpoint=endpoint)
+        if g.get('slow_queries'):
+            metrics.inc(metrics.DB_SLOW_QUERIES, g.slow_queries, endpoint=endpoint)
+        if _settings['server_timing']:
+            response.headers.add('Server-Timing', f'db;dur={seconds * 1000:.1f};desc="{count} queries"')
+    return response
+
+
+def summary():
+    """엔드포인트별 쿼리 요약 (모든 워커 합계, 요청당 쿼리 수가 많은 순)
+
+    metrics에 쌓인 값을 쓰므로 METRICS가 꺼져 있으면 비어 있습니다.
+    """
+    counters, _ = metrics.collect()
+    fields = {
+        metrics.DB_REQUESTS: 'requests',
+        metrics.DB_QUERIES: 'queries',
+        metrics.DB_SECONDS: 'db_seconds',
+        metrics.DB_SLOW_QUERIES: 'slow_queries',
+    }
+    rows = {}
+    for (name, labels), value in counters.items():
+        field = fields.get(name)
+        if field is None:
+            continue
+        endpoint = dict(labels).get('endpoint', 'unmatched')
+        row = rows.setdefault(endpoint, {'requests': 0, 'queries': 0, 'db_seconds': 0.0, 'slow_queries': 0})
+        row[field] += value
+
+    items = []
+    for endpoint, row in rows.items():
+        served = row['requests'] or 1
+        items.append({
+            'endpoint': endpoint,
+            'requests': row['requests'],
+            'queries': row['queries'],
+            'queries_per_request': round(row['queries'] / served, 2),
+            'db_ms': round(row['db_seconds'] * 1000, 1),
+            'db_ms_per_request': round(row['db_seconds'] * 1000 / served, 2),
+            'slow_queries': row['slow_queries'],
+        })
+    items.sort(key=lambda item: (item['queries_per_request'], item['queries']), reverse=True)
+    return items
+
+
+@click.command('query-profile')
+@click.argument('state', required=False, type=click.Choice(['on', 'off']))
+@click.option('--slow-ms', type=int, help='느린 쿼리 기준 (ms)')
+@click.option('--server-timing/--no-server-timing', default=None, help='Server-Timing 헤더')
+def query_profile_command(state, slow_ms, server_timing):
+    """쿼리 프로파일 켜기/끄기 (실행 중인 워커에도 바로 적용)"""
+    enabled = None if state is None else state == 'on'
+    current = update_settings(enabled=enabled, slow_query_ms=slow_ms, server_timing=server_timing)
+    click.echo(f"쿼리 프로파일: {'켜짐' if current['enabled'] else '꺼짐'}, "
+               f"느린 쿼리 {current['slow_query_ms']}ms, "
+               f"Server-Timing {'켜짐' if current['server_timing'] else '꺼짐'}")
+
+
+def init_app(app, db):
+    global _guard, _settings_file, _seen_version
+    _guard = app.config.setdefault('QUERY_COUNT_GUARD', os.environ.get('QUERY_COUNT_GUARD') == '1')
+    # 설정 파일이 없을 때의 기본값 (QUERY_PROFILE=1이면 처음부터 켬)
+    _defaults['enabled'] = app.config.setdefault('QUERY_PROFILE', os.environ.get('QUERY_PROFILE') == '1')
+    _defaults['server_timing'] = app.config.setdefault('QUERY_PROFILE_SERVER_TIMING', True)
+    _defaults['slow_query_ms'] = app.config.setdefault(
+        'SLOW_QUERY_MS', int(os.environ.get('SLOW_QUERY_MS', _defaults['slow_query_ms'])))
+    _settings_file = app.config.setdefault(
+        'QUERY_PROFILE_FILE', os.path.join(app.instance_path, 'query_profile.json'))
+    os.makedirs(os.path.dirname(_settings_file), exist_ok=True)
+    _seen_version = None   # 아래 호출에서 반드시 읽음
+    _sync_settings()
+
+    with app.app_context():
+        engine = db.engine
+    for name, listener in (('before_cursor_execute', _before_execute),
+                           ('after_cursor_execute', _after_execute),
+                           ('handle_error', _on_error)):
+        if not event.contains(engine, name, listener):
+            event.listen(engine, name, listener)
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.cli.add_command(query_profile_command)
@@ -0,0 +1,174 @@
+"""서버에서 출제·채점하는 어휘 퀴즈
+
+문제 단어는 id 범위에서 무작위로 뽑고(ORDER BY RANDOM() 없이), 오답 보기는
+similarity 색인에서 뜻이 비슷한 단어를 우선 사용합니다. 정답표는 QuizAttempt에
+저장해 브라우저에는 단어와 보기만 보냅니다.
+"""
+import math
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import raiseload
+
+import leaderboard
+import similarity
+from extensions import db
+
+QUIZ_TYPES = ('korean', 'english')
+MIN_WORDS = 3
+DEFAULT_QUESTIONS = 20
+MAX_QUESTIONS = 50
+DISTRACTORS = 3
+FILLER_OPTIONS = ['다른 의미', '관련 없는 뜻', '비슷한 단어', '다른 표현']
+ATTEMPT_TTL = timedelta(days=1)
+
+# 채점 결과별 SM-2 복습 품질 점수 (영어 단어장만 일정을 관리)
+REVIEW_QUALITY = {'correct': 4, 'wrong': 1, 'skipped': 0}
+
+DENSE_RATIO = 4   # 행 수가 id 범위의 1/4 이상이면 id 범위에서 직접 뽑음
+MAX_ROUNDS = 5
+SKIPPED = -1
+
+
+def word_source(quiz_type, user_id):
+    """퀴즈 유형별 (모델, 조건) 반환 (잘못된 유형이면 (None, None))"""
+    from models import KoreanVocabulary, VocabularyWord
+    if quiz_type == 'korean':
+        return KoreanVocabulary, []
+    if quiz_type == 'english':
+        return VocabularyWord, [VocabularyWord.user_id == user_id, VocabularyWord.language == 'en']
+    return None, None
+
+
+def count_words(model, criteria):
+    return db.session.query(db.func.count(model.id)).filter(*criteria).scalar()
+
+
+def sample_ids(model, criteria, k, rng=random):
+    """조건에 맞는 행 중 k개의 id를 무작위 순서로 반환"""
+    id_column = model.id
+    low, high, total = db.session.query(
+        db.func.min(id_column), db.func.max(id_column), db.func.count(id_column)
+    ).filter(*criteria).one()
+    if not total:
+        return []
+    k = min(k, total)
+    span = high - low + 1
+
+    picked = []
+    if total * DENSE_RATIO >= span:
+        # id가 촘촘하면 범위에서 후보를 뽑아 존재하는 것만 기본키로 확인
+        seen = set()
+        for _ in range(MAX_ROUNDS):
+            need = k - len(picked)
+            if need <= 0:
+                break
+            tries = min(span, math.ceil(need * span / total * 1.5) + DISTRACTORS)
+            candidates = [i for i in rng.sample(range(low, high + 1), tries) if i not in seen]
+            seen.update(candidates)
+            found = {row[0] for row in db.session.query(id_column).filter(id_column.in_(candidates), *criteria)}
+            picked.extend(i for i in candidates if i in found)
+        if len(picked) >= k:
+            return picked[:k]
+
+    # id가 드문드문하면(사용자별 단어장 등) 인덱스에서 id만 읽어 뽑음
+    chosen = set(picked)
+    rest = [row[0] for row in db.session.query(id_column).filter(*criteria) if row[0] not in chosen]
+    return picked + rng.sample(rest, k - len(picked))
+
+
+def create_attempt(user_id, quiz_type, n, rng=random):
+    """문제를 출제하고 (QuizAttempt, 브라우저용 문제 목록) 반환 (커밋은 호출한 쪽에서)
+
+    단어가 MIN_WORDS개보다 적으면 (None, [])를 반환합니다.
+    """
+    from models import QuizAttempt, VocabularyWord
+    model, criteria = word_source(quiz_type, user_id)
+
+    due_ids = []
+    if model is VocabularyWord:
+        # 복습할 때가 된 단어부터 출제
+        due_ids = [row.id for row in VocabularyWord.due_query(user_id, language='en')
+                   .with_entities(VocabularyWord.id).limit(n)]
+    due_set = set(due_ids)
+    pool_ids = due_ids + [i for i in sample_ids(model, criteria, n * (1 + DISTRACTORS), rng) if i not in due_set]
+    if len(pool_ids) < MIN_WORDS:
+        return None, []
+
+    rows = {w.id: w for w in model.query.options(raiseload('*')).filter(model.id.in_(pool_ids))}
+    pool = [rows[i] for i in pool_ids if i in rows]
+    meanings = list(dict.fromkeys(w.meaning for w in pool))
+
+    question_words = pool[:n]
+    rng.shuffle(question_words)
+
+    # 뜻이 비슷한 단어를 오답 보기로 우선 사용 (색인을 못 쓰면 무작위)
+    neighbors = similarity.neighbor_ids(quiz_type, user_id, [w.id for w in question_words])
+    known = {w.id: w.meaning for w in pool}
+    extra_ids = {i for ids in neighbors.values() for i in ids} - known.keys()
+    if extra_ids:
+        known.update(db.session.query(model.id, model.meaning).filter(model.id.in_(extra_ids)).all())
+
+    questions, word_ids, answers = [], [], []
+    for word in question_words:
+        similar = (known[i] for i in neighbors.get(word.id, []) if i in known)
+        wrong = list(dict.fromkeys(m for m in similar if m != word.meaning))[:DISTRACTORS]
+        others = [m for m in meanings if m != word.meaning and m not in wrong]
+        wrong += rng.sample(others, min(DISTRACTORS - len(wrong), len(others)))
+        wrong += [f for f in FILLER_OPTIONS if f != word.meaning][:DISTRACTORS - len(wrong)]
+        options = wrong + [word.meaning]
+        rng.shuffle(options)
+        questions.append({'word': word.word, 'options': options})
+        word_ids.append(word.id)
+        answers.append(options.index(word.meaning))
+
+    # 끝내지 않고 버려진 지난 퀴즈 정리
+    QuizAttempt.query.filter(QuizAttempt.user_id == user_id,
+                             QuizAttempt.created_at < datetime.utcnow() - ATTEMPT_TTL).delete()
+
+    attempt = QuizAttempt(user_id=user_id, quiz_type=quiz_type, word_ids=word_ids,
+                          answers=answers, responses=[None] * len(answers))
+    db.session.add(attempt)
+    db.session.flush()
+    return attempt, questions
+
+
+def grade(attempt, index, choice):
+    """한 문제 채점 (choice가 None이면 건너뜀). 마지막 문제면 QuizScore 기록 (커밋은 호출한 쪽에서)
+
+    영어 단어장 퀴즈는 채점 결과로 해당 단어의 복습 일정(SM-2)도 갱신합니다.
+    """
+    from models import QuizScore, VocabularyWord
+    if attempt.completed_at is not None:
+        raise ValueError('이미 끝난 퀴즈입니다.')
+    if not isinstance(index, int) or not 0 <= index < len(attempt.answers):
+        raise ValueError('잘못된 문제 번호입니다.')
+    if attempt.responses[index] is not None:
+        raise ValueError('이미 답한 문제입니다.')
+
+    responses = list(attempt.responses)
+    responses[index] = SKIPPED if choice is None else int(choice)
+    attempt.responses = responses
+
+    answer = attempt.answers[index]
+    result = {'correct': responses[index] == answer, 'answer': answer, 'finished': False}
+
+    model, _ = word_source(attempt.quiz_type, attempt.user_id)
+    if model is VocabularyWord:
+        word = VocabularyWord.query.filter_by(id=attempt.word_ids[index], user_id=attempt.user_id).first()
+        if word:
+            outcome = 'skipped' if choice is None else 'correct' if result['correct'] else 'wrong'
+            word.record_review(REVIEW_QUALITY[outcome])
+
+    if all(r is not None for r in responses):
+        correct = sum(1 for r, a in zip(responses, attempt.answers) if r == a)
+        skipped = responses.count(SKIPPED)
+        attempt.completed_at = datetime.utcnow()
+        score = QuizScore(user_id=attempt.user_id, quiz_type=attempt.quiz_type,
+                          total_questions=len(responses))
+        score.score = correct
+        db.session.add(score)
+        leaderboard.record_quiz(attempt.user_id, attempt.quiz_type, correct, len(responses))
+        result.update(finished=True, score=correct, total=len(responses),
+                      wrong=len(responses) - correct - skipped, skipped=skipped)
+    return result
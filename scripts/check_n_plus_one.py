@@ -0,0 +1,85 @@
+"""GET 라우트의 N+1 쿼리 점검
+
+임시 SQLite 데이터베이스에 샘플 데이터를 작은 규모와 큰 규모(--scale배)로 넣고,
+관리자/일반 사용자로 views/의 모든 GET 라우트를 호출해 요청당 쿼리 수
+(query_guard의 X-Query-Count 헤더)를 비교합니다. 데이터가 늘었을 때 쿼리 수도
+늘어나는 라우트가 있으면 실패(exit 1)합니다.
+
+    python scripts/check_n_plus_one.py [--rows-per-user 20] [--scale 3] [--verbose]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from check_query_plans import collect_get_urls, seed  # noqa: E402
+
+
+def measure(app, urls):
+    """(사용자, endpoint) -> 요청당 쿼리 수"""
+    counts = {}
+    for username in ('admin', 'user2'):
+        client = app.test_client()
+        client.post('/login', data={'username': username, 'password': 'admin123'})
+        for endpoint, url in urls:
+            client.get(url)   # 캐시 등 첫 요청에만 생기는 쿼리 제외
+            response = client.get(url)
+            counts[(username, endpoint)] = int(response.headers.get('X-Query-Count', 0))
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=5)
+    parser.add_argument('--rows-per-user', type=int, default=20)
+    parser.add_argument('--scale', type=int, default=3, help='큰 규모 데이터의 배수')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='wackydocs-nplus1-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'nplus1.db')}"
+    os.environ['QUERY_COUNT_GUARD'] = '1'
+    os.chdir(workdir)
+    sys.path.insert(0, ROOT)
+
+    from app import create_app
+    from extensions import db
+    from user_cache import user_cache
+    import announcement_cache
+
+    app = create_app()
+
+    results = []
+    for rows in (args.rows_per_user, args.rows_per_user * args.scale):
+        with app.app_context():
+            db.drop_all()
+            db.create_all()
+            seed(db, args.users, rows)
+        user_cache.invalidate()
+        announcement_cache.invalidate()
+        app.config['WTF_CSRF_ENABLED'] = False
+        results.append(measure(app, collect_get_urls(app)))
+
+    small, large = results
+    failures = []
+    for key in sorted(small):
+        if args.verbose:
+            print(f"  [{key[0]}] {key[1]}: {small[key]} -> {large[key]}")
+        if large[key] > small[key]:
+            failures.append((key, small[key], large[key]))
+
+    print(f"{len(small)}개 (사용자, 라우트) 점검 (사용자당 {args.rows_per_user}행 -> {args.rows_per_user * args.scale}행)")
+    if failures:
+        print(f"\n데이터 양에 따라 쿼리 수가 늘어나는 라우트 {len(failures)}건:")
+        for (username, endpoint), before, after in failures:
+            print(f"  [{username}] {endpoint}: {before} -> {after}")
+        return 1
+    print("OK: 데이터 양과 무관하게 쿼리 수 일정")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""라우트(views/)의 ORM 쿼리 실행 계획 점검
+
+임시 SQLite 데이터베이스에 대량의 샘플 데이터를 넣고, 관리자/일반 사용자로
+views/의 모든 GET 라우트를 호출하면서 실행된 SELECT 문을 수집합니다.
+각 문장에 EXPLAIN QUERY PLAN을 실행해 큰 테이블(--min-rows 이상)을
+인덱스 없이 전체 스캔하는 쿼리가 있으면 실패(exit 1)합니다.
+
+    python scripts/check_query_plans.py [--min-rows 1000] [--verbose]
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 의도적으로 전체 목록을 읽는 화면 (endpoint, table)
+ALLOWED_SCANS = {
+    ('admin.admin_api_vocab', 'korean_vocabulary'),      # 관리자 어휘 목록 (페이지 단위, 기본키 순)
+    ('admin.admin_api_announcements', 'announcement'),   # 관리자 공지사항 목록 (페이지 단위)
+    ('admin.admin_announcements', 'announcement'),
+    ('study.suneung_korean', 'korean_vocabulary'),       # 고전어휘 수 (페이지 캐시가 비었을 때만)
+    ('vocabulary.vocabulary_quiz', 'korean_vocabulary'),
+}
+
+# 외부 네트워크를 호출하거나 부작용이 있는 라우트
+SKIP_ENDPOINTS = {'static', 'main.assets_file', 'auth.logout', 'vocabulary.get_word_definition', 'resources.download_pdf',
+                  'study.serve_nonfiction_image', 'favicon'}
+
+SAMPLE_ARGS = {
+    'quiz_type': 'english',
+    'word': 'apple',
+    'test_id': 'sample',
+    'result_id': 'sample',
+    'ticket_id': 'sample',
+}
+
+SCAN_RE = re.compile(r'^SCAN (\w+)(.*)$')
+
+
+def seed(db, n_users, rows_per_user):
+    from werkzeug.security import generate_password_hash
+    from models import (User, PDFRequest, PDFResource, KoreanVocabulary, VocabularyWord,
+                        QuizScore, Announcement, FocusSession, LeaderboardEntry, LeaderboardScore)
+
+    now = datetime.utcnow()
+    password_hash = generate_password_hash('admin123')
+    db.session.execute(User.__table__.insert(), [
+        {'id': i, 'username': 'admin' if i == 1 else f'user{i}', 'email': f'user{i}@example.com',
+         'password_hash': password_hash, 'is_admin': i == 1, 'created_at': now}
+        for i in range(1, n_users + 1)
+    ])
+    db.session.execute(KoreanVocabulary.__table__.insert(), [
+        {'word': f'어휘{i}', 'meaning': f'뜻{i}', 'category': '호칭' if i % 5 == 0 else '기타',
+         'difficulty': 'medium', 'created_at': now}
+        for i in range(rows_per_user * 10)
+    ])
+    db.session.execute(PDFResource.__table__.insert(), [
+        {'title': f'자료{i}', 'subject': '국어', 'category': 'suneung' if i % 2 else 'naeshin',
+         'filename': f'{i}.pdf', 'original_filename': f'{i}.pdf', 'file_size': 1,
+         'upload_date': now - timedelta(hours=i), 'uploaded_by': 1, 'download_count': 0}
+        for i in range(rows_per_user * 10)
+    ])
+    db.session.execute(Announcement.__table__.insert(), [
+        {'title': f'공지{i}', 'content': '내용', 'visibility': ('all', 'members', 'non_members')[i % 3],
+         'priority': ('low', 'normal', 'high', 'urgent')[i % 4], 'is_active': i % 10 == 0,
+         'created_by': 1, 'created_at': now - timedelta(hours=i), 'updated_at': now}
+        for i in range(rows_per_user * 10)
+    ])
+    for user_id in range(1, n_users + 1):
+        db.session.execute(PDFRequest.__table__.insert(), [
+            {'user_id': user_id, 'subject': '국어', 'topic': f'주제{i}', 'description': '설명',
+             'status': 'pending' if i == 0 else 'approved', 'requested_at': now - timedelta(days=i)}
+            for i in range(rows_per_user)
+        ])
+        db.session.execute(VocabularyWord.__table__.insert(), [
+            {'user_id': user_id, 'word': f'word{i}', 'meaning': f'meaning{i}', 'language': 'en',
+             'added_at': now - timedelta(hours=i), 'mastery_level': 0}
+            for i in range(rows_per_user)
+        ])
+        db.session.execute(QuizScore.__table__.insert(), [
+            {'user_id': user_id, 'quiz_type': 'english', 'score': i % 10, 'total_questions': 10,
+             'quiz_date': now - timedelta(hours=i)}
+            for i in range(rows_per_user)
+        ])
+        db.session.execute(FocusSession.__table__.insert(), [
+            {'user_id': user_id, 'session_date': date.today() - timedelta(days=i // 3),
+             'focus_minutes': 25, 'completed': True, 'created_at': now - timedelta(hours=i)}
+            for i in range(rows_per_user)
+        ])
+    this_week = date.today() - timedelta(days=date.today().weekday())
+    entries = [
+        {'board': board, 'week': this_week - timedelta(weeks=w), 'user_id': user_id, 'score': (user_id * 7 + w) % 50}
+        for board in ('quiz:english', 'focus')
+        for w in range(max(1, rows_per_user // 10))
+        for user_id in range(1, n_users + 1)
+    ]
+    db.session.execute(LeaderboardEntry.__table__.insert(), entries)
+    histogram = Counter((e['board'], e['week'], e['score']) for e in entries)
+    db.session.execute(LeaderboardScore.__table__.insert(), [
+        {'board': board, 'week': week, 'score': score, 'users': users}
+        for (board, week, score), users in histogram.items()
+    ])
+    db.session.commit()
+
+
+def collect_get_urls(app):
+    urls = []
+    for rule in app.url_map.iter_rules():
+        if 'GET' not in rule.methods or rule.endpoint in SKIP_ENDPOINTS:
+            continue
+        values = {}
+        for arg in rule.arguments:
+            converter = rule._converters[arg].__class__.__name__
+            values[arg] = 1 if converter == 'IntegerConverter' else SAMPLE_ARGS.get(arg, 'sample')
+        with app.test_request_context():
+            from flask import url_for
+            urls.append((rule.endpoint, url_for(rule.endpoint, **values)))
+    return sorted(set(urls))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--min-rows', type=int, default=1000, help='이 행 수 이상이면 큰 테이블로 간주')
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--rows-per-user', type=int, default=200)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='wackydocs-plans-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'plans.db')}"
+    os.chdir(workdir)
+    sys.path.insert(0, ROOT)
+
+    from sqlalchemy import event, text
+    from app import create_app
+    from extensions import db
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        seed(db, args.users, args.rows_per_user)
+
+    from flask import request
+
+    app.config['WTF_CSRF_ENABLED'] = False
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT') and not executemany:
+            endpoint = request.endpoint if request else None
+            captured.append((endpoint, statement, parameters))
+
+    with app.app_context():
+        engine = db.engine
+        table_rows = {
+            name: db.session.execute(text(f'SELECT count(*) FROM "{name}"')).scalar()
+            for name in db.metadata.tables
+        }
+    event.listen(engine, 'before_cursor_execute', capture)
+
+    urls = collect_get_urls(app)
+    for username in ('admin', 'user2'):
+        client = app.test_client()
+        client.post('/login', data={'username': username, 'password': 'admin123'})
+        for endpoint, url in urls:
+            client.get(url)
+    event.remove(engine, 'before_cursor_execute', capture)
+
+    failures = []
+    seen = set()
+    with engine.connect() as conn:
+        for endpoint, statement, parameters in captured:
+            key = (endpoint, statement)
+            if key in seen:
+                continue
+            seen.add(key)
+            plan = conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).fetchall()
+            details = [row[3] for row in plan]
+            if args.verbose:
+                print(f"[{endpoint}] {' '.join(statement.split())[:120]}")
+                for detail in details:
+                    print(f"    {detail}")
+            for detail in details:
+                match = SCAN_RE.match(detail)
+                if not match:
+                    continue
+                table, rest = match.group(1), match.group(2)
+                if 'USING' in rest or 'VIRTUAL TABLE' in rest:
+                    continue
+                if table_rows.get(table, 0) < args.min_rows or (endpoint, table) in ALLOWED_SCANS:
+                    continue
+                failures.append((endpoint, table, detail, statement))
+
+    print(f"{len(urls)}개 라우트, {len(seen)}개 쿼리 점검")
+    if failures:
+        print(f"\n큰 테이블 전체 스캔 {len(failures)}건:")
+        for endpoint, table, detail, statement in failures:
+            print(f"  [{endpoint}] {detail} ({table_rows[table]}행)")
+            print(f"      {' '.join(statement.split())[:200]}")
+        return 1
+    print("OK: 큰 테이블 전체 스캔 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
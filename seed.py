@@ -0,0 +1,95 @@
+"""초기 데이터 (관리자 계정, 고전어휘 예시)
+
+워커가 import할 때마다 실행하던 것을 한 번만 실행하도록 옮겼습니다.
+배포할 때 마이그레이션 다음에 실행하거나, gunicorn.conf.py가 포크 전 마스터에서 실행합니다.
+
+    flask db upgrade && flask init-data
+
+initialize_once()는 instance/init.lock 파일 잠금 안에서 실행하므로 여러 프로세스(워커,
+CLI)가 동시에 불러도 관리자 계정을 두 번 만들지 않습니다 (두 번째는 이미 있어 건너뜀).
+"""
+import os
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from extensions import db
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows 개발 환경 (잠금 없이 실행)
+    fcntl = None
+
+LOCK_FILE = 'init.lock'
+
+ADMIN_USERNAME = 'admin'
+ADMIN_EMAIL = 'admin@wackydocs.com'
+ADMIN_PASSWORD = 'admin123'
+
+# 데이터베이스가 비어 있을 때 넣을 고전어휘 (단어, 뜻, 카테고리)
+SAMPLE_VOCABULARY = []
+
+
+def initialize_data():
+    """관리자 계정과 예시 어휘 생성 (앱 컨텍스트 안에서 호출)"""
+    from models import KoreanVocabulary, User
+    if not User.query.filter_by(username=ADMIN_USERNAME).first():
+        admin_user = User()
+        admin_user.username = ADMIN_USERNAME
+        admin_user.email = ADMIN_EMAIL
+        admin_user.is_admin = True
+        admin_user.set_password(ADMIN_PASSWORD)
+        db.session.add(admin_user)
+        db.session.commit()
+        print(f"관리자 계정이 생성되었습니다: username={ADMIN_USERNAME}, password={ADMIN_PASSWORD}")
+
+    if SAMPLE_VOCABULARY and KoreanVocabulary.query.count() == 0:
+        for word, meaning, category in SAMPLE_VOCABULARY:
+            db.session.add(KoreanVocabulary(word=word, meaning=meaning, category=category))
+        db.session.commit()
+
+
+def initialize_once(app):
+    """파일 잠금을 잡고 initialize_data 실행 후 연결 풀을 닫음 (포크 전 마스터에서 호출 가능)"""
+    os.makedirs(app.instance_path, exist_ok=True)
+    with open(os.path.join(app.instance_path, LOCK_FILE), 'a') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            with app.app_context():
+                initialize_data()
+                db.session.remove()
+                # 포크한 워커들이 마스터의 DB 연결을 나눠 쓰지 않도록 닫음
+                db.engine.dispose()
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+@click.command('init-data')
+@with_appcontext
+def init_data_command():
+    """관리자 계정과 예시 어휘 생성 (이미 있으면 건너뜀)"""
+    initialize_once(current_app._get_current_object())
+
+
+def clear_runtime_files():
+    """이전 실행의 페이지 캐시와 워커별 지표 파일 삭제 (워커가 뜨기 전에만)"""
+    import metrics
+    import page_cache
+    page_cache.clear()
+    metrics.clear()
+
+
+@click.command('clear-runtime')
+@with_appcontext
+def clear_runtime_command():
+    """페이지 캐시와 지표 파일 비우기 (uvicorn/uWSGI로 서버를 시작하기 직전에 실행)"""
+    clear_runtime_files()
+    click.echo("페이지 캐시와 지표 파일을 비웠습니다.")
+
+
+def init_app(app):
+    app.cli.add_command(init_data_command)
+    app.cli.add_command(clear_runtime_command)
@@ -0,0 +1,255 @@
+"""어휘 뜻 유사도 색인 (퀴즈 오답 보기용)
+
+뜻(meaning)을 글자 2/3-gram TF-IDF 벡터(해싱으로 DIM차원)로 만들고, 단어마다
+가장 비슷한 이웃 K개를 행렬(neighbor_ids)에 저장합니다. 조회는 행 하나를 읽는 것입니다.
+
+- 국어 고전어휘(공용): 처음 사용할 때 전체 이웃을 계산하고, 관리자가 어휘를
+  추가/삭제하면 바뀐 행만 다시 계산합니다. 다른 워커는 'korean_vocabulary'
+  데이터 버전이 바뀐 것을 보고 다시 만듭니다.
+- 영어 단어장(사용자별): 단어 수/최대 id가 바뀌면 다시 만들고, 이웃은 처음 조회할 때
+  행 단위로 계산해 채워 둡니다.
+
+NumPy가 없으면 색인을 만들지 않고 퀴즈는 무작위 오답을 사용합니다.
+"""
+import re
+import threading
+import zlib
+from collections import OrderedDict
+
+import data_version
+import lazy_numpy
+from extensions import db
+
+DIM = 512
+K = 10
+NGRAMS = (2, 3)
+CATEGORY_BONUS = 1.0      # 같은 카테고리 단어를 먼저 고르도록 유사도에 더하는 값
+BLOCK_ROWS = 512
+REBUILD_RATIO = 0.2       # 추가/삭제가 이 비율을 넘으면 IDF까지 다시 계산
+USER_CACHE_SIZE = 64
+KOREAN_VERSION = 'korean_vocabulary'
+
+_NON_WORD = re.compile(r'[\d\W_]+')
+
+_korean = None            # (데이터 버전, SimilarityIndex)
+_users = OrderedDict()    # user_id -> ((단어 수, 최대 id), SimilarityIndex)
+_lock = threading.Lock()
+np = None                 # available()에서 가져옴 (lazy_numpy)
+
+
+def available():
+    global np
+    np = lazy_numpy.load('유사 오답 색인')
+    return np is not None
+
+
+def _grams(text):
+    text = ' ' + _NON_WORD.sub(' ', (text or '').lower()).strip() + ' '
+    return [text[i:i + n] for n in NGRAMS for i in range(len(text) - n + 1)]
+
+
+class SimilarityIndex:
+    """id별 뜻 벡터와 이웃 id 행렬"""
+
+    def __init__(self, ids, texts, categories=None, dim=DIM, k=K, precompute=False):
+        self.dim = dim
+        self.k = k
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self._category_codes = {}
+        self.categories = self._encode_categories(categories, len(ids))
+        self.idf = self._idf(texts)
+        self.vectors = self._vectorize(texts)
+        self.neighbor_ids = np.full((len(ids), k), -1, dtype=np.int64)
+        self.neighbor_scores = np.full((len(ids), k), -np.inf, dtype=np.float32)
+        self.computed = np.zeros(len(ids), dtype=bool)
+        self.rows = {int(i): row for row, i in enumerate(self.ids)}
+        self.changes = 0
+        if precompute:
+            for start in range(0, len(ids), BLOCK_ROWS):
+                self._rank(np.arange(start, min(start + BLOCK_ROWS, len(ids))))
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def stale(self):
+        return self.changes > max(50, REBUILD_RATIO * len(self))
+
+    def _encode_categories(self, categories, n):
+        if categories is None:
+            return np.zeros(n, dtype=np.int32)
+        return np.array([self._category_codes.setdefault(c, len(self._category_codes)) for c in categories],
+                        dtype=np.int32)
+
+    def _buckets(self, texts):
+        """(행 번호, 해시 버킷) 배열"""
+        rows, cols = [], []
+        for row, text in enumerate(texts):
+            # str hash()는 프로세스마다 달라지므로(PYTHONHASHSEED) 워커 간에 같은 crc32 사용
+            buckets = [zlib.crc32(g.encode('utf-8')) % self.dim for g in _grams(text)]
+            rows.extend([row] * len(buckets))
+            cols.extend(buckets)
+        return np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+
+    def _idf(self, texts):
+        rows, cols = self._buckets(texts)
+        df = np.zeros(self.dim, dtype=np.float32)
+        if len(rows):
+            # 문서마다 버킷을 한 번만 세기
+            pairs = np.unique(rows * self.dim + cols)
+            df = np.bincount(pairs % self.dim, minlength=self.dim).astype(np.float32)
+        return np.log((1 + len(texts)) / (1 + df)) + 1
+
+    def _vectorize(self, texts):
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        rows, cols = self._buckets(texts)
+        np.add.at(vectors, (rows, cols), 1.0)
+        vectors *= self.idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return vectors / norms
+
+    def _rank(self, rows):
+        """주어진 행들의 이웃을 다시 계산"""
+        n = len(self)
+        k = min(self.k, n - 1)
+        self.neighbor_ids[rows] = -1
+        self.neighbor_scores[rows] = -np.inf
+        self.computed[rows] = True
+        if k <= 0:
+            return
+        scores = self.vectors[rows] @ self.vectors.T
+        scores += CATEGORY_BONUS * (self.categories[rows][:, None] == self.categories[None, :])
+        scores[np.arange(len(rows)), rows] = -np.inf
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        self.neighbor_ids[rows, :k] = self.ids[top]
+        self.neighbor_scores[rows, :k] = np.take_along_axis(top_scores, order, axis=1)
+
+    def neighbors(self, word_id):
+        """비슷한 순서의 이웃 id 목록"""
+        row = self.rows.get(word_id)
+        if row is None:
+            return []
+        if not self.computed[row]:
+            self._rank(np.array([row]))
+        return [int(i) for i in self.neighbor_ids[row] if i >= 0]
+
+    def add(self, word_id, text, category=None):
+        vector = self._vectorize([text])
+        code = self._encode_categories([category], 1) if category is not None else np.zeros(1, dtype=np.int32)
+        self.ids = np.append(self.ids, word_id)
+        self.categories = np.append(self.categories, code)
+        self.vectors = np.vstack([self.vectors, vector])
+        self.neighbor_ids = np.vstack([self.neighbor_ids, np.full((1, self.k), -1, dtype=np.int64)])
+        self.neighbor_scores = np.vstack([self.neighbor_scores, np.full((1, self.k), -np.inf, dtype=np.float32)])
+        self.computed = np.append(self.computed, False)
+        row = len(self.ids) - 1
+        self.rows[int(word_id)] = row
+        self.changes += 1
+
+        # 새 단어가 기존 이웃 K개보다 가까운 행만 다시 계산
+        scores = self.vectors @ vector[0]
+        scores += CATEGORY_BONUS * (self.categories == code[0])
+        affected = np.flatnonzero(self.computed & (scores > self.neighbor_scores[:, -1]))
+        self._rank(np.append(affected[affected != row], row))
+
+    def remove(self, word_id):
+        row = self.rows.get(word_id)
+        if row is None:
+            return
+        keep = np.arange(len(self.ids)) != row
+        self.ids = self.ids[keep]
+        self.categories = self.categories[keep]
+        self.vectors = self.vectors[keep]
+        self.neighbor_ids = self.neighbor_ids[keep]
+        self.neighbor_scores = self.neighbor_scores[keep]
+        self.computed = self.computed[keep]
+        self.rows = {int(i): r for r, i in enumerate(self.ids)}
+        self.changes += 1
+
+        # 삭제된 단어를 이웃으로 가진 행만 다시 계산
+        affected = np.flatnonzero(self.computed & (self.neighbor_ids == word_id).any(axis=1))
+        if len(affected):
+            self._rank(affected)
+
+
+def _build_korean():
+    from models import KoreanVocabulary
+    rows = db.session.query(KoreanVocabulary.id, KoreanVocabulary.meaning, KoreanVocabulary.category).all()
+    return SimilarityIndex([r.id for r in rows], [r.meaning for r in rows],
+                           [r.category for r in rows], precompute=True)
+
+
+def korean_index():
+    """국어 고전어휘 색인 (다른 워커에서 어휘가 바뀌었으면 다시 만듦)"""
+    global _korean
+    if not available():
+        return None
+    version = data_version.get(KOREAN_VERSION)
+    with _lock:
+        if _korean is None or _korean[0] != version or _korean[1].stale:
+            _korean = (version, _build_korean())
+        return _korean[1]
+
+
+def english_index(user_id):
+    """사용자 영어 단어장 색인 (단어 수나 최대 id가 바뀌면 다시 만듦)"""
+    from models import VocabularyWord
+    if not available():
+        return None
+    criteria = (VocabularyWord.user_id == user_id, VocabularyWord.language == 'en')
+    stamp = tuple(db.session.query(db.func.count(VocabularyWord.id), db.func.max(VocabularyWord.id))
+                  .filter(*criteria).one())
+    with _lock:
+        cached = _users.get(user_id)
+        if cached and cached[0] == stamp:
+            _users.move_to_end(user_id)
+            return cached[1]
+    rows = db.session.query(VocabularyWord.id, VocabularyWord.meaning).filter(*criteria).all()
+    index = SimilarityIndex([r.id for r in rows], [r.meaning for r in rows])
+    with _lock:
+        _users[user_id] = (stamp, index)
+        _users.move_to_end(user_id)
+        while len(_users) > USER_CACHE_SIZE:
+            _users.popitem(last=False)
+    return index
+
+
+def neighbor_ids(quiz_type, user_id, word_ids):
+    """단어 id별 비슷한 뜻의 이웃 id 목록 (색인을 쓸 수 없으면 빈 dict)"""
+    index = korean_index() if quiz_type == 'korean' else english_index(user_id) if quiz_type == 'english' else None
+    if index is None:
+        return {}
+    with _lock:
+        return {word_id: index.neighbors(word_id) for word_id in word_ids}
+
+
+def korean_added(vocab):
+    """관리자가 어휘를 추가한 뒤 호출 (커밋 후)"""
+    _korean_changed(lambda index: index.add(vocab.id, vocab.meaning, vocab.category))
+
+
+def korean_removed(vocab_id):
+    """관리자가 어휘를 삭제한 뒤 호출 (커밋 후)"""
+    _korean_changed(lambda index: index.remove(vocab_id))
+
+
+def _korean_changed(update):
+    global _korean
+    with _lock:
+        current = _korean if _korean and _korean[0] == data_version.get(KOREAN_VERSION) else None
+    data_version.bump(KOREAN_VERSION)
+    if current is None:
+        return
+    with _lock:
+        version = data_version.get(KOREAN_VERSION)
+        if version != current[0] + 1:
+            # 그 사이 다른 워커도 어휘를 바꿨으면 다음 조회 때 다시 만듦
+            _korean = None
+            return
+        update(current[1])
+        # 이 워커는 바뀐 행만 반영했으므로 새 버전을 본 것으로 기록
+        _korean = (version, current[1])
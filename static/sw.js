@@ -1,19 +1,59 @@
 // Service Worker for WackyDocs PWA
-const CACHE_NAME = 'wackydocs-v1.0.0';
-const STATIC_CACHE = 'wackydocs-static-v1.0.0';
-const DYNAMIC_CACHE = 'wackydocs-dynamic-v1.0.0';
+// 캐시 이름과 미리 받을 CSS/JS 주소는 /sw.js로 제공할 때 서버가 매니페스트로 채움 (assets.py)
+const ASSET_VERSION = self.ASSET_VERSION || 'dev';
+const ASSET_URLS = self.ASSET_URLS || ['/static/css/style.css', '/static/css/mobile.css', '/static/js/main.js'];
+const CACHE_NAME = `wackydocs-${ASSET_VERSION}`;
+const STATIC_CACHE = `wackydocs-static-${ASSET_VERSION}`;
+const DYNAMIC_CACHE = `wackydocs-dynamic-${ASSET_VERSION}`;
+
+// JSON API는 항상 네트워크로 재검증 (서버가 ETag로 304를 주므로 바뀐 게 없으면 헤더만 오감)
+const API_PREFIXES = ['/api/', '/admin/'];
 
 // Files to cache for offline functionality
 const STATIC_FILES = [
   '/',
-  '/static/css/style.css',
-  '/static/js/main.js',
+  ...ASSET_URLS,
   '/static/manifest.json',
   'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css',
   'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css',
   'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js'
 ];
 
+// 오프라인 사본 (IndexedDB): /api/sync의 변경분만 받아 고전어휘, 내 단어장, 모의고사 목록 갱신
+const SYNC_DB = 'wackydocs-sync';
+const SYNC_STORES = ['korean_vocabulary', 'vocabulary', 'tests'];
+const SYNC_TAG = 'offline-data-sync';
+
+// 오프라인일 때 보내지 못한 기록은 outbox에 쌓았다가 일괄 전송 (멱등 키로 서버가 중복 제거)
+const OUTBOX_TAG = 'outbox-sync';
+const OUTBOX_BATCH = 200;
+// fields(match, body, now): 큐에 넣을 때 본문에 더할 값
+const OUTBOX_ROUTES = [
+  {
+    // 퀴즈 답안은 서버가 채점. 같은 퀴즈의 같은 문제는 같은 키 (서버도 이미 답한 문제는 중복 처리)
+    pattern: /^\/api\/quiz\/(\d+)\/answer$/,
+    kind: 'quiz_answer',
+    batchUrl: '/api/quiz-answers/batch',
+    fields: (match, body) => ({ quiz_id: Number(match[1]), key: `quiz-${match[1]}-${body.index}` })
+  },
+  {
+    pattern: /^\/api\/save-focus-session$/,
+    kind: 'focus_session',
+    batchUrl: '/api/focus-sessions/batch',
+    fields: (match, body, now) => ({ session_date: body.session_date || localDate(now) })
+  }
+];
+
+function outboxRoute(pathname) {
+  for (const route of OUTBOX_ROUTES) {
+    const match = route.pattern.exec(pathname);
+    if (match) {
+      return { route, match };
+    }
+  }
+  return null;
+}
+
 // Routes that should work offline
 const OFFLINE_PAGES = [
   '/',
@@ -63,14 +103,35 @@ self.addEventListener('activate', event => {
         console.log('Service Worker activated');
         return self.clients.claim();
       })
+      .then(() => syncOfflineData())
   );
 });
 
+// 페이지(로그인 상태)에서 온라인일 때 보내는 동기화 요청
+self.addEventListener('message', event => {
+  if (event.data && event.data.type === 'sync-offline-data') {
+    event.waitUntil(flushOutbox().catch(() => {}).then(() => syncOfflineData()));
+  }
+});
+
+self.addEventListener('periodicsync', event => {
+  if (event.tag === SYNC_TAG) {
+    event.waitUntil(syncOfflineData());
+  }
+});
+
 // Fetch event - serve from cache with network fallback
 self.addEventListener('fetch', event => {
   const { request } = event;
   const url = new URL(request.url);
   
+  // 퀴즈 답안/집중 세션 저장: 네트워크가 안 되면 outbox에 넣고 접수됨(202)으로 응답
+  const outbox = request.method === 'POST' && url.origin === self.location.origin && outboxRoute(url.pathname);
+  if (outbox) {
+    event.respondWith(sendOrQueue(request, outbox.route, outbox.match));
+    return;
+  }
+
   // Skip non-GET requests
   if (request.method !== 'GET') {
     return;
@@ -81,6 +142,27 @@ self.addEventListener('fetch', event => {
     return;
   }
   
+  // API: network first (브라우저 HTTP 캐시가 If-None-Match로 재검증), 오프라인이면 마지막 응답
+  if (API_PREFIXES.some(prefix => url.pathname.startsWith(prefix))) {
+    event.respondWith(
+      fetch(request)
+        .then(networkResponse => {
+          if (networkResponse && networkResponse.status === 200) {
+            const responseToCache = networkResponse.clone();
+            caches.open(DYNAMIC_CACHE).then(cache => cache.put(request, responseToCache));
+          }
+          return networkResponse;
+        })
+        .catch(error => caches.match(request).then(cached => {
+          if (cached) {
+            return cached;
+          }
+          throw error;
+        }))
+    );
+    return;
+  }
+  
   event.respondWith(
     caches.match(request)
       .then(cachedResponse => {
@@ -131,8 +213,10 @@ self.addEventListener('fetch', event => {
 self.addEventListener('sync', event => {
   if (event.tag === 'vocabulary-sync') {
     event.waitUntil(syncVocabulary());
-  } else if (event.tag === 'quiz-score-sync') {
-    event.waitUntil(syncQuizScores());
+  } else if (event.tag === OUTBOX_TAG || event.tag === 'quiz-score-sync') {
+    event.waitUntil(flushOutbox());
+  } else if (event.tag === SYNC_TAG) {
+    event.waitUntil(syncOfflineData());
   }
 });
 
@@ -203,32 +287,6 @@ async function syncVocabulary() {
   }
 }
 
-async function syncQuizScores() {
-  try {
-    // Get offline quiz scores from IndexedDB
-    const offlineScores = await getOfflineQuizScores();
-    
-    for (const score of offlineScores) {
-      try {
-        await fetch('/submit-quiz-score', {
-          method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify(score)
-        });
-        
-        // Remove from offline storage after successful sync
-        await removeOfflineQuizScore(score.id);
-      } catch (error) {
-        console.error('Failed to sync quiz score:', error);
-      }
-    }
-  } catch (error) {
-    console.error('Quiz score sync failed:', error);
-  }
-}
-
 // IndexedDB helpers (simplified)
 async function getOfflineVocabulary() {
   // Implementation would use IndexedDB to store offline data
@@ -239,11 +297,154 @@ async function removeOfflineVocabulary(id) {
   // Implementation would remove item from IndexedDB
 }
 
-async function getOfflineQuizScores() {
-  // Implementation would use IndexedDB to store offline data
-  return [];
+function openSyncDb() {
+  return new Promise((resolve, reject) => {
+    const request = indexedDB.open(SYNC_DB, 2);
+    request.onupgradeneeded = () => {
+      const db = request.result;
+      SYNC_STORES.forEach(name => {
+        if (!db.objectStoreNames.contains(name)) {
+          db.createObjectStore(name, { keyPath: 'id' });
+        }
+      });
+      ['meta', 'outbox'].forEach(name => {
+        if (!db.objectStoreNames.contains(name)) {
+          db.createObjectStore(name, name === 'outbox' ? { keyPath: 'key' } : undefined);
+        }
+      });
+    };
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
 }
 
-async function removeOfflineQuizScore(id) {
-  // Implementation would remove item from IndexedDB
-}
\ No newline at end of file
+function readSyncMeta(db, key) {
+  return new Promise((resolve, reject) => {
+    const request = db.transaction('meta').objectStore('meta').get(key);
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+async function fetchChanges(since) {
+  // 바뀐 것이 없으면 서버가 ETag로 304를 주고 브라우저 HTTP 캐시의 응답이 그대로 쓰임
+  const response = await fetch(`/api/sync?since=${since}`, { credentials: 'same-origin' });
+  const contentType = response.headers.get('Content-Type') || '';
+  if (!response.ok || response.redirected || !contentType.includes('application/json')) {
+    return null;   // 로그아웃 상태 (로그인 페이지로 이동) 등
+  }
+  return response.json();
+}
+
+// 커서 이후 변경분을 받아 IndexedDB 사본에 반영 (full이면 통째로 교체)
+async function syncOfflineData() {
+  try {
+    const db = await openSyncDb();
+    const cursor = (await readSyncMeta(db, 'cursor')) || 0;
+    const userId = await readSyncMeta(db, 'user_id');
+    let changes = await fetchChanges(cursor);
+    if (changes && !changes.full && changes.user_id !== userId) {
+      changes = await fetchChanges(0);   // 다른 계정으로 로그인함
+    }
+    if (!changes) {
+      return;
+    }
+
+    await new Promise((resolve, reject) => {
+      const tx = db.transaction([...SYNC_STORES, 'meta'], 'readwrite');
+      SYNC_STORES.forEach(name => {
+        const store = tx.objectStore(name);
+        if (changes.full) {
+          store.clear();
+        }
+        changes[name].deleted.forEach(id => store.delete(id));
+        changes[name].updated.forEach(item => store.put(item));
+      });
+      const meta = tx.objectStore('meta');
+      meta.put(changes.cursor, 'cursor');
+      meta.put(changes.user_id, 'user_id');
+      tx.oncomplete = resolve;
+      tx.onerror = tx.onabort = () => reject(tx.error);
+    });
+    db.close();
+  } catch (error) {
+    console.error('Offline data sync failed:', error);
+  }
+}
+
+function localDate(moment) {
+  const pad = value => String(value).padStart(2, '0');
+  return `${moment.getFullYear()}-${pad(moment.getMonth() + 1)}-${pad(moment.getDate())}`;
+}
+
+function outboxRequest(mode, action) {
+  return openSyncDb().then(db => new Promise((resolve, reject) => {
+    const tx = db.transaction('outbox', mode);
+    const request = action(tx.objectStore('outbox'));
+    tx.oncomplete = () => {
+      db.close();
+      resolve(request && request.result);
+    };
+    tx.onerror = tx.onabort = () => reject(tx.error);
+  }));
+}
+
+// 바로 보내 보고, 네트워크 오류면 발생 시각과 멱등 키를 붙여 outbox에 저장
+async function sendOrQueue(request, route, match) {
+  const body = await request.clone().text();
+  try {
+    return await fetch(request);
+  } catch (error) {
+    const now = new Date();
+    const data = JSON.parse(body || '{}');
+    const item = {
+      ...data,
+      kind: route.kind,
+      key: self.crypto.randomUUID(),
+      client_time: now.toISOString(),
+      ...route.fields(match, data, now)
+    };
+    await outboxRequest('readwrite', store => store.put(item));
+    if (self.registration.sync) {
+      await self.registration.sync.register(OUTBOX_TAG).catch(() => {});
+    }
+    return new Response(JSON.stringify({ success: true, status: 'success', queued: true }), {
+      status: 202,
+      headers: { 'Content-Type': 'application/json' }
+    });
+  }
+}
+
+// outbox를 종류별로 OUTBOX_BATCH개씩 전송. 서버가 처리한 키(accepted/duplicates/rejected)만 지움
+async function flushOutbox() {
+  try {
+    const items = await outboxRequest('readonly', store => store.getAll());
+    // 이전 버전이 쌓아 둔, 더 이상 받지 않는 종류(클라이언트 채점 점수 등)는 버림
+    const stale = items.filter(item => !OUTBOX_ROUTES.some(route => route.kind === item.kind));
+    if (stale.length) {
+      await outboxRequest('readwrite', store => stale.forEach(item => store.delete(item.key)));
+    }
+    for (const { kind, batchUrl } of OUTBOX_ROUTES) {
+      const pending = items.filter(item => item.kind === kind);
+      for (let start = 0; start < pending.length; start += OUTBOX_BATCH) {
+        const events = pending.slice(start, start + OUTBOX_BATCH);
+        const response = await fetch(batchUrl, {
+          method: 'POST',
+          credentials: 'same-origin',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ events })
+        });
+        if (!response.ok || response.redirected) {
+          throw new Error(`Outbox flush failed: ${response.status}`);
+        }
+        const result = await response.json();
+        const done = [...result.accepted, ...result.duplicates, ...result.rejected.map(item => item.key)];
+        await outboxRequest('readwrite', store => done.forEach(key => key && store.delete(key)));
+      }
+    }
+  } catch (error) {
+    // 다시 시도하도록 실패를 알림 (background sync가 나중에 다시 호출)
+    console.error('Outbox sync failed:', error);
+    throw error;
+  }
+}
@@ -0,0 +1,210 @@
+"""고객센터 문의 파일 저장/불러오기 (support_tickets/ 아래 텍스트 파일)"""
+import os
+from datetime import datetime
+
+import metrics
+
+def save_ticket_to_file(ticket_data):
+    """문의를 텍스트 파일로 저장"""
+    try:
+        # support_tickets 폴더 생성
+        tickets_dir = 'support_tickets'
+        os.makedirs(tickets_dir, exist_ok=True)
+        
+        # 파일명 생성 (타임스탬프 + 사용자ID)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"ticket_{timestamp}_{ticket_data['user_id']}.txt"
+        filepath = os.path.join(tickets_dir, filename)
+        
+        # 텍스트 파일로 저장
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(f"=== 고객 문의 ===\n")
+            f.write(f"문의 ID: {filename}\n")
+            f.write(f"사용자: {ticket_data['username']} (ID: {ticket_data['user_id']})\n")
+            f.write(f"제목: {ticket_data['subject']}\n")
+            f.write(f"우선순위: {ticket_data['priority']}\n")
+            f.write(f"문의일시: {ticket_data['created_at']}\n")
+            f.write(f"상태: 대기중\n")
+            f.write(f"\n=== 문의 내용 ===\n")
+            f.write(f"{ticket_data['message']}\n")
+            f.write(f"\n=== 답변 내역 ===\n")
+            f.write(f"(답변 없음)\n")
+        
+        print(f"문의가 파일로 저장됨: {filepath}")
+        
+    except Exception as e:
+        print(f"문의 저장 오류: {str(e)}")
+
+def load_user_tickets(user_id):
+    """사용자의 문의 파일들을 로드"""
+    try:
+        tickets_dir = 'support_tickets'
+        if not os.path.exists(tickets_dir):
+            return []
+        
+        user_tickets = []
+        for filename in os.listdir(tickets_dir):
+            if filename.endswith(f'_{user_id}.txt'):
+                filepath = os.path.join(tickets_dir, filename)
+                ticket_data = parse_ticket_file(filepath, filename)
+                if ticket_data:
+                    user_tickets.append(ticket_data)
+        
+        # 최신순으로 정렬
+        user_tickets.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        return user_tickets
+        
+    except Exception as e:
+        print(f"문의 로드 오류: {str(e)}")
+        return []
+
+def parse_ticket_file(filepath, filename):
+    """문의 파일을 파싱하여 딕셔너리로 반환"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+        metrics.inc(metrics.FILE_PARSES, store='support_ticket')
+        
+        # 기본 정보 추출
+        lines = content.split('\n')
+        ticket_data = {
+            'id': filename.replace('.txt', ''),
+            'filename': filename,
+            'subject': '',
+            'priority': 'normal',
+            'created_at': '',
+            'status': '대기중',
+            'message': '',
+            'replies_count': 0,
+            'user_id': '',
+            'username': ''
+        }
+        
+        for line in lines:
+            if line.startswith('제목: '):
+                ticket_data['subject'] = line.replace('제목: ', '')
+            elif line.startswith('우선순위: '):
+                ticket_data['priority'] = line.replace('우선순위: ', '')
+            elif line.startswith('문의일시: '):
+                ticket_data['created_at'] = line.replace('문의일시: ', '')
+            elif line.startswith('상태: '):
+                ticket_data['status'] = line.replace('상태: ', '')
+            elif line.startswith('사용자: '):
+                user_info = line.replace('사용자: ', '')
+                if '(ID: ' in user_info:
+                    username = user_info.split(' (ID: ')[0]
+                    user_id = user_info.split(' (ID: ')[1].replace(')', '')
+                    ticket_data['username'] = username
+                    ticket_data['user_id'] = user_id
+        
+        # 문의 내용 추출
+        content_start = content.find('=== 문의 내용 ===')
+        replies_start = content.find('=== 답변 내역 ===')
+        if content_start != -1 and replies_start != -1:
+            message_content = content[content_start:replies_start].replace('=== 문의 내용 ===\n', '').strip()
+            ticket_data['message'] = message_content
+        
+        # 답변 개수 계산 및 답변 내용 추출
+        replies_section = content[replies_start:] if replies_start != -1 else ''
+        ticket_data['replies'] = []
+        
+        if '(답변 없음)' not in replies_section:
+            # 답변이 있으면 개수 계산 및 내용 추출
+            ticket_data['replies_count'] = replies_section.count('답변:')
+            
+            # 답변 내용들을 리스트로 추출
+            replies_text = replies_section.replace('=== 답변 내역 ===\n', '').strip()
+            if replies_text:
+                # 각 답변을 분리
+                reply_blocks = replies_text.split('\n답변:')
+                for i, block in enumerate(reply_blocks):
+                    if i == 0 and not block.startswith('답변:'):
+                        continue
+                    if i > 0:
+                        block = '답변:' + block
+                    ticket_data['replies'].append(block.strip())
+        
+        return ticket_data
+        
+    except Exception as e:
+        print(f"파일 파싱 오류: {str(e)}")
+        return None
+
+def load_all_tickets():
+    """모든 문의 파일들을 로드"""
+    try:
+        tickets_dir = 'support_tickets'
+        if not os.path.exists(tickets_dir):
+            return []
+        
+        all_tickets = []
+        for filename in os.listdir(tickets_dir):
+            if filename.startswith('ticket_') and filename.endswith('.txt'):
+                filepath = os.path.join(tickets_dir, filename)
+                ticket_data = parse_ticket_file(filepath, filename)
+                if ticket_data:
+                    all_tickets.append(ticket_data)
+        
+        # 최신순으로 정렬
+        all_tickets.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        return all_tickets
+        
+    except Exception as e:
+        print(f"전체 문의 로드 오류: {str(e)}")
+        return []
+
+def load_ticket_by_id(ticket_id):
+    """특정 ID의 문의 파일을 로드"""
+    try:
+        tickets_dir = 'support_tickets'
+        filename = f"{ticket_id}.txt"
+        filepath = os.path.join(tickets_dir, filename)
+        
+        if os.path.exists(filepath):
+            return parse_ticket_file(filepath, filename)
+        return None
+        
+    except Exception as e:
+        print(f"문의 로드 오류: {str(e)}")
+        return None
+
+def add_reply_to_ticket_file(ticket_id, username, message, is_admin_reply):
+    """문의 파일에 답변 추가"""
+    try:
+        tickets_dir = 'support_tickets'
+        filename = f"{ticket_id}.txt"
+        filepath = os.path.join(tickets_dir, filename)
+        
+        if not os.path.exists(filepath):
+            return False
+        
+        # 기존 파일 내용 읽기
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # 답변 추가
+        reply_text = f"\n답변: {username} ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})\n"
+        if is_admin_reply:
+            reply_text += "[관리자 답변]\n"
+        reply_text += f"{message}\n"
+        
+        # (답변 없음) 제거하고 답변 추가
+        if '(답변 없음)' in content:
+            content = content.replace('(답변 없음)', reply_text.strip())
+        else:
+            content += reply_text
+        
+        # 상태 업데이트 (관리자가 답변한 경우)
+        if is_admin_reply and '상태: 대기중' in content:
+            content = content.replace('상태: 대기중', '상태: 답변완료')
+        
+        # 파일에 다시 쓰기
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        print(f"답변이 파일에 추가됨: {filepath}")
+        return True
+        
+    except Exception as e:
+        print(f"답변 추가 오류: {str(e)}")
+        return False
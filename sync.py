@@ -0,0 +1,145 @@
+"""오프라인(PWA)용 변경분 동기화 (/api/sync?since=<커서>)
+
+고전어휘(KoreanVocabulary), 내 단어장(VocabularyWord), 비문학 모의고사 목록의 변경분을
+커서 이후만 돌려줍니다. 서비스 워커는 IndexedDB에 사본을 두고 작은 변경분만 받아 갱신합니다.
+
+- 단어 행은 version 열을 가집니다. 세션을 flush할 때 추가/수정된 단어에 SyncCounter에서
+  새 버전을 받아 적고, 삭제된 단어는 SyncChange에 삭제 표시(tombstone)를 남깁니다.
+  따라서 라우트마다 따로 호출할 필요가 없습니다. (bulk delete는 이벤트가 없으므로 제외.
+  delete_user의 단어 일괄 삭제는 그 사용자가 다시 동기화하지 않으므로 괜찮음)
+- 모델의 SYNC_IGNORED 열(내 단어장의 SM-2 복습 일정)만 바뀐 경우는 변경으로 보지 않습니다.
+  퀴즈 답안마다 카운터 행을 잠그지 않도록 하기 위해서이며, 오프라인 사본의 복습 일정은
+  다음 내용 변경이나 전체 동기화 때 갱신됩니다.
+- 모의고사는 파일로 저장되므로 추가/삭제할 때 test_saved/test_removed로 SyncChange에 기록합니다.
+- 카운터 행은 UPDATE로 올리므로 행 잠금이 커밋까지 유지됩니다. 읽는 쪽은 커밋된 카운터
+  값까지만 돌려주므로, 아직 커밋되지 않은 낮은 버전을 건너뛰는 일이 없습니다.
+"""
+from sqlalchemy import event, inspect, or_, select
+
+from extensions import db
+
+KOREAN_VOCABULARY = 'korean_vocabulary'
+VOCABULARY = 'vocabulary'
+TESTS = 'tests'
+
+COUNTER_ID = 1
+
+
+def init_app(app):
+    if not event.contains(db.session, 'before_flush', _before_flush):
+        event.listen(db.session, 'before_flush', _before_flush)
+
+
+def next_version(session=None):
+    """카운터를 올리고 새 버전 반환 (커밋할 때까지 카운터 행이 잠김)"""
+    from models import SyncCounter
+    session = session or db.session
+    table = SyncCounter.__table__
+    updated = session.execute(
+        table.update().where(table.c.id == COUNTER_ID).values(value=table.c.value + 1)
+    ).rowcount
+    if not updated:
+        session.execute(table.insert().values(id=COUNTER_ID, value=1))
+    return session.execute(select(table.c.value).where(table.c.id == COUNTER_ID)).scalar()
+
+
+def current():
+    """커밋된 최신 버전 (아직 아무것도 바뀌지 않았으면 0)"""
+    from models import SyncCounter
+    return db.session.query(SyncCounter.value).filter(SyncCounter.id == COUNTER_ID).scalar() or 0
+
+
+def _mark(session, kind, key, user_id, version, deleted):
+    from models import SyncChange
+    change = session.get(SyncChange, (kind, key))
+    if change is None:
+        session.add(SyncChange(kind=kind, key=key, user_id=user_id, version=version, deleted=deleted))
+    else:
+        change.user_id, change.version, change.deleted = user_id, version, deleted
+
+
+def _content_changed(obj):
+    """동기화되는 열(version, SYNC_IGNORED 제외)이 바뀌었는지"""
+    state = inspect(obj)
+    ignored = getattr(type(obj), 'SYNC_IGNORED', ())
+    return any(state.attrs[key].history.has_changes()
+               for key in state.mapper.column_attrs.keys()
+               if key != 'version' and key not in ignored)
+
+
+def _before_flush(session, flush_context, instances):
+    from models import KoreanVocabulary, VocabularyWord
+    tracked = (KoreanVocabulary, VocabularyWord)
+    changed = [obj for obj in session.new if isinstance(obj, tracked)]
+    changed += [obj for obj in session.dirty
+                if isinstance(obj, tracked) and _content_changed(obj)]
+    deleted = [obj for obj in session.deleted if isinstance(obj, tracked)]
+    if not changed and not deleted:
+        return
+
+    version = next_version(session)   # 한 번의 flush는 같은 버전
+    for obj in changed:
+        obj.version = version
+    for obj in deleted:
+        if isinstance(obj, KoreanVocabulary):
+            _mark(session, KOREAN_VOCABULARY, str(obj.id), None, version, True)
+        else:
+            _mark(session, VOCABULARY, str(obj.id), obj.user_id, version, True)
+
+
+def test_saved(test_id):
+    """모의고사 파일을 저장한 뒤 호출 (커밋까지 함)"""
+    _mark(db.session, TESTS, test_id, None, next_version(), False)
+    db.session.commit()
+
+
+def test_removed(test_id):
+    """모의고사 파일을 삭제한 뒤 호출 (커밋까지 함)"""
+    _mark(db.session, TESTS, test_id, None, next_version(), True)
+    db.session.commit()
+
+
+def changes(user_id, since):
+    """since 이후 변경분. since가 없거나(0) 서버 카운터보다 크면 전체 목록(full)
+
+    반환: {'cursor', 'full', 'korean_vocabulary': {'updated', 'deleted'},
+           'vocabulary': {...}, 'tests': {'updated': [id], 'deleted': [id]}}
+    full이면 tests['updated']는 비워 두고 호출한 쪽이 파일 목록 전체를 채웁니다.
+    """
+    from sqlalchemy.orm import raiseload
+    from models import KoreanVocabulary, SyncChange, VocabularyWord
+    cursor = current()
+    full = since <= 0 or since > cursor
+    if full:
+        since = -1
+
+    korean = KoreanVocabulary.query.options(raiseload('*')).filter(
+        KoreanVocabulary.version > since, KoreanVocabulary.version <= cursor
+    ).order_by(KoreanVocabulary.id).all()
+    words = VocabularyWord.query.options(raiseload('*')).filter(
+        VocabularyWord.user_id == user_id,
+        VocabularyWord.version > since,
+        VocabularyWord.version <= cursor
+    ).order_by(VocabularyWord.id).all()
+
+    result = {
+        'cursor': cursor,
+        'full': full,
+        KOREAN_VOCABULARY: {'updated': [w.to_dict() for w in korean], 'deleted': []},
+        VOCABULARY: {'updated': [w.to_dict() for w in words], 'deleted': []},
+        TESTS: {'updated': [], 'deleted': []}
+    }
+    if full:
+        return result
+
+    tombstones = SyncChange.query.filter(
+        SyncChange.version > since,
+        SyncChange.version <= cursor,
+        or_(SyncChange.user_id.is_(None), SyncChange.user_id == user_id)
+    ).order_by(SyncChange.version).all()
+    for change in tombstones:
+        if change.kind == TESTS:
+            result[TESTS]['deleted' if change.deleted else 'updated'].append(change.key)
+        elif change.deleted:
+            result[change.kind]['deleted'].append(int(change.key))
+    return result
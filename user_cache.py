@@ -0,0 +1,114 @@
+"""Flask-Login user_loader용 사용자 캐시
+
+매 요청마다 User를 기본키로 조회하는 대신 가벼운 사용자 레코드(CachedUser)를
+TTL/LRU 캐시에 보관합니다. 사용자 정보가 바뀌는 곳(프로필 수정, 비밀번호 변경,
+권한 변경, 삭제)에서는 invalidate()를 호출해야 합니다.
+
+여러 워커 프로세스가 있을 때는 'users' 데이터 버전(data_version)을 올려 다른 워커의
+캐시도 다음 요청에서 비워지도록 합니다. 확인 비용은 요청당 stat 한 번입니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from flask_login import UserMixin
+
+import data_version
+import metrics
+from extensions import db
+
+VERSION_NAME = 'users'
+
+
+class CachedUser(UserMixin):
+    """current_user로 쓰이는 읽기 전용 사용자 레코드
+
+    값을 바꿔 저장하려면 load()로 ORM 객체를 가져와야 합니다.
+    """
+
+    def __init__(self, id, username, email, is_admin, created_at):
+        self.id = id
+        self.username = username
+        self.email = email
+        self.is_admin = bool(is_admin)
+        self.created_at = created_at
+
+    @classmethod
+    def from_model(cls, user):
+        return cls(user.id, user.username, user.email, user.is_admin, user.created_at)
+
+    def load(self):
+        """세션에 연결된 User 모델 객체 반환"""
+        from models import User
+        return db.session.get(User, self.id)
+
+    def __repr__(self):
+        return f'<CachedUser {self.id} {self.username}>'
+
+
+class UserCache:
+    def __init__(self, ttl=60, maxsize=10000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()   # user_id -> (만료 시각, CachedUser)
+        self._seen_version = 0
+        self._generation = 0            # 무효화될 때마다 증가 (읽는 도중 무효화된 값 저장 방지)
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config.setdefault('USER_CACHE_TTL', self.ttl)
+        self.maxsize = app.config.setdefault('USER_CACHE_SIZE', self.maxsize)
+        self._seen_version = data_version.get(VERSION_NAME)
+
+    def _sync_version(self):
+        version = data_version.get(VERSION_NAME)
+        if version != self._seen_version:
+            with self._lock:
+                self._entries.clear()
+                self._generation += 1
+                self._seen_version = version
+
+    def get(self, user_id):
+        """캐시된 사용자 레코드 반환 (없거나 만료되면 DB에서 읽음)"""
+        self._sync_version()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                metrics.cache_result('user', True)
+                return entry[1]
+            generation = self._generation
+
+        metrics.cache_result('user', False)
+
+        from models import User
+        user = db.session.get(User, user_id)
+        if user is None:
+            return None
+        record = CachedUser.from_model(user)
+        with self._lock:
+            if generation != self._generation:
+                return record
+            self._entries[user_id] = (now + self.ttl, record)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return record
+
+    def invalidate(self, user_id=None):
+        """사용자(없으면 전체) 캐시를 비우고 다른 워커에도 알림"""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+            self._generation += 1
+        self._sync_version()
+        data_version.bump(VERSION_NAME)
+        # 자기 자신이 올린 버전 때문에 다른 사용자 캐시까지 비우지 않도록 기록
+        with self._lock:
+            self._seen_version = data_version.get(VERSION_NAME)
+
+
+user_cache = UserCache()
@@ -0,0 +1,9 @@
+"""라우트 블루프린트 (URL은 그대로, 엔드포인트 이름은 '<블루프린트>.<함수>')"""
+from views import admin, api, auth, main, resources, study, support, vocabulary
+
+BLUEPRINTS = (main.bp, auth.bp, resources.bp, study.bp, vocabulary.bp, admin.bp, api.bp, support.bp)
+
+
+def init_app(app):
+    for blueprint in BLUEPRINTS:
+        app.register_blueprint(blueprint)
@@ -0,0 +1,643 @@
+"""관리자 페이지와 관리자 API (/admin)"""
+import os
+from datetime import datetime
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, current_app
+from flask_login import login_required, current_user
+from sqlalchemy.orm import joinedload, raiseload
+import pdf_search
+import announcement_cache
+import data_version
+import page_cache
+import http_cache
+import leaderboard
+import query_guard
+import similarity
+import sync
+from forms import PDFUploadForm, AnnouncementForm
+from models import User, PDFRequest, PDFRequestQuota, PDFResource, KoreanVocabulary, VocabularyWord, QuizScore, Announcement, FocusSession, FocusDaily, FocusStats, QuizAttempt, SyncChange, IngestKey
+from extensions import db, csrf
+from user_cache import user_cache
+from support_tickets import load_all_tickets
+from nonfiction import load_nonfiction_tests, save_nonfiction_test, nonfiction_tests_modified
+
+bp = Blueprint('admin', __name__)
+
+@bp.route('/admin')
+@login_required
+def index():
+    if not current_user.is_admin:
+        flash('관리자 권한이 필요합니다.', 'danger')
+        return redirect(url_for('main.dashboard'))
+
+    upload_form = PDFUploadForm()
+    announcement_form = AnnouncementForm()
+
+    # 목록은 탭을 열 때 /admin/api/* 에서 페이지 단위로 불러옴
+    categories = [row.category for row in db.session.query(KoreanVocabulary.category)
+                  .group_by(KoreanVocabulary.category).order_by(KoreanVocabulary.category)]
+
+    return render_template('admin.html',
+                         upload_form=upload_form,
+                         categories=categories,
+                         announcement_form=announcement_form)
+
+ADMIN_PAGE_SIZE = 20
+
+ADMIN_MAX_PAGE_SIZE = 100
+
+def admin_page(query, sort_columns, default_sort, serialize):
+    """관리자 목록 API 공통 처리: ?page=&per_page=&sort=&order=asc|desc"""
+    sort = request.args.get('sort', default_sort)
+    column = sort_columns.get(sort)
+    if column is None:
+        sort, column = default_sort, sort_columns[default_sort]
+    descending = request.args.get('order', 'desc') != 'asc'
+    query = query.order_by(column.desc() if descending else column.asc())
+
+    page = query.paginate(page=request.args.get('page', 1, type=int),
+                          per_page=request.args.get('per_page', ADMIN_PAGE_SIZE, type=int),
+                          max_per_page=ADMIN_MAX_PAGE_SIZE, error_out=False)
+    return jsonify({
+        'items': serialize(page.items),
+        'page': page.page,
+        'per_page': page.per_page,
+        'pages': page.pages,
+        'total': page.total,
+        'sort': sort,
+        'order': 'desc' if descending else 'asc'
+    })
+
+@bp.route('/admin/api/requests')
+@login_required
+def admin_api_requests():
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+
+    status = request.args.get('status', 'pending')
+    query = PDFRequest.query.options(joinedload(PDFRequest.user)).filter(PDFRequest.status == status)
+
+    def serialize(rows):
+        return [{
+            'id': req.id,
+            'subject': req.subject,
+            'topic': req.topic,
+            'description': req.description,
+            'status': req.status,
+            'requested_at': req.requested_at.strftime('%Y-%m-%d %H:%M'),
+            'username': req.user.username
+        } for req in rows]
+
+    return admin_page(query, {'requested_at': PDFRequest.requested_at, 'subject': PDFRequest.subject},
+                      'requested_at', serialize)
+
+@bp.route('/admin/api/vocab')
+@login_required
+def admin_api_vocab():
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+
+    query = KoreanVocabulary.query.options(raiseload('*'))
+    category = request.args.get('category', '').strip()
+    if category:
+        query = query.filter(KoreanVocabulary.category == category)
+    search = request.args.get('q', '').strip()[:100]
+    if search:
+        query = query.filter(KoreanVocabulary.word.contains(search) | KoreanVocabulary.meaning.contains(search))
+
+    def serialize(rows):
+        return [{'id': v.id, 'word': v.word, 'meaning': v.meaning, 'category': v.category} for v in rows]
+
+    return admin_page(query, {'id': KoreanVocabulary.id, 'word': KoreanVocabulary.word,
+                              'category': KoreanVocabulary.category}, 'id', serialize)
+
+@bp.route('/admin/api/vocab/categories')
+@login_required
+def admin_api_vocab_categories():
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+
+    rows = (db.session.query(KoreanVocabulary.category, db.func.count(KoreanVocabulary.id))
+            .group_by(KoreanVocabulary.category).order_by(KoreanVocabulary.category).all())
+    return jsonify({'categories': [{'name': name, 'count': count} for name, count in rows]})
+
+@bp.route('/admin/api/announcements')
+@login_required
+def admin_api_announcements():
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+
+    def serialize(rows):
+        return [{
+            'id': a.id,
+            'title': a.title,
+            'summary': a.content[:50],
+            'visibility': a.visibility,
+            'priority': a.priority,
+            'is_active': a.is_active,
+            'created_at': a.created_at.strftime('%m/%d %H:%M')
+        } for a in rows]
+
+    return admin_page(Announcement.query.options(raiseload('*')), {'created_at': Announcement.created_at, 'title': Announcement.title},
+                      'created_at', serialize)
+
+@bp.route('/admin/api/resources')
+@login_required
+def admin_api_resources():
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+
+    query = PDFResource.query.options(raiseload('*'))
+    subject = request.args.get('subject', '').strip()
+    if subject:
+        query = query.filter(PDFResource.subject == subject)
+    category = request.args.get('category', '').strip()
+    if category:
+        query = query.filter(PDFResource.category == category)
+    search = request.args.get('q', '').strip()[:100]
+    if search:
+        query = query.filter(PDFResource.title.contains(search) | PDFResource.original_filename.contains(search))
+
+    def serialize(rows):
+        return [{
+            'id': r.id,
+            'title': r.title,
+            'original_filename': r.original_filename,
+            'subject': r.subject,
+            'category': r.category,
+            'file_size': r.file_size,
+            'upload_date': r.upload_date.strftime('%Y-%m-%d'),
+            'download_count': r.download_count
+        } for r in rows]
+
+    return admin_page(query, {'upload_date': PDFResource.upload_date, 'title': PDFResource.title,
+                              'download_count': PDFResource.download_count, 'file_size': PDFResource.file_size},
+                      'upload_date', serialize)
+
+@bp.route('/admin/api/users')
+@login_required
+def admin_api_users():
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+
+    query = User.query.options(raiseload('*'))
+    role = request.args.get('role', '')
+    if role in ('admin', 'user'):
+        query = query.filter(User.is_admin == (role == 'admin'))
+    search = request.args.get('q', '').strip()[:100]
+    if search:
+        query = query.filter(User.username.contains(search) | User.email.contains(search))
+
+    def serialize(rows):
+        # 현재 페이지 사용자들의 퀴즈 점수 개수만 한 번에 집계
+        ids = [u.id for u in rows]
+        quiz_counts = dict(
+            db.session.query(QuizScore.user_id, db.func.count(QuizScore.id))
+            .filter(QuizScore.user_id.in_(ids)).group_by(QuizScore.user_id).all()
+        ) if ids else {}
+        return [{
+            'id': u.id,
+            'username': u.username,
+            'email': u.email,
+            'is_admin': u.is_admin,
+            'is_self': u.id == current_user.id,
+            'created_at': u.created_at.strftime('%Y-%m-%d') if u.created_at else None,
+            'quiz_count': quiz_counts.get(u.id, 0)
+        } for u in rows]
+
+    return admin_page(query, {'id': User.id, 'username': User.username, 'created_at': User.created_at},
+                      'id', serialize)
+
+@bp.route('/admin/api/query-stats')
+@login_required
+def admin_api_query_stats():
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+    return jsonify({'settings': query_guard.settings(), 'items': query_guard.summary()})
+
+@bp.route('/admin/api/query-profile', methods=['POST'])
+@login_required
+@csrf.exempt
+def admin_api_query_profile():
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+
+    data = request.get_json(silent=True) or {}
+    try:
+        slow_query_ms = int(data['slow_query_ms']) if 'slow_query_ms' in data else None
+    except (TypeError, ValueError):
+        return jsonify({'error': '느린 쿼리 기준은 숫자여야 합니다.'}), 400
+    settings = query_guard.update_settings(enabled=data.get('enabled'),
+                                           server_timing=data.get('server_timing'),
+                                           slow_query_ms=slow_query_ms)
+    return jsonify({'status': 'success', 'settings': settings})
+
+@bp.route('/admin/add-korean-vocab', methods=['POST'])
+@login_required
+@csrf.exempt
+def add_korean_vocab():
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+
+    data = request.get_json()
+    vocab = KoreanVocabulary()
+    vocab.word = data['word']
+    vocab.meaning = data['meaning']
+    vocab.category = data['category']
+    db.session.add(vocab)
+    db.session.commit()
+    # 유사도 색인 갱신과 함께 'korean_vocabulary' 데이터 버전을 올림 (페이지 캐시 무효화)
+    similarity.korean_added(vocab)
+
+    return jsonify({'status': 'success'})
+
+@bp.route('/admin/delete-korean-vocab/<int:vocab_id>', methods=['DELETE'])
+@login_required
+@csrf.exempt
+def delete_korean_vocab(vocab_id):
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+
+    vocab = KoreanVocabulary.query.get_or_404(vocab_id)
+    db.session.delete(vocab)
+    db.session.commit()
+    # 유사도 색인 갱신과 함께 'korean_vocabulary' 데이터 버전을 올림 (페이지 캐시 무효화)
+    similarity.korean_removed(vocab_id)
+
+    return jsonify({'status': 'success'})
+
+@bp.route('/admin/announcements', methods=['GET', 'POST'])
+@login_required
+def admin_announcements():
+    if not current_user.is_admin:
+        flash('관리자 권한이 필요합니다.', 'danger')
+        return redirect(url_for('main.dashboard'))
+
+    form = AnnouncementForm()
+    if form.validate_on_submit():
+        announcement = Announcement(
+            title=form.title.data,
+            content=form.content.data,
+            visibility=form.visibility.data,
+            priority=form.priority.data,
+            created_by=current_user.id,
+            expires_at=form.expires_at.data,
+            is_active=form.is_active.data
+        )
+        db.session.add(announcement)
+        db.session.commit()
+        announcement_cache.invalidate()
+        flash('공지사항이 작성되었습니다.', 'success')
+        return redirect(url_for('admin.admin_announcements'))
+
+    announcements = Announcement.query.options(raiseload('*')).order_by(Announcement.created_at.desc()).all()
+    return render_template('admin_announcements.html', form=form, announcements=announcements)
+
+@bp.route('/admin/announcements/<int:announcement_id>/edit', methods=['GET', 'POST'])
+@login_required
+def edit_announcement(announcement_id):
+    if not current_user.is_admin:
+        flash('관리자 권한이 필요합니다.', 'danger')
+        return redirect(url_for('main.dashboard'))
+
+    announcement = Announcement.query.get_or_404(announcement_id)
+    form = AnnouncementForm(obj=announcement)
+
+    if form.validate_on_submit():
+        form.populate_obj(announcement)
+        announcement.updated_at = datetime.now()
+        db.session.commit()
+        announcement_cache.invalidate()
+        flash('공지사항이 수정되었습니다.', 'success')
+        return redirect(url_for('admin.admin_announcements'))
+
+    return render_template('edit_announcement.html', form=form, announcement=announcement)
+
+@bp.route('/admin/announcements/<int:announcement_id>/delete', methods=['POST'])
+@login_required
+@csrf.exempt
+def delete_announcement(announcement_id):
+    if not current_user.is_admin:
+        flash('관리자 권한이 필요합니다.', 'danger')
+        return redirect(url_for('main.dashboard'))
+
+    announcement = Announcement.query.get_or_404(announcement_id)
+    db.session.delete(announcement)
+    db.session.commit()
+    announcement_cache.invalidate()
+    flash('공지사항이 삭제되었습니다.', 'success')
+    return redirect(url_for('admin.admin_announcements'))
+
+@bp.route('/admin/announcements/<int:announcement_id>/toggle', methods=['POST'])
+@login_required
+@csrf.exempt
+def toggle_announcement(announcement_id):
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+
+    announcement = Announcement.query.get_or_404(announcement_id)
+    announcement.is_active = not announcement.is_active
+    announcement.updated_at = datetime.now()
+    db.session.commit()
+    announcement_cache.invalidate()
+
+    return jsonify({'status': 'success', 'is_active': announcement.is_active})
+
+@bp.route('/admin/delete-resource/<int:resource_id>', methods=['POST'])
+@login_required
+@csrf.exempt
+def delete_resource(resource_id):
+    try:
+        if not current_user.is_admin:
+            return jsonify({'status': 'error', 'message': '관리자 권한이 필요합니다.'}), 403
+
+        resource = PDFResource.query.get(resource_id)
+        if not resource:
+            return jsonify({'status': 'error', 'message': '파일을 찾을 수 없습니다.'}), 404
+
+        # 실제 파일 삭제
+        file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], resource.filename)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+        # 데이터베이스에서 삭제
+        db.session.delete(resource)
+        db.session.commit()
+        pdf_search.enqueue_remove(resource_id)
+        page_cache.invalidate(page_cache.PDF_RESOURCES)
+
+        return jsonify({'status': 'success', 'message': '파일이 삭제되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Delete resource error: {str(e)}")
+        return jsonify({'status': 'error', 'message': f'파일 삭제 중 오류가 발생했습니다: {str(e)}'}), 500
+
+@bp.route('/admin/approve-request/<int:request_id>', methods=['POST'])
+@login_required
+@csrf.exempt
+def approve_request(request_id):
+    try:
+        if not current_user.is_admin:
+            return jsonify({'status': 'error', 'message': '관리자 권한이 필요합니다.'}), 403
+
+        request_obj = PDFRequest.query.get(request_id)
+        if not request_obj:
+            return jsonify({'status': 'error', 'message': '요청을 찾을 수 없습니다.'}), 404
+
+        if request_obj.status != 'pending':
+            return jsonify({'status': 'error', 'message': '이미 처리된 요청입니다.'}), 400
+
+        request_obj.status = 'approved'
+        request_obj.processed_at = datetime.now()
+
+        db.session.commit()
+        return jsonify({'status': 'success', 'message': '요청이 승인되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Approve request error: {str(e)}")
+        return jsonify({'status': 'error', 'message': f'승인 처리 중 오류가 발생했습니다: {str(e)}'}), 500
+
+@bp.route('/admin/reject-request/<int:request_id>', methods=['POST'])
+@login_required
+@csrf.exempt
+def reject_request(request_id):
+    try:
+        if not current_user.is_admin:
+            return jsonify({'status': 'error', 'message': '관리자 권한이 필요합니다.'}), 403
+
+        request_obj = PDFRequest.query.get(request_id)
+        if not request_obj:
+            return jsonify({'status': 'error', 'message': '요청을 찾을 수 없습니다.'}), 404
+
+        if request_obj.status != 'pending':
+            return jsonify({'status': 'error', 'message': '이미 처리된 요청입니다.'}), 400
+
+        request_obj.status = 'rejected'
+        request_obj.processed_at = datetime.now()
+
+        db.session.commit()
+        return jsonify({'status': 'success', 'message': '요청이 거절되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Reject request error: {str(e)}")
+        return jsonify({'status': 'error', 'message': f'거절 처리 중 오류가 발생했습니다: {str(e)}'}), 500
+
+@bp.route('/admin/toggle-user-role/<int:user_id>', methods=['POST'])
+@login_required
+@csrf.exempt
+def toggle_user_role(user_id):
+    try:
+        if not current_user.is_admin:
+            return jsonify({'status': 'error', 'message': '관리자 권한이 필요합니다.'}), 403
+
+        user = User.query.get(user_id)
+        if not user:
+            return jsonify({'status': 'error', 'message': '사용자를 찾을 수 없습니다.'}), 404
+
+        if user.id == current_user.id:
+            return jsonify({'status': 'error', 'message': '본인의 권한은 변경할 수 없습니다.'}), 400
+
+        user.is_admin = not user.is_admin
+        db.session.commit()
+        # 권한 변경은 모든 워커에서 즉시 반영되어야 함
+        user_cache.invalidate(user.id)
+
+        action = '관리자 권한이 부여' if user.is_admin else '관리자 권한이 해제'
+        return jsonify({'status': 'success', 'message': f'{user.username}님의 {action}되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Toggle user role error: {str(e)}")
+        return jsonify({'status': 'error', 'message': f'권한 변경 중 오류가 발생했습니다: {str(e)}'}), 500
+
+@bp.route('/admin/add-nonfiction-test', methods=['POST'])
+@login_required
+@csrf.exempt
+def add_nonfiction_test():
+    if not current_user.is_admin:
+        return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
+    
+    try:
+        # JSON 데이터 가져오기
+        data = request.get_json()
+        test_id = data.get('id')
+        title = data.get('title')
+        description = data.get('description', '')
+        passage = data.get('passage')
+        questions = data.get('questions', [])
+        
+        if not test_id or not title or not passage:
+            return jsonify({'success': False, 'message': '문제 ID, 제목, 지문은 필수입니다.'})
+        
+        # 문제 ID 중복 확인
+        tests_dir = '모의고사'
+        os.makedirs(tests_dir, exist_ok=True)
+        
+        filepath = os.path.join(tests_dir, f"{test_id}.txt")
+        if os.path.exists(filepath):
+            return jsonify({'success': False, 'message': '이미 존재하는 문제 ID입니다.'})
+        
+        # 모의고사 데이터 저장
+        test_data = {
+            'id': test_id,
+            'title': title,
+            'description': description,
+            'passage': passage,
+            'questions': questions
+        }
+        
+        if save_nonfiction_test(test_data):
+            page_cache.invalidate(page_cache.NONFICTION_TESTS)
+            sync.test_saved(test_id)
+            return jsonify({'success': True, 'message': '비문학 모의고사가 성공적으로 추가되었습니다.'})
+        else:
+            return jsonify({'success': False, 'message': '저장 중 오류가 발생했습니다.'})
+        
+    except Exception as e:
+        print(f"Add nonfiction test error: {str(e)}")
+        return jsonify({'success': False, 'message': '추가 중 오류가 발생했습니다.'})
+
+@bp.route('/admin/nonfiction-tests')
+@login_required
+@http_cache.conditional_get(
+    version=lambda: (data_version.get(page_cache.NONFICTION_TESTS), nonfiction_tests_modified()),
+    last_modified=nonfiction_tests_modified)
+def admin_nonfiction_tests():
+    if not current_user.is_admin:
+        return jsonify({'error': '관리자 권한이 필요합니다.'}), 403
+    
+    tests = load_nonfiction_tests()
+    return jsonify({'tests': tests})
+
+@bp.route('/admin/delete-nonfiction-test/<test_id>', methods=['POST'])
+@login_required
+@csrf.exempt
+def delete_nonfiction_test(test_id):
+    if not current_user.is_admin:
+        return jsonify({'success': False, 'message': '관리자 권한이 필요합니다.'}), 403
+    
+    try:
+        tests_dir = '모의고사'
+        filepath = os.path.join(tests_dir, f"{test_id}.txt")
+        
+        if not os.path.exists(filepath):
+            return jsonify({'success': False, 'message': '문제를 찾을 수 없습니다.'}), 404
+        
+        # 파일 삭제
+        os.remove(filepath)
+        page_cache.invalidate(page_cache.NONFICTION_TESTS)
+        sync.test_removed(test_id)
+        
+        # 관련 결과 파일들도 삭제 (선택사항)
+        results_dir = os.path.join(tests_dir, 'results')
+        if os.path.exists(results_dir):
+            for filename in os.listdir(results_dir):
+                if f'_{test_id}' in filename:
+                    result_filepath = os.path.join(results_dir, filename)
+                    try:
+                        os.remove(result_filepath)
+                    except:
+                        pass  # 결과 파일 삭제 실패해도 계속 진행
+        
+        return jsonify({'success': True, 'message': '비문학 모의고사가 삭제되었습니다.'})
+        
+    except Exception as e:
+        print(f"Delete nonfiction test error: {str(e)}")
+        return jsonify({'success': False, 'message': '삭제 중 오류가 발생했습니다.'}), 500
+
+@bp.route('/admin/delete-user/<int:user_id>', methods=['POST'])
+@login_required
+@csrf.exempt
+def delete_user(user_id):
+    try:
+        if not current_user.is_admin:
+            return jsonify({'status': 'error', 'message': '관리자 권한이 필요합니다.'}), 403
+
+        user = User.query.get(user_id)
+        if not user:
+            return jsonify({'status': 'error', 'message': '사용자를 찾을 수 없습니다.'}), 404
+
+        if user.id == current_user.id:
+            return jsonify({'status': 'error', 'message': '본인 계정은 삭제할 수 없습니다.'}), 400
+
+        username = user.username
+
+        # 관련된 데이터도 함께 삭제
+        VocabularyWord.query.filter_by(user_id=user_id).delete()
+        QuizScore.query.filter_by(user_id=user_id).delete()
+        QuizAttempt.query.filter_by(user_id=user_id).delete()
+        PDFRequest.query.filter_by(user_id=user_id).delete()
+        PDFRequestQuota.query.filter_by(user_id=user_id).delete()
+        FocusSession.query.filter_by(user_id=user_id).delete()
+        FocusDaily.query.filter_by(user_id=user_id).delete()
+        FocusStats.query.filter_by(user_id=user_id).delete()
+        SyncChange.query.filter_by(user_id=user_id).delete()
+        IngestKey.query.filter_by(user_id=user_id).delete()
+        leaderboard.remove_user(user_id)
+
+        db.session.delete(user)
+        db.session.commit()
+        user_cache.invalidate(user_id)
+
+        return jsonify({'status': 'success', 'message': f'{username}님의 계정이 삭제되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Delete user error: {str(e)}")
+        return jsonify({'status': 'error', 'message': f'사용자 삭제 중 오류가 발생했습니다: {str(e)}'}), 500
+
+@bp.route('/admin/reset-user-requests/<int:user_id>', methods=['POST'])
+@login_required
+@csrf.exempt
+def reset_user_requests(user_id):
+    try:
+        if not current_user.is_admin:
+            return jsonify({'status': 'error', 'message': '관리자 권한이 필요합니다.'}), 403
+
+        user = User.query.get(user_id)
+        if not user:
+            return jsonify({'status': 'error', 'message': '사용자를 찾을 수 없습니다.'}), 404
+
+        # 요청 기록은 남기고 오늘 할당량 원장만 초기화
+        PDFRequestQuota.reset(user_id)
+        db.session.commit()
+
+        return jsonify({'status': 'success', 'message': f'{user.username}님의 오늘 PDF 요청 횟수가 초기화되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Reset user requests error: {str(e)}")
+        return jsonify({'status': 'error', 'message': f'요청 초기화 중 오류가 발생했습니다: {str(e)}'}), 500
+
+@bp.route('/admin/reset-all-requests', methods=['POST'])
+@login_required
+@csrf.exempt
+def reset_all_requests():
+    try:
+        if not current_user.is_admin:
+            return jsonify({'status': 'error', 'message': '관리자 권한이 필요합니다.'}), 403
+
+        # 요청 기록은 남기고 오늘 할당량 원장만 초기화
+        reset_count = PDFRequestQuota.reset()
+        db.session.commit()
+
+        return jsonify({'status': 'success', 'message': f'오늘의 모든 PDF 요청 횟수가 초기화되었습니다. ({reset_count}명)'})
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Reset all requests error: {str(e)}")
+        return jsonify({'status': 'error', 'message': f'전체 요청 초기화 중 오류가 발생했습니다: {str(e)}'}), 500
+
+@bp.route('/admin/support')
+@login_required
+def admin_support():
+    if not current_user.is_admin:
+        flash('관리자 권한이 필요합니다.', 'danger')
+        return redirect(url_for('main.dashboard'))
+    
+    # 모든 티켓 조회 (파일 기반)
+    tickets = load_all_tickets()
+    
+    return render_template('admin_support.html', tickets=tickets)
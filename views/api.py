@@ -0,0 +1,194 @@
+"""집중 타이머, 학습 통계, 랭킹, 오프라인 동기화/일괄 전송 API"""
+from datetime import date, datetime
+from flask import Blueprint, request, jsonify
+from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload
+import http_cache
+import leaderboard
+import analytics
+import sync
+import ingest
+from models import FocusSession, FocusDaily, FocusStats
+from extensions import db, csrf
+from nonfiction import load_nonfiction_tests, nonfiction_test_summary, load_nonfiction_test
+
+bp = Blueprint('api', __name__)
+
+@bp.route('/api/save-focus-session', methods=['POST'])
+@login_required
+@csrf.exempt
+def save_focus_session():
+    try:
+        from models import FocusSession
+        from datetime import date
+
+        data = request.get_json()
+        session_date = date.fromisoformat(data.get('session_date', str(date.today())))
+        focus_minutes = int(data.get('focus_minutes', 25))
+        completed = data.get('completed', True)
+        try:
+            ingest.check_focus(session_date, focus_minutes, datetime.utcnow())
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+
+        # 같은 날짜에 기존 세션이 있으면 추가, 없으면 새로 생성
+        focus_session = FocusSession(
+            user_id=current_user.id,
+            session_date=session_date,
+            focus_minutes=focus_minutes,
+            completed=completed
+        )
+
+        db.session.add(focus_session)
+        if completed:
+            # 일일 집계와 연속 일수는 기록 시점에 갱신
+            FocusStats.record_session(current_user.id, session_date, focus_minutes)
+            leaderboard.record_focus(current_user.id, session_date, focus_minutes)
+        db.session.commit()
+
+        return jsonify({'success': True})
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+def ingest_batch(kind):
+    """{'events': [{'key', 'client_time', ...}]} 일괄 저장 (키별 결과 반환)"""
+    data = request.get_json(silent=True)
+    events = data.get('events') if isinstance(data, dict) else None
+    if not isinstance(events, list):
+        return jsonify({'success': False, 'message': 'events 목록이 필요합니다.'}), 400
+    if len(events) > ingest.MAX_EVENTS:
+        return jsonify({'success': False, 'message': f'한 번에 최대 {ingest.MAX_EVENTS}개까지 보낼 수 있습니다.'}), 413
+    try:
+        result = ingest.ingest(current_user.id, kind, events)
+        return jsonify({'success': True, **result})
+    except Exception as e:
+        db.session.rollback()
+        print(f"Ingest {kind} error: {str(e)}")
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@bp.route('/api/quiz-answers/batch', methods=['POST'])
+@login_required
+@csrf.exempt
+def submit_quiz_answers_batch():
+    """오프라인 큐에 쌓인 퀴즈 답안 일괄 채점 (재전송, 이미 답한 문제는 중복 처리)"""
+    return ingest_batch(ingest.QUIZ_ANSWER)
+
+@bp.route('/api/focus-sessions/batch', methods=['POST'])
+@login_required
+@csrf.exempt
+def save_focus_sessions_batch():
+    """오프라인 큐에 쌓인 집중 세션 일괄 저장 (재전송 중복 제거)"""
+    return ingest_batch(ingest.FOCUS_SESSION)
+
+def focus_stats_version():
+    """집중 통계가 바뀌었는지 (기록하면 FocusStats.updated_at이 바뀌고, 날짜가 바뀌면 최근 7일이 바뀜)"""
+    updated = db.session.query(FocusStats.updated_at).filter(FocusStats.user_id == current_user.id).scalar()
+    return current_user.id, updated, date.today()
+
+@bp.route('/api/focus-stats')
+@login_required
+@http_cache.conditional_get(version=focus_stats_version)
+def get_focus_stats():
+    try:
+        from datetime import date, timedelta
+
+        # 최근 7일 통계
+        end_date = date.today()
+        start_date = end_date - timedelta(days=6)
+
+        # 누계 + 최근 7일 일일 집계를 한 번에 조회 (기본키/범위 조회)
+        rows = db.session.query(FocusStats, FocusDaily).outerjoin(
+            FocusDaily,
+            db.and_(FocusDaily.user_id == FocusStats.user_id,
+                    FocusDaily.day >= start_date,
+                    FocusDaily.day <= end_date)
+        ).filter(FocusStats.user_id == current_user.id).all()
+
+        stats = rows[0][0] if rows else FocusStats(user_id=current_user.id)
+        daily_minutes = {daily.day: daily.minutes for _, daily in rows if daily}
+
+        daily_stats = []
+        for i in range(7):
+            check_date = start_date + timedelta(days=i)
+            daily_stats.append({
+                'date': check_date.isoformat(),
+                'focus_minutes': daily_minutes.get(check_date, 0)
+            })
+
+        # 최근 세션 기록 (최대 10개, 인덱스 순서대로 읽음)
+        recent_sessions = FocusSession.query.options(raiseload('*')).filter_by(
+            user_id=current_user.id, completed=True
+        ).order_by(FocusSession.session_date.desc(), FocusSession.id.desc()).limit(10).all()
+
+        return jsonify({
+            'total_sessions': stats.total_sessions,
+            'total_focus_minutes': stats.total_minutes,
+            'active_days': stats.active_days,
+            'current_streak': stats.streak_as_of(end_date),
+            'longest_streak': stats.longest_streak,
+            'daily_stats': daily_stats,
+            'recent_sessions': [session.to_dict() for session in recent_sessions]
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/analytics/me')
+@login_required
+def my_analytics():
+    """정답률 추이, 이동 평균, 퀴즈 유형별 향상도, 집중 시간 상관관계"""
+    if not analytics.available():
+        return jsonify({'error': '학습 분석을 사용할 수 없습니다.'}), 503
+    try:
+        return jsonify(analytics.user_analytics(current_user.id))
+    except Exception as e:
+        print(f"Analytics error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/leaderboard')
+@login_required
+def get_leaderboard():
+    """주간 순위표 (board: quiz:korean, quiz:english, focus / week: 그 주의 아무 날짜)"""
+    board = request.args.get('board', leaderboard.FOCUS_BOARD)
+    if not leaderboard.valid_board(board):
+        return jsonify({'error': '알 수 없는 순위표입니다.'}), 400
+    try:
+        week = leaderboard.week_of(date.fromisoformat(request.args['week']) if request.args.get('week') else None)
+    except ValueError:
+        return jsonify({'error': '날짜 형식이 올바르지 않습니다.'}), 400
+
+    rank, score = leaderboard.rank_of(board, week, current_user.id)
+    return jsonify({
+        'board': board,
+        'week': week.isoformat(),
+        'top': leaderboard.top(board, week),
+        'me': {'rank': rank, 'score': score}
+    })
+
+@bp.route('/api/sync')
+@login_required
+@http_cache.conditional_get(version=lambda: (current_user.id, request.args.get('since'), sync.current()))
+def sync_changes():
+    """오프라인 사본 갱신용 변경분 (고전어휘, 내 단어장, 비문학 모의고사 목록)"""
+    try:
+        since = int(request.args.get('since', 0))
+    except ValueError:
+        return jsonify({'error': '커서 형식이 올바르지 않습니다.'}), 400
+
+    result = sync.changes(current_user.id, since)
+    tests = result[sync.TESTS]
+    if result['full']:
+        tests['updated'] = load_nonfiction_tests()
+    else:
+        summaries = []
+        for test_id in tests['updated']:
+            test_data = load_nonfiction_test(test_id)
+            if test_data:
+                summaries.append(nonfiction_test_summary(test_data))
+            else:
+                tests['deleted'].append(test_id)
+        tests['updated'] = summaries
+    result['user_id'] = current_user.id
+    return jsonify(result)
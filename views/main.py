@@ -0,0 +1,155 @@
+"""메인, 대시보드, 프로필, PWA(서비스 워커, 빌드된 정적 파일), 공지사항"""
+from flask import Blueprint, render_template, request, jsonify, make_response
+from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload
+import announcement_cache
+import data_version
+import page_cache
+import assets
+from models import User, PDFRequest, VocabularyWord, QuizScore
+from extensions import db, csrf
+from user_cache import user_cache
+
+bp = Blueprint('main', __name__)
+
+@bp.route('/')
+def index():
+    return render_template('index.html')
+
+@bp.route('/dashboard')
+@login_required
+def dashboard():
+    # Get recent activities
+    recent_requests = PDFRequest.query.options(raiseload('*')).filter_by(user_id=current_user.id).order_by(PDFRequest.requested_at.desc()).limit(5).all()
+    vocabulary_count = VocabularyWord.query.filter_by(user_id=current_user.id).count()
+    recent_scores = QuizScore.query.options(raiseload('*')).filter_by(user_id=current_user.id).order_by(QuizScore.quiz_date.desc()).limit(3).all()
+
+    # Get visible announcements for logged-in users (공개 범위/만료는 SQL에서 처리, 결과는 캐시)
+    visible_announcements = announcement_cache.visible_announcements(current_user)
+
+    return render_template('dashboard.html', 
+                         recent_requests=recent_requests,
+                         vocabulary_count=vocabulary_count,
+                         recent_scores=recent_scores,
+                         current_user=current_user,
+                         announcements=visible_announcements)
+
+# PWA Routes
+# 빌드된 정적 파일 (해시가 붙은 이름, 미리 압축한 .br/.gz, immutable 캐시)
+@bp.route('/assets/<path:filename>')
+def assets_file(filename):
+    return assets.send_asset(filename)
+
+# 서비스 워커 (범위가 사이트 전체가 되도록 루트 경로에서 제공, 매번 재검증)
+@bp.route('/sw.js')
+def service_worker():
+    response = make_response(assets.service_worker_source())
+    response.headers['Content-Type'] = 'application/javascript; charset=utf-8'
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@bp.route('/offline')
+def offline():
+    return render_template('offline.html')
+
+@bp.route('/mobile-app')
+@login_required
+def mobile_app_guide():
+    return render_template('mobile_app_guide.html')
+
+@bp.route('/focus-timer')
+@login_required
+def focus_timer():
+    return render_template('focus_timer.html')
+
+@bp.route('/profile')
+@login_required
+def profile():
+    # username이 없을 경우 대비
+    username = getattr(current_user, 'username', None)
+    if not username:
+        return "사용자 정보가 올바르지 않습니다.", 400
+    return render_template('profile.html', user=current_user)
+
+@bp.route('/api/update-profile', methods=['POST'])
+@login_required
+@csrf.exempt
+def update_profile():
+    try:
+        data = request.get_json()
+        username = data.get('username', '').strip()
+        email = data.get('email', '').strip()
+
+        if not username or not email:
+            return jsonify({'success': False, 'message': '사용자명과 이메일을 모두 입력해주세요.'}), 400
+
+        # 중복 확인 (현재 사용자 제외)
+        existing_user = User.query.filter(
+            User.username == username,
+            User.id != current_user.id
+        ).first()
+
+        if existing_user:
+            return jsonify({'success': False, 'message': '이미 사용 중인 사용자명입니다.'}), 400
+
+        existing_email = User.query.filter(
+            User.email == email,
+            User.id != current_user.id
+        ).first()
+
+        if existing_email:
+            return jsonify({'success': False, 'message': '이미 사용 중인 이메일입니다.'}), 400
+
+        # 프로필 업데이트
+        user = current_user.load()
+        user.username = username
+        user.email = email
+        db.session.commit()
+        user_cache.invalidate(user.id)
+
+        return jsonify({'success': True, 'message': '프로필이 성공적으로 업데이트되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': f'업데이트 중 오류가 발생했습니다: {str(e)}'}), 500
+
+@bp.route('/api/change-password', methods=['POST'])
+@login_required
+@csrf.exempt
+def change_password():
+    try:
+        data = request.get_json()
+        current_password = data.get('current_password', '')
+        new_password = data.get('new_password', '')
+
+        if not current_password or not new_password:
+            return jsonify({'success': False, 'message': '현재 비밀번호와 새 비밀번호를 모두 입력해주세요.'}), 400
+
+        # 현재 비밀번호 확인
+        user = current_user.load()
+        if not user.check_password(current_password):
+            return jsonify({'success': False, 'message': '현재 비밀번호가 올바르지 않습니다.'}), 400
+
+        if len(new_password) < 8:
+            return jsonify({'success': False, 'message': '새 비밀번호는 8자 이상이어야 합니다.'}), 400
+
+        # 비밀번호 변경
+        user.set_password(new_password)
+        db.session.commit()
+        user_cache.invalidate(user.id)
+
+        return jsonify({'success': True, 'message': '비밀번호가 성공적으로 변경되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': f'비밀번호 변경 중 오류가 발생했습니다: {str(e)}'}), 500
+
+# 공지사항 전체공개 목록 (비회원도 접근 가능)
+@bp.route('/announcements')
+def announcements():
+    # 방문자(회원/비회원)에게 공개된, 만료되지 않은 공지사항만 조회
+    public_announcements = announcement_cache.visible_announcements(current_user)
+    # 공지 수정(데이터 버전)이나 만료로 목록이 바뀔 때만 다시 렌더링
+    stamp = (data_version.get(announcement_cache.VERSION_NAME), [a.id for a in public_announcements])
+    return page_cache.fragment('page', stamp, lambda: render_template(
+        'announcements.html', announcements=public_announcements))
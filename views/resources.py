@@ -0,0 +1,184 @@
+"""PDF 자료실 (요청, 업로드, 다운로드, 검색)"""
+import os
+import secrets
+from datetime import datetime, timedelta
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, send_from_directory, current_app
+from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload
+import pdf_search
+import page_cache
+from forms import PDFRequestForm, PDFUploadForm
+from models import PDFRequest, PDFRequestQuota, PDFResource
+from extensions import db
+
+bp = Blueprint('resources', __name__)
+
+@bp.route('/pdf-resources', methods=['GET', 'POST'])
+@login_required
+def pdf_resources():
+    form = PDFRequestForm()
+
+    # Get user's requests
+    user_requests = PDFRequest.query.options(raiseload('*')).filter_by(user_id=current_user.id).order_by(PDFRequest.requested_at.desc()).all()
+
+    # Get all available resources (통합)
+    all_resources = PDFResource.query.options(raiseload('*')).order_by(PDFResource.upload_date.desc()).all()
+
+    # Check if user can request today (할당량 원장 1회 조회)
+    today_request_count = PDFRequest.get_user_today_request_count(current_user.id)
+    can_request_today = today_request_count < PDFRequest.daily_limit()
+
+    if request.method == 'POST' and form.validate_on_submit():
+        # 일일 요청 제한 확인
+        if not can_request_today:
+            flash('하루에 한 번만 PDF 자료를 요청할 수 있습니다. 내일 다시 시도해주세요.', 'warning')
+            return redirect(url_for('resources.pdf_resources'))
+
+        # 입력값 검증 및 정제
+        subject = form.subject.data.strip()[:100]  # 길이 제한
+        topic = form.topic.data.strip()[:200]
+        description = form.description.data.strip()[:1000] if form.description.data else None
+
+        # 빈 값 검증
+        if not subject or not topic:
+            flash('과목과 주제는 필수 입력 항목입니다.', 'danger')
+            return redirect(url_for('resources.pdf_resources'))
+
+        # 스팸 방지: 같은 내용 중복 요청 확인
+        recent_duplicate = PDFRequest.query.filter(
+            PDFRequest.user_id == current_user.id,
+            PDFRequest.subject == subject,
+            PDFRequest.topic == topic,
+            PDFRequest.requested_at >= datetime.now() - timedelta(days=7)
+        ).first()
+
+        if recent_duplicate:
+            flash('최근 7일 내에 동일한 요청이 있었습니다.', 'warning')
+            return redirect(url_for('resources.pdf_resources'))
+
+        try:
+            # 동시 요청에 대비해 원장에서 다시 한 번 차감 가능 여부 확인
+            if not PDFRequestQuota.consume(current_user.id):
+                db.session.rollback()
+                flash('하루에 한 번만 PDF 자료를 요청할 수 있습니다. 내일 다시 시도해주세요.', 'warning')
+                return redirect(url_for('resources.pdf_resources'))
+
+            pdf_request = PDFRequest()
+            pdf_request.user_id = current_user.id
+            pdf_request.subject = subject
+            pdf_request.topic = topic
+            pdf_request.description = description
+            db.session.add(pdf_request)
+            db.session.commit()
+            flash('자료 요청이 제출되었습니다.', 'success')
+        except Exception as e:
+            db.session.rollback()
+            flash('요청 처리 중 오류가 발생했습니다. 다시 시도해주세요.', 'danger')
+        
+        return redirect(url_for('resources.pdf_resources'))
+
+    return render_template('pdf_resources.html', 
+                         form=form,
+                         user_requests=user_requests,
+                         all_resources=all_resources,
+                         can_request_today=can_request_today,
+                         today_request_count=today_request_count)
+
+@bp.route('/upload-pdf', methods=['POST'])
+@login_required
+def upload_pdf():
+    if not current_user.is_admin:
+        flash('관리자 권한이 필요합니다.', 'danger')
+        return redirect(url_for('main.dashboard'))
+
+    form = PDFUploadForm()
+    if form.validate_on_submit():
+        file = form.file.data
+        if file:
+            # Keep original filename for display purposes
+            original_filename = file.filename
+
+            # Create a safe filename for storage while preserving extension
+            file_extension = os.path.splitext(original_filename)[1]
+            unique_filename = f"{secrets.token_hex(8)}{file_extension}"
+
+            # Save file
+            file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], unique_filename)
+            file.save(file_path)
+
+            # Create database record
+            pdf_resource = PDFResource()
+            pdf_resource.title = form.title.data
+            pdf_resource.subject = form.subject.data
+            pdf_resource.category = form.category.data
+            pdf_resource.filename = unique_filename
+            pdf_resource.original_filename = original_filename  # 한국어 파일명 그대로 저장
+            pdf_resource.file_size = os.path.getsize(file_path)
+            pdf_resource.uploaded_by = current_user.id
+            db.session.add(pdf_resource)
+            db.session.commit()
+
+            # 본문 검색 색인은 백그라운드에서 처리
+            pdf_search.enqueue_index(pdf_resource.id)
+            page_cache.invalidate(page_cache.PDF_RESOURCES)
+
+            flash('PDF 파일이 업로드되었습니다.', 'success')
+    else:
+        flash('파일 업로드 중 오류가 발생했습니다.', 'danger')
+
+    return redirect(url_for('admin.index'))
+
+@bp.route('/download/<int:resource_id>')
+@login_required
+def download_pdf(resource_id):
+    resource = PDFResource.query.get_or_404(resource_id)
+
+    # Increment download count
+    resource.download_count += 1
+    db.session.commit()
+
+    return send_from_directory(current_app.config['UPLOAD_FOLDER'], resource.filename, 
+                             as_attachment=True, download_name=resource.original_filename)
+
+@bp.route('/api/search/pdfs')
+@login_required
+def search_pdfs():
+    """PDF 본문 전문 검색"""
+    import time
+    query = request.args.get('q', '').strip()[:100]
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 50)
+    if not query:
+        return jsonify({'query': query, 'results': [], 'took_ms': 0})
+
+    started = time.perf_counter()
+    try:
+        hits = pdf_search.search(query, limit=limit)
+    except Exception as e:
+        print(f"PDF search error: {str(e)}")
+        return jsonify({'error': '검색 중 오류가 발생했습니다.'}), 500
+
+    resources = {}
+    if hits:
+        ids = [hit['resource_id'] for hit in hits]
+        resources = {r.id: r for r in PDFResource.query.filter(PDFResource.id.in_(ids)).all()}
+
+    results = []
+    for hit in hits:
+        resource = resources.get(hit['resource_id'])
+        if not resource:
+            continue
+        results.append({
+            'id': resource.id,
+            'title': resource.title,
+            'subject': resource.subject,
+            'category': resource.category,
+            'snippet': hit['snippet'],
+            'score': hit['score'],
+            'download_url': url_for('resources.download_pdf', resource_id=resource.id)
+        })
+
+    return jsonify({
+        'query': query,
+        'results': results,
+        'took_ms': round((time.perf_counter() - started) * 1000, 2)
+    })
@@ -0,0 +1,174 @@
+"""수능 국어/영어, 내신, 고전어휘, 비문학 모의고사"""
+import os
+from datetime import date
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, send_from_directory
+from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload
+import page_cache
+from forms import VocabularyForm
+from models import PDFResource, KoreanVocabulary, VocabularyWord, QuizScore
+from extensions import db, csrf
+from nonfiction import load_nonfiction_tests, load_nonfiction_test, save_nonfiction_result, load_nonfiction_result, load_user_nonfiction_results
+
+bp = Blueprint('study', __name__)
+
+@bp.route('/suneung/korean')
+@login_required
+def suneung_korean():
+    # 고전어휘 수는 페이지 캐시가 비었을 때만 셈 (모든 카테고리 포함)
+    vocab_count = page_cache.loader(lambda: db.session.query(db.func.count(KoreanVocabulary.id)).scalar())
+
+    # Get recent quiz scores
+    recent_scores = QuizScore.query.options(raiseload('*')).filter_by(user_id=current_user.id).order_by(QuizScore.quiz_date.desc()).limit(3).all()
+    
+    return render_template('suneung_korean.html', vocab_count=vocab_count, recent_scores=recent_scores)
+
+@bp.route('/korean/vocabulary')
+@login_required
+def korean_vocabulary():
+    # Get Korean vocabulary for classical literature (페이지 캐시가 비었을 때만 조회)
+    load_vocab = page_cache.loader(
+        lambda: KoreanVocabulary.query.options(raiseload('*')).filter_by(category='호칭').all())
+    load_vocab_dict = page_cache.loader(lambda: [word.to_dict() for word in load_vocab()])
+    return render_template('korean_vocabulary.html', load_vocab=load_vocab, load_vocab_dict=load_vocab_dict)
+
+@bp.route('/korean/nonfiction')
+@login_required
+def korean_nonfiction():
+    # Load nonfiction tests from files (페이지 캐시가 비었을 때만 읽음)
+    load_tests = page_cache.loader(load_nonfiction_tests)
+    
+    # Get recent scores (placeholder for now)
+    recent_scores = []
+    
+    return render_template('korean_nonfiction.html', load_tests=load_tests, recent_scores=recent_scores)
+
+@bp.route('/korean/nonfiction/test/<test_id>')
+@login_required
+def korean_nonfiction_test(test_id):
+    # Load test data from file
+    test_data = load_nonfiction_test(test_id)
+    
+    if not test_data:
+        flash('문제를 찾을 수 없습니다.', 'danger')
+        return redirect(url_for('study.korean_nonfiction'))
+    
+    return render_template('korean_nonfiction_test.html', test_data=test_data)
+
+@bp.route('/korean/nonfiction/submit/<test_id>', methods=['POST'])
+@login_required
+@csrf.exempt
+def submit_nonfiction_test(test_id):
+    try:
+        data = request.get_json()
+        answers = data.get('answers', {})
+        duration = data.get('duration', 0)
+        
+        # Load test data to check answers
+        test_data = load_nonfiction_test(test_id)
+        if not test_data:
+            return jsonify({'success': False, 'message': '문제를 찾을 수 없습니다.'})
+        
+        # Calculate score
+        correct_count = 0
+        total_questions = len(test_data['questions'])
+        
+        for i, question in enumerate(test_data['questions'], 1):
+            user_answer = answers.get(str(i))
+            if user_answer == question['correct_answer']:
+                correct_count += 1
+        
+        score = int((correct_count / total_questions) * 100) if total_questions > 0 else 0
+        
+        # Save result to file
+        result_id = save_nonfiction_result(current_user.id, test_id, answers, score, duration, test_data['title'])
+        
+        return jsonify({
+            'success': True,
+            'result_id': result_id,
+            'score': score,
+            'correct_count': correct_count,
+            'total_questions': total_questions
+        })
+        
+    except Exception as e:
+        print(f"Submit nonfiction test error: {str(e)}")
+        return jsonify({'success': False, 'message': '제출 중 오류가 발생했습니다.'})
+
+@bp.route('/korean/nonfiction/result/<test_id>/<result_id>')
+@login_required
+def korean_nonfiction_result(test_id, result_id):
+    # Load result data
+    result_data = load_nonfiction_result(result_id)
+    test_data = load_nonfiction_test(test_id)
+    
+    if not result_data or not test_data:
+        flash('결과를 찾을 수 없습니다.', 'danger')
+        return redirect(url_for('study.korean_nonfiction'))
+    
+    # Calculate correct count
+    correct_count = 0
+    for i, question in enumerate(test_data['questions'], 1):
+        user_answer = result_data['answers'].get(str(i))
+        if user_answer == question['correct_answer']:
+            correct_count += 1
+    
+    return render_template('korean_nonfiction_result.html', 
+                         result_data=result_data, 
+                         test_data=test_data, 
+                         correct_count=correct_count)
+
+@bp.route('/korean/nonfiction/results')
+@login_required
+def korean_nonfiction_results():
+    # Load user's all results
+    user_results = load_user_nonfiction_results(current_user.id)
+    return render_template('korean_nonfiction_results.html', user_results=user_results)
+
+@bp.route('/suneung/english')
+@login_required
+def suneung_english():
+    # Get user's vocabulary words
+    user_vocab = VocabularyWord.query.options(raiseload('*')).filter_by(user_id=current_user.id, language='en').order_by(VocabularyWord.added_at.desc()).all()
+    form = VocabularyForm()
+
+    return render_template('suneung_english.html', user_vocab=user_vocab, form=form)
+
+@bp.route('/naeshin')
+@login_required
+def naeshin():
+    # Check if it's after mid-August (using current date)
+    current_date = date.today()
+    unlock_date = date(2024, 8, 15)  # Mid-August
+    is_unlocked = current_date >= unlock_date
+
+    if not is_unlocked:
+        return render_template('naeshin.html', is_unlocked=False, unlock_date=unlock_date)
+
+    # If unlocked, show 상모고 내신 resources (페이지 캐시가 비었을 때만 조회)
+    load_resources = page_cache.loader(
+        lambda: PDFResource.query.options(raiseload('*')).filter_by(category='naeshin').order_by(PDFResource.upload_date.desc()).all())
+    return render_template('naeshin.html', is_unlocked=True, load_resources=load_resources)
+
+@bp.route('/nonfiction-image/<path:image_path>')
+@login_required
+def serve_nonfiction_image(image_path):
+    """비문학 모의고사 이미지 제공"""
+    try:
+        # 보안을 위해 경로 검증
+        if '..' in image_path or image_path.startswith('/'):
+            return "Invalid path", 404
+        
+        # 이미지 파일 경로
+        full_path = os.path.join(os.getcwd(), image_path)
+        directory = os.path.dirname(full_path)
+        filename = os.path.basename(full_path)
+        
+        if not os.path.exists(full_path):
+            return "Image not found", 404
+        
+        return send_from_directory(directory, filename)
+        
+    except Exception as e:
+        print(f"Serve nonfiction image error: {str(e)}")
+        return "Error serving image", 500
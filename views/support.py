@@ -0,0 +1,74 @@
+"""고객센터 (문의 작성, 조회, 답변)"""
+from datetime import datetime
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from flask_login import login_required, current_user
+from forms import CustomerSupportForm, SupportReplyForm
+from extensions import csrf
+from support_tickets import save_ticket_to_file, load_user_tickets, load_ticket_by_id, add_reply_to_ticket_file
+
+bp = Blueprint('support', __name__)
+
+@bp.route('/customer-support', methods=['GET', 'POST'])
+@login_required
+def customer_support():
+    form = CustomerSupportForm()
+    
+    # 사용자의 문의 내역 (파일 기반)
+    user_tickets = load_user_tickets(current_user.id)
+    
+    if form.validate_on_submit():
+        # 파일로 문의 저장
+        ticket_data = {
+            'user_id': current_user.id,
+            'username': current_user.username,
+            'subject': form.subject.data,
+            'message': form.message.data,
+            'priority': form.priority.data,
+            'created_at': datetime.now().isoformat()
+        }
+        save_ticket_to_file(ticket_data)
+        flash('문의가 접수되었습니다. 빠른 시일 내에 답변드리겠습니다.', 'success')
+        return redirect(url_for('support.customer_support'))
+    
+    return render_template('customer_support.html', form=form, tickets=user_tickets)
+
+@bp.route('/customer-support/<ticket_id>')
+@login_required
+def view_ticket(ticket_id):
+    ticket = load_ticket_by_id(ticket_id)
+    
+    if not ticket:
+        flash('문의를 찾을 수 없습니다.', 'danger')
+        return redirect(url_for('support.customer_support'))
+    
+    # 본인 티켓이거나 관리자인 경우만 조회 가능
+    if str(ticket['user_id']) != str(current_user.id) and not current_user.is_admin:
+        flash('접근 권한이 없습니다.', 'danger')
+        return redirect(url_for('support.customer_support'))
+    
+    reply_form = SupportReplyForm()
+    return render_template('view_ticket.html', ticket=ticket, reply_form=reply_form)
+
+@bp.route('/customer-support/<ticket_id>/reply', methods=['POST'])
+@login_required
+@csrf.exempt
+def reply_ticket(ticket_id):
+    ticket = load_ticket_by_id(ticket_id)
+    
+    if not ticket:
+        return jsonify({'success': False, 'message': '문의를 찾을 수 없습니다.'}), 404
+    
+    # 본인 티켓이거나 관리자인 경우만 답변 가능
+    if str(ticket['user_id']) != str(current_user.id) and not current_user.is_admin:
+        return jsonify({'success': False, 'message': '접근 권한이 없습니다.'}), 403
+    
+    data = request.get_json()
+    message = data.get('message', '').strip()
+    
+    if not message:
+        return jsonify({'success': False, 'message': '메시지를 입력해주세요.'}), 400
+    
+    # 파일에 답변 추가
+    add_reply_to_ticket_file(ticket_id, current_user.username, message, current_user.is_admin)
+    
+    return jsonify({'success': True, 'message': '답변이 등록되었습니다.'})
@@ -0,0 +1,283 @@
+"""단어장, 영어사전, 단어 퀴즈와 복습"""
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload
+import http_cache
+import quiz
+from forms import VocabularyForm
+from models import VocabularyWord, QuizScore, QuizAttempt
+from extensions import db, csrf
+from dictionary import DICTIONARY_REVISION, search_daum_dictionary
+
+bp = Blueprint('vocabulary', __name__)
+
+@bp.route('/vocabulary/quiz/<quiz_type>')
+@login_required
+def vocabulary_quiz(quiz_type):
+    model, criteria = quiz.word_source(quiz_type, current_user.id)
+    if model is None:
+        flash('잘못된 퀴즈 유형입니다.', 'danger')
+        return redirect(url_for('main.dashboard'))
+
+    # Check minimum word count for quiz
+    if quiz.count_words(model, criteria) < quiz.MIN_WORDS:
+        if quiz_type == 'korean':
+            flash('퀴즈를 시작하려면 최소 3개의 국어 고전어휘가 필요합니다. 관리자에게 문의하여 더 많은 어휘를 등록해주세요.', 'warning')
+            return redirect(url_for('study.suneung_korean'))
+        else:
+            flash('퀴즈를 시작하려면 최소 3개의 영어 단어가 필요합니다. 단어장에 더 많은 단어를 추가해주세요.', 'warning')
+            return redirect(url_for('vocabulary.english_dictionary'))
+
+    # 문제는 페이지에서 /api/quiz/<quiz_type>로 받아옴
+    return render_template('vocabulary_quiz.html', quiz_type=quiz_type, question_count=quiz.DEFAULT_QUESTIONS)
+
+@bp.route('/api/quiz/<quiz_type>')
+@login_required
+def api_quiz(quiz_type):
+    """문제 출제 (정답표는 서버에 보관)"""
+    if quiz_type not in quiz.QUIZ_TYPES:
+        return jsonify({'error': '잘못된 퀴즈 유형입니다.'}), 404
+
+    n = min(max(request.args.get('n', quiz.DEFAULT_QUESTIONS, type=int), 1), quiz.MAX_QUESTIONS)
+    try:
+        attempt, questions = quiz.create_attempt(current_user.id, quiz_type, n)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Create quiz error: {str(e)}")
+        return jsonify({'error': '퀴즈를 만드는 중 오류가 발생했습니다.'}), 500
+
+    if attempt is None:
+        return jsonify({'error': f'퀴즈를 시작하려면 최소 {quiz.MIN_WORDS}개의 단어가 필요합니다.'}), 400
+
+    return jsonify({'quiz_id': attempt.id, 'quiz_type': quiz_type, 'questions': questions})
+
+@bp.route('/api/quiz/<int:quiz_id>/answer', methods=['POST'])
+@login_required
+@csrf.exempt
+def api_quiz_answer(quiz_id):
+    """한 문제 채점 ({index, choice}, choice가 null이면 건너뜀)"""
+    attempt = QuizAttempt.query.filter_by(id=quiz_id, user_id=current_user.id).first()
+    if not attempt:
+        return jsonify({'error': '퀴즈를 찾을 수 없습니다.'}), 404
+
+    data = request.get_json(silent=True) or {}
+    try:
+        result = quiz.grade(attempt, data.get('index'), data.get('choice'))
+        db.session.commit()
+    except (ValueError, TypeError) as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify(result)
+
+@bp.route('/api/review/due')
+@login_required
+def review_due():
+    """복습할 때가 된 단어 (다음 복습 시각 순)"""
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    language = request.args.get('language') or None
+
+    words = (VocabularyWord.due_query(current_user.id, language=language)
+             .options(raiseload('*')).limit(limit + 1).all())
+    return jsonify({
+        'words': [w.to_dict() for w in words[:limit]],
+        'has_more': len(words) > limit
+    })
+
+@bp.route('/english-dictionary')
+@login_required
+def english_dictionary():
+    form = VocabularyForm()
+    user_vocab = VocabularyWord.query.options(raiseload('*')).filter_by(user_id=current_user.id, language='en').order_by(VocabularyWord.added_at.desc()).all()
+
+    return render_template('english_dictionary.html', form=form, user_vocab=user_vocab)
+
+@bp.route('/add-vocabulary', methods=['POST'])
+@login_required
+def add_vocabulary():
+    form = VocabularyForm()
+    if form.validate_on_submit():
+        # Check if word already exists for user
+        word_data = form.word.data.lower() if form.word.data else ''
+        meaning_data = form.meaning.data if form.meaning.data else ''
+
+        existing = VocabularyWord.query.filter_by(
+            user_id=current_user.id,
+            word=word_data,
+            language='en'
+        ).first()
+
+        if not existing and word_data and meaning_data:
+            vocab_word = VocabularyWord()
+            vocab_word.user_id = current_user.id
+            vocab_word.word = word_data
+            vocab_word.meaning = meaning_data
+            vocab_word.language = 'en'
+            db.session.add(vocab_word)
+            db.session.commit()
+            flash('단어가 단어장에 추가되었습니다.', 'success')
+        else:
+            flash('이미 단어장에 있는 단어입니다.', 'warning')
+
+    return redirect(url_for('vocabulary.english_dictionary'))
+
+@bp.route('/submit-quiz-score', methods=['POST'])
+@login_required
+def submit_quiz_score():
+    data = request.get_json()
+
+    quiz_score = QuizScore()
+    quiz_score.user_id = current_user.id
+    quiz_score.quiz_type = data['quiz_type']
+    quiz_score.score = data['score']
+    quiz_score.total_questions = data['total_questions']
+    db.session.add(quiz_score)
+    # 클라이언트가 보낸 점수는 순위표에 넣지 않음 (순위표는 서버 채점 quiz.grade만 반영)
+    db.session.commit()
+
+    return jsonify({'status': 'success'})
+
+@bp.route('/api/dictionary/<word>')
+@login_required
+@http_cache.conditional_get(version=lambda word: DICTIONARY_REVISION, cache_control='private, max-age=86400')
+def get_word_definition(word):
+    try:
+        # 다음 사전에서 단어 검색
+        korean_meaning = search_daum_dictionary(word)
+
+        if korean_meaning:
+            # 품사별로 분리된 뜻을 파싱
+            meanings_list = []
+
+            if ' | ' in korean_meaning:
+                # 품사별로 구분된 경우
+                parts = korean_meaning.split(' | ')
+                for part in parts:
+                    if '[' in part and ']' in part:
+                        # 품사 정보가 있는 경우
+                        pos_end = part.find(']')
+                        pos = part[1:pos_end]
+                        definition = part[pos_end+1:].strip()
+                        meanings_list.append({
+                            'partOfSpeech': pos,
+                            'partOfSpeechKorean': pos,
+                            'definitions': [],
+                            'koreanDefinitions': [definition] if definition else []
+                        })
+                    else:
+                        # 품사 정보가 없는 경우
+                        meanings_list.append({
+                            'partOfSpeech': '',
+                            'partOfSpeechKorean': '',
+                            'definitions': [],
+                            'koreanDefinitions': [part.strip()]
+                        })
+            else:
+                # 단순한 뜻의 경우 쉼표로 분리
+                definitions = [def_.strip() for def_ in korean_meaning.split(',')]
+                meanings_list.append({
+                    'partOfSpeech': '',
+                    'partOfSpeechKorean': '',
+                    'definitions': [],
+                    'koreanDefinitions': definitions
+                })
+
+            # 메인 번역은 첫 번째 뜻 사용
+            main_translation = korean_meaning.split(' | ')[0] if ' | ' in korean_meaning else korean_meaning
+            if '[' in main_translation and ']' in main_translation:
+                pos_end = main_translation.find(']')
+                main_translation = main_translation[pos_end+1:].strip()
+
+            return jsonify({
+                'word': word,
+                'meanings': meanings_list,
+                'phonetics': [],
+                'mainTranslation': main_translation
+            })
+        else:
+            return jsonify({'error': '단어를 찾을 수 없습니다. 다시 시도해주세요.'}), 404
+
+    except Exception as e:
+        print(f"Dictionary API error: {str(e)}")
+        return jsonify({'error': '네트워크 오류가 발생했습니다. 잠시 후 다시 시도해주세요.'}), 500
+
+@bp.route('/delete-vocabulary/<int:word_id>', methods=['POST'])
+@login_required
+def delete_vocabulary(word_id):
+    try:
+        word = VocabularyWord.query.filter_by(id=word_id, user_id=current_user.id).first()
+        if not word:
+            return jsonify({'success': False, 'message': '단어를 찾을 수 없습니다.'}), 404
+
+        db.session.delete(word)
+        db.session.commit()
+        return jsonify({'success': True, 'message': '단어가 삭제되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': f'삭제 중 오류가 발생했습니다: {str(e)}'}), 500
+
+@bp.route('/toggle-auto-add', methods=['POST'])
+@login_required
+def toggle_auto_add():
+    """자동 단어 추가 설정 토글"""
+    try:
+        data = request.get_json()
+        auto_add_enabled = data.get('enabled', False)
+
+        # 사용자 설정에 저장 (간단히 세션에 저장)
+        from flask import session
+        session['auto_add_enabled'] = auto_add_enabled
+
+        return jsonify({'success': True, 'enabled': auto_add_enabled})
+
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@bp.route('/auto-add-word', methods=['POST'])
+@login_required
+def auto_add_word():
+    """단어 자동 추가"""
+    try:
+        from flask import session
+        if not session.get('auto_add_enabled', False):
+            return jsonify({'success': False, 'message': '자동 추가가 비활성화되어 있습니다.'})
+
+        data = request.get_json()
+        word = data.get('word', '').lower()
+
+        if not word:
+            return jsonify({'success': False, 'message': '단어가 없습니다.'})
+
+        # 이미 존재하는지 확인
+        existing = VocabularyWord.query.filter_by(
+            user_id=current_user.id,
+            word=word,
+            language='en'
+        ).first()
+
+        if existing:
+            return jsonify({'success': False, 'message': '이미 단어장에 있는 단어입니다.'})
+
+        # 네이버 사전에서 뜻 찾기
+        meaning = search_daum_dictionary(word)
+        if not meaning:
+            return jsonify({'success': False, 'message': '단어 뜻을 찾을 수 없습니다.'})
+
+        # 단어장에 추가
+        vocab_word = VocabularyWord()
+        vocab_word.user_id = current_user.id
+        vocab_word.word = word
+        vocab_word.meaning = meaning
+        vocab_word.korean_meaning = meaning
+        vocab_word.language = 'en'
+
+        db.session.add(vocab_word)
+        db.session.commit()
+
+        return jsonify({'success': True, 'message': f'"{word}" 단어가 자동으로 추가되었습니다.'})
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': f'자동 추가 중 오류: {str(e)}'}), 500